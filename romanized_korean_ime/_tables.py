@@ -0,0 +1,137 @@
+"""Tables derived from romanized elements and jamo.
+
+Generated by generate_tables module, do not edit.
+"""
+
+VOWELS = frozenset({
+    'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ',
+    'ㅢ', 'ㅣ'})
+
+COMBINED_TO_DOUBLE = {
+    'ㅘ': 'ㅗㅏ', 'ㅟ': 'ㅜㅣ', 'ㅞ': 'ㅜㅔ', 'ㅝ': 'ㅜㅓ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅢ': 'ㅡㅣ', 'ㄲ': 'ㄱㄱ',
+    'ㄸ': 'ㄷㄷ', 'ㅆ': 'ㅅㅅ', 'ㅉ': 'ㅈㅈ', 'ㅃ': 'ㅂㅂ', 'ᆪ': 'ㄱㅅ', 'ᆬ': 'ㄴㅈ', 'ᆭ': 'ㄴㅎ', 'ᆰ': 'ㄹㄱ',
+    'ᆱ': 'ㄹㅁ', 'ᆲ': 'ㄹㅂ', 'ᆳ': 'ㄹㅅ', 'ᆴ': 'ㄹㅌ', 'ᆵ': 'ㄹㅍ', 'ᆶ': 'ㄹㅎ', 'ᆹ': 'ㅂㅅ'}
+
+COMBINED_HEAD_JAMO = frozenset({
+    'ㄲ', 'ㄸ', 'ㅃ', 'ㅆ', 'ㅉ'})
+
+HEAD_JAMO = frozenset({
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'})
+
+COMBINED_BODY_JAMO = frozenset({
+    'ㅘ', 'ㅙ', 'ㅚ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅢ'})
+
+BODY_JAMO = frozenset({
+    'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ',
+    'ㅢ', 'ㅣ'})
+
+COMBINED_TAIL_JAMO = frozenset({
+    'ᆪ', 'ᆬ', 'ᆭ', 'ᆰ', 'ᆱ', 'ᆲ', 'ᆳ', 'ᆴ', 'ᆵ', 'ᆶ', 'ᆹ', 'ㄲ', 'ㅆ'})
+
+TAIL_JAMO = frozenset({
+    'ᆪ', 'ᆬ', 'ᆭ', 'ᆰ', 'ᆱ', 'ᆲ', 'ᆳ', 'ᆴ', 'ᆵ', 'ᆶ', 'ᆹ', 'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'})
+
+ALL_JAMO = frozenset({
+    'ᆪ', 'ᆬ', 'ᆭ', 'ᆰ', 'ᆱ', 'ᆲ', 'ᆳ', 'ᆴ', 'ᆵ', 'ᆶ', 'ᆹ', 'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ',
+    'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ', 'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ',
+    'ㅗ', 'ㅘ', 'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ'})
+
+IGNORED_CHARACTERS = frozenset({
+    '\t', '\n', '\r\n', ' ', '!', '(', ')', ',', '.', ':', ';', '<', '>', '?', '[', ']', '{', '}'})
+
+ALL_UNAMBIGUOUS_JAMO = frozenset({
+    '-', 'ᆪ', 'ᆬ', 'ᆭ', 'ᆰ', 'ᆱ', 'ᆲ', 'ᆳ', 'ᆴ', 'ᆵ', 'ᆶ', 'ᆹ', 'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ',
+    'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ', 'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ',
+    'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ'})
+
+INTERRUPTORS = frozenset({
+    '\t', '\n', '\r\n', ' ', '!', '(', ')', ',', '-', '.', ':', ';', '<', '>', '?', '[', ']', '{',
+    '}'})
+
+HEAD_INDEX = {
+    'ㄱ': 0, 'ㄲ': 1, 'ㄴ': 2, 'ㄷ': 3, 'ㄸ': 4, 'ㄹ': 5, 'ㅁ': 6, 'ㅂ': 7, 'ㅃ': 8, 'ㅅ': 9, 'ㅆ': 10,
+    'ㅇ': 11, 'ㅈ': 12, 'ㅉ': 13, 'ㅊ': 14, 'ㅋ': 15, 'ㅌ': 16, 'ㅍ': 17, 'ㅎ': 18, 'ᄀ': 0, 'ᄁ': 1, 'ᄂ': 2,
+    'ᄃ': 3, 'ᄄ': 4, 'ᄅ': 5, 'ᄆ': 6, 'ᄇ': 7, 'ᄈ': 8, 'ᄉ': 9, 'ᄊ': 10, 'ᄋ': 11, 'ᄌ': 12, 'ᄍ': 13,
+    'ᄎ': 14, 'ᄏ': 15, 'ᄐ': 16, 'ᄑ': 17, 'ᄒ': 18}
+
+BODY_INDEX = {
+    'ㅏ': 0, 'ㅐ': 1, 'ㅑ': 2, 'ㅒ': 3, 'ㅓ': 4, 'ㅔ': 5, 'ㅕ': 6, 'ㅖ': 7, 'ㅗ': 8, 'ㅘ': 9, 'ㅙ': 10,
+    'ㅚ': 11, 'ㅛ': 12, 'ㅜ': 13, 'ㅝ': 14, 'ㅞ': 15, 'ㅟ': 16, 'ㅠ': 17, 'ㅡ': 18, 'ㅢ': 19, 'ㅣ': 20,
+    'ᅡ': 0, 'ᅢ': 1, 'ᅣ': 2, 'ᅤ': 3, 'ᅥ': 4, 'ᅦ': 5, 'ᅧ': 6, 'ᅨ': 7, 'ᅩ': 8, 'ᅪ': 9, 'ᅫ': 10,
+    'ᅬ': 11, 'ᅭ': 12, 'ᅮ': 13, 'ᅯ': 14, 'ᅰ': 15, 'ᅱ': 16, 'ᅲ': 17, 'ᅳ': 18, 'ᅴ': 19, 'ᅵ': 20}
+
+TAIL_INDEX = {
+    '': 0, 'ㄱ': 1, 'ㄲ': 2, 'ㄳ': 3, 'ㄴ': 4, 'ㄵ': 5, 'ㄶ': 6, 'ㄷ': 7, 'ㄹ': 8, 'ㄺ': 9, 'ㄻ': 10, 'ㄼ': 11,
+    'ㄽ': 12, 'ㄾ': 13, 'ㄿ': 14, 'ㅀ': 15, 'ㅁ': 16, 'ㅂ': 17, 'ㅄ': 18, 'ㅅ': 19, 'ㅆ': 20, 'ㅇ': 21,
+    'ㅈ': 22, 'ㅊ': 23, 'ㅋ': 24, 'ㅌ': 25, 'ㅍ': 26, 'ㅎ': 27, 'ᆨ': 1, 'ᆩ': 2, 'ᆪ': 3, 'ᆫ': 4, 'ᆬ': 5,
+    'ᆭ': 6, 'ᆮ': 7, 'ᆯ': 8, 'ᆰ': 9, 'ᆱ': 10, 'ᆲ': 11, 'ᆳ': 12, 'ᆴ': 13, 'ᆵ': 14, 'ᆶ': 15, 'ᆷ': 16,
+    'ᆸ': 17, 'ᆹ': 18, 'ᆺ': 19, 'ᆻ': 20, 'ᆼ': 21, 'ᆽ': 22, 'ᆾ': 23, 'ᆿ': 24, 'ᇀ': 25, 'ᇁ': 26,
+    'ᇂ': 27}
+
+JAMO_NORMALIZATION = {
+    4458: 'ㅘ', 4467: 'ㅡ', 4356: 'ㄸ', 4365: 'ㅉ', 4352: 'ㄱ', 4353: 'ㄲ', 4354: 'ㄴ', 4355: 'ㄷ',
+    4357: 'ㄹ', 4358: 'ㅁ', 4359: 'ㅂ', 4360: 'ㅃ', 4361: 'ㅅ', 4362: 'ㅆ', 4363: 'ㅇ', 4364: 'ㅈ',
+    4366: 'ㅊ', 4367: 'ㅋ', 4368: 'ㅌ', 4369: 'ㅍ', 4370: 'ㅎ', 4449: 'ㅏ', 4450: 'ㅐ', 4451: 'ㅑ',
+    4452: 'ㅒ', 4453: 'ㅓ', 4454: 'ㅔ', 4455: 'ㅕ', 4456: 'ㅖ', 4457: 'ㅗ', 4459: 'ㅙ', 4460: 'ㅚ',
+    4461: 'ㅛ', 4462: 'ㅜ', 4463: 'ㅝ', 4464: 'ㅞ', 4465: 'ㅟ', 4466: 'ㅠ', 4468: 'ㅢ', 4469: 'ㅣ',
+    4520: 'ㄱ', 4521: 'ㄲ', 12595: 'ᆪ', 4523: 'ㄴ', 12597: 'ᆬ', 12598: 'ᆭ', 4526: 'ㄷ', 4527: 'ㄹ',
+    12602: 'ᆰ', 12603: 'ᆱ', 12604: 'ᆲ', 12605: 'ᆳ', 12606: 'ᆴ', 12607: 'ᆵ', 12608: 'ᆶ', 4535: 'ㅁ',
+    4536: 'ㅂ', 12612: 'ᆹ', 4538: 'ㅅ', 4539: 'ㅆ', 4540: 'ㅇ', 4541: 'ㅈ', 4542: 'ㅊ', 4543: 'ㅋ',
+    4544: 'ㅌ', 4545: 'ㅍ', 4546: 'ㅎ'}
+
+SCHEME_TRIES = {
+    'revised': {
+        'a': {'': 'ㅏ', 'e': {'': 'ㅐ'}},
+        'y': {
+            'a': {'': 'ㅑ', 'e': {'': 'ㅒ'}}, 'u': {'': 'ㅠ'}, 'e': {'': 'ㅖ', 'o': {'': 'ㅕ'}},
+            'o': {'': 'ㅛ'}},
+        'w': {'a': {'': 'ㅘ', 'e': {'': 'ㅙ'}}, 'i': {'': 'ㅟ'}, 'e': {'': 'ㅞ'}, 'o': {'': 'ㅝ'}},
+        'i': {'': 'ㅣ'}, 'u': {'': 'ㅜ', 'i': {'': 'ㅢ'}},
+        'e': {'': 'ㅔ', 'o': {'': 'ㅓ'}, 'u': {'': 'ㅡ'}}, 'o': {'': 'ㅗ', 'e': {'': 'ㅚ'}},
+        'k': {'': 'ㅋ', 'k': {'': 'ㄲ'}}, 'g': {'': 'ㄱ', 'g': {'': 'ㄲ'}},
+        't': {'': 'ㅌ', 't': {'': 'ㄸ'}}, 'd': {'': 'ㄷ', 'd': {'': 'ㄸ'}},
+        's': {'': 'ㅅ', 's': {'': 'ㅆ'}}, 'j': {'': 'ㅈ', 'j': {'': 'ㅉ'}}, 'c': {'h': {'': 'ㅊ'}},
+        'h': {'': 'ㅎ'}, 'b': {'': 'ㅂ', 'b': {'': 'ㅃ'}}, 'p': {'': 'ㅍ', 'p': {'': 'ㅃ'}},
+        'm': {'': 'ㅁ'}, 'n': {'g': {'': 'ㅇ'}, '': 'ㄴ'}, 'r': {'': 'ㄹ'}, 'l': {'': 'ㄹ'}},
+    'mccune-reischauer': {
+        'a': {'': 'ㅏ', 'e': {'': 'ㅐ'}},
+        'y': {
+            'a': {'': 'ㅑ', 'e': {'': 'ㅒ'}}, 'u': {'': 'ㅠ'}, 'e': {'': 'ㅖ'}, 'o': {'': 'ㅛ'},
+            'ŏ': {'': 'ㅕ'}},
+        'w': {'a': {'': 'ㅘ', 'e': {'': 'ㅙ'}}, 'i': {'': 'ㅟ'}, 'e': {'': 'ㅞ'}, 'ŏ': {'': 'ㅝ'}},
+        'i': {'': 'ㅣ'}, 'u': {'': 'ㅜ'}, 'e': {'': 'ㅔ'}, 'o': {'': 'ㅗ', 'e': {'': 'ㅚ'}},
+        'ŏ': {'': 'ㅓ'}, 'ŭ': {'': 'ㅡ', 'i': {'': 'ㅢ'}},
+        'k': {"'": {'': 'ㅋ'}, '': 'ㄱ', 'k': {'': 'ㄲ'}}, 'g': {'': 'ㄱ'},
+        't': {"'": {'': 'ㅌ'}, '': 'ㄷ', 't': {'': 'ㄸ'}, 'c': {'h': {'': 'ㅉ'}}}, 'd': {'': 'ㄷ'},
+        's': {'': 'ㅅ', 'h': {'': 'ㅅ'}, 's': {'': 'ㅆ'}}, 'c': {'h': {'': 'ㅈ', "'": {'': 'ㅊ'}}},
+        'j': {'': 'ㅈ'}, 'h': {'': 'ㅎ'}, 'p': {'': 'ㅂ', 'p': {'': 'ㅃ'}, "'": {'': 'ㅍ'}},
+        'b': {'': 'ㅂ'}, 'm': {'': 'ㅁ'}, 'n': {'g': {'': 'ㅇ'}, '': 'ㄴ'}, 'r': {'': 'ㄹ'},
+        'l': {'': 'ㄹ'}},
+    'yale': {
+        'a': {'': 'ㅏ', 'y': {'': 'ㅐ'}},
+        'y': {
+            'a': {'': 'ㅑ', 'y': {'': 'ㅒ'}}, 'u': {'': 'ㅠ'}, 'e': {'y': {'': 'ㅖ'}, '': 'ㅕ'},
+            'o': {'': 'ㅛ'}},
+        'w': {
+            'a': {'': 'ㅘ', 'y': {'': 'ㅙ'}}, 'i': {'': 'ㅟ'}, 'u': {'': 'ㅜ'},
+            'e': {'y': {'': 'ㅞ'}, '': 'ㅝ'}},
+        'i': {'': 'ㅣ'}, 'e': {'y': {'': 'ㅔ'}, '': 'ㅓ'}, 'o': {'': 'ㅗ', 'y': {'': 'ㅚ'}},
+        'u': {'': 'ㅡ', 'y': {'': 'ㅢ'}}, 'k': {'h': {'': 'ㅋ'}, '': 'ㄱ', 'k': {'': 'ㄲ'}},
+        't': {'h': {'': 'ㅌ'}, '': 'ㄷ', 't': {'': 'ㄸ'}}, 's': {'': 'ㅅ', 's': {'': 'ㅆ'}},
+        'c': {'': 'ㅈ', 'c': {'': 'ㅉ'}, 'h': {'': 'ㅊ'}}, 'h': {'': 'ㅎ'},
+        'p': {'': 'ㅂ', 'p': {'': 'ㅃ'}, 'h': {'': 'ㅍ'}}, 'm': {'': 'ㅁ'},
+        'n': {'g': {'': 'ㅇ'}, '': 'ㄴ'}, 'l': {'': 'ㄹ'}}}
+
+SCHEME_REGEXES = {
+    'revised': (
+        'a(?:e)?|b(?:b)?|c(?:h)|d(?:d)?|e(?:o|u)?|g(?:g)?|h|i|j(?:j)?|k(?:k)?|l|m|n(?'
+        ':g)?|o(?:e)?|p(?:p)?|r|s(?:s)?|t(?:t)?|u(?:i)?|w(?:a(?:e)?|e|i|o)|y(?:a(?:e)'
+        '?|e(?:o)?|o|u)'),
+    'mccune-reischauer': (
+        "a(?:e)?|b|c(?:h(?:')?)|d|e|g|h|i|j|k(?:'|k)?|l|m|n(?:g)?|o(?:e)?|p(?:'|p)?|r"
+        "|s(?:h|s)?|t(?:'|c(?:h)|t)?|u|w(?:a(?:e)?|e|i|ŏ)|y(?:a(?:e)?|e|o|u|ŏ)|ŏ|ŭ(?:"
+        'i)?'),
+    'yale': (
+        'a(?:y)?|c(?:c|h)?|e(?:y)?|h|i|k(?:h|k)?|l|m|n(?:g)?|o(?:y)?|p(?:h|p)?|s(?:s)'
+        '?|t(?:h|t)?|u(?:y)?|w(?:a(?:y)?|e(?:y)?|i|u)|y(?:a(?:y)?|e(?:y)?|o|u)')}
@@ -0,0 +1,62 @@
+"""Bounded caching of conversion results."""
+
+import collections
+import threading
+import typing as t
+
+CacheStats = collections.namedtuple(
+    'CacheStats', ['hits', 'misses', 'evictions', 'size', 'maxsize'])
+
+
+class LRUCache:
+
+    """Thread-safe cache of bounded size that evicts least recently used entries first.
+
+    It keeps statistics of hits, misses and evictions.
+    """
+
+    def __init__(self, maxsize: int = 65536):
+        assert maxsize > 0, maxsize
+        self.maxsize = maxsize
+        self._data = collections.OrderedDict()  # type: collections.OrderedDict[t.Hashable, t.Any]
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key: t.Hashable, default: t.Any = None) -> t.Any:
+        """Get cached value and mark it as recently used, or get default if it is not cached."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: t.Hashable, value: t.Any) -> None:
+        """Cache a value, evicting the least recently used one if the cache is full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached values and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._data),
+                              self.maxsize)
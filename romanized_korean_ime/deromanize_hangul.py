@@ -1,286 +1,768 @@
 """Turning romanized hangul back into jamo and/or hangul."""
 
-import itertools
+import collections
+import functools
+import heapq
 import logging
 import typing as t
 import os
+import re
+import time
+
+from ._tables import \
+    VOWELS, COMBINED_TO_DOUBLE, COMBINED_HEAD_JAMO, HEAD_JAMO, COMBINED_BODY_JAMO, BODY_JAMO, \
+    COMBINED_TAIL_JAMO, TAIL_JAMO, ALL_JAMO, IGNORED_CHARACTERS, ALL_UNAMBIGUOUS_JAMO, \
+    INTERRUPTORS, HEAD_INDEX, BODY_INDEX, TAIL_INDEX, JAMO_NORMALIZATION, SCHEME_TRIES, \
+    SCHEME_REGEXES
+from .caching import CacheStats, LRUCache
+from .offset_map import OffsetMap
+from .elements import \
+    VOWEL_BASES, VOWEL_PREFIXES, DOUBLED_CONSONANTS, REMAINING_CONSONANTS, RELATED_CONSONANTS, \
+    ELEMENTS, DOUBLE_TO_COMBINED, SINGLE_HEAD_JAMO, DOUBLE_HEAD_JAMO, SINGLE_BODY_JAMO, \
+    DOUBLE_BODY_JAMO, SINGLE_TAIL_JAMO, DOUBLE_TAIL_JAMO, WHITESPACE, PUNCTUATION, \
+    DISAMBIGUATORS, SUBSTITUTED, HANGUL_SYLLABLES_BASE, HEAD_ORDER, BODY_ORDER, TAIL_ORDER, \
+    SCHEMES
+from .syllables import \
+    InvalidJamoError, validate_jamo, compose_hangul, jamo_to_hangul_prefix, leading_syllables, \
+    syllables_at, _jamo_to_hangul_prefix
+from .lattice import \
+    count_parses, is_ambiguous, enumerate_parses, CANDIDATES_BEAM_WIDTH, CANDIDATES_TIME_BUDGET, \
+    jamo_to_hangul_candidates, _scored_candidates
+
+# tables, elements, syllables and lattice functions are re-exported, as they were defined here
+# before
+__all__ = [
+    'VOWELS', 'COMBINED_TO_DOUBLE', 'COMBINED_HEAD_JAMO', 'HEAD_JAMO', 'COMBINED_BODY_JAMO',
+    'BODY_JAMO', 'COMBINED_TAIL_JAMO', 'TAIL_JAMO', 'ALL_JAMO', 'IGNORED_CHARACTERS',
+    'ALL_UNAMBIGUOUS_JAMO', 'INTERRUPTORS', 'HEAD_INDEX', 'BODY_INDEX', 'TAIL_INDEX',
+    'JAMO_NORMALIZATION', 'VOWEL_BASES', 'VOWEL_PREFIXES', 'DOUBLED_CONSONANTS',
+    'REMAINING_CONSONANTS', 'RELATED_CONSONANTS', 'ELEMENTS', 'DOUBLE_TO_COMBINED',
+    'SINGLE_HEAD_JAMO', 'DOUBLE_HEAD_JAMO', 'SINGLE_BODY_JAMO', 'DOUBLE_BODY_JAMO',
+    'SINGLE_TAIL_JAMO', 'DOUBLE_TAIL_JAMO', 'WHITESPACE', 'PUNCTUATION', 'DISAMBIGUATORS',
+    'SUBSTITUTED', 'HANGUL_SYLLABLES_BASE', 'HEAD_ORDER', 'BODY_ORDER', 'TAIL_ORDER', 'SCHEMES',
+    'BACKENDS', 'match_element', 'enable_cache', 'disable_cache', 'clear_cache', 'cache_stats',
+    'trie_tokenizer', 'trie_prefix_tokenizer', 'regex_tokenizer', 'regex_prefix_tokenizer',
+    'Tokenizer', 'PrefixTokenizer', 'TOKENIZERS', 'PREFIX_TOKENIZERS', 'get_tokenizer',
+    'set_tokenizer', 'register_tokenizer', 'check_tokenizer', 'Scheme', 'compile_scheme',
+    'get_scheme', 'set_scheme', 'register_scheme', 'to_jamo_groups', 'to_jamo_groups_prefix',
+    'substitute_text', 'substitute_groups', 'substitute_groups_with_offsets', 'to_jamo',
+    'to_jamo_with_offsets', 'InvalidJamoError', 'validate_jamo', 'compose_hangul',
+    'jamo_to_hangul_prefix', 'jamo_to_hangul', 'leading_syllables', 'syllables_at', 'count_parses',
+    'is_ambiguous', 'enumerate_parses', 'CANDIDATES_BEAM_WIDTH', 'CANDIDATES_TIME_BUDGET',
+    'jamo_to_hangul_candidates', 'warn_if_ambiguous', 'to_hangul_groups', 'to_hangul',
+    'to_hangul_with_offsets', 'to_hangul_candidates', 'to_hangul_stream', 'to_hangul_many']
 
-from jamo import jamo_to_hangul as jamo_to_single_hangul
+_LOG = logging.getLogger(__name__)
 
-if os.environ.get('LOGGING_LEVEL', False):
-    logging.basicConfig(level=getattr(logging, os.environ['LOGGING_LEVEL'].upper()))
+# ways of converting jamo into hangul, see to_hangul_groups()
+BACKENDS = ('python', 'numpy')
 
-_LOG = logging.getLogger(__name__)
+# trie of romanized elements of the scheme chosen with set_scheme()
+_ELEMENTS_TRIE = SCHEME_TRIES['revised']  # type: t.Mapping[str, t.Any]
 
-VOWEL_BASES = ('a', 'i', 'u', 'e', 'o', 'eo', 'eu', 'ae', 'oe', 'ui')
 
-VOWEL_PREFIXES = ('', 'y', 'w')
+def match_element(text: str, begin: int,
+                  trie: t.Optional[t.Mapping[str, t.Any]] = None) -> t.Tuple[t.Optional[str], int]:
+    """Find the longest romanized element starting at a given position in the text.
 
-DOUBLED_CONSONANTS = ('g', 'd', 's', 'j', 'b')
+    Return the jamo of the element and the position right after it,
+    or None and the given position if no element starts there.
+    Elements are looked up in the trie of the current scheme, unless another trie is given.
+    """
+    jamo = None
+    end = begin
+    node = _ELEMENTS_TRIE if trie is None else trie
+    for i in range(begin, len(text)):
+        node = node.get(text[i])
+        if node is None:
+            break
+        if '' in node:
+            jamo = node['']
+            end = i + 1
+    return jamo, end
 
-REMAINING_CONSONANTS = ('k', 't', 'ch', 'h', 'p', 'm', 'ng', 'r', 'n')
 
-RELATED_CONSONANTS = ()
+_SINGLE_CHAR_INTERRUPTORS = ''.join(sorted(_ for _ in INTERRUPTORS if len(_) == 1))
 
-ELEMENTS = {
-    'a': 'ㅏ', 'ya': 'ㅑ', 'wa': 'ㅘ',
-    'i': 'ㅣ', 'wi': 'ㅟ',
-    'u': 'ㅜ', 'yu': 'ㅠ',
-    'e': 'ㅔ', 'ye': 'ㅖ', 'we': 'ㅞ',
-    'o': 'ㅗ', 'yo': 'ㅛ', 'wo': 'ㅝ',
-    'eo': 'ㅓ', 'yeo': 'ㅕ',
-    'eu': 'ㅡ',
-    'ae': 'ㅐ', 'yae': 'ㅒ', 'wae': 'ㅙ',
-    'oe': 'ㅚ',
-    'ui': 'ㅢ',
-    'k': 'ㅋ',
-    'g': 'ㄱ', 'gg': 'ㄲ',
-    't': 'ㅌ',
-    'd': 'ㄷ', 'dd': 'ㄸ',
-    's': 'ㅅ', 'ss': 'ㅆ',
-    'j': 'ㅈ', 'jj': 'ㅉ',
-    'ch': 'ㅊ',
-    'h': 'ㅎ',
-    'b': 'ㅂ', 'bb': 'ㅃ',
-    'p': 'ㅍ',
-    'm': 'ㅁ',
-    'ng': 'ㅇ',
-    'r': 'ㄹ',
-    'n': 'ㄴ'}
 
-# synonyms
-ELEMENTS['kk'] = ELEMENTS['gg']
-ELEMENTS['tt'] = ELEMENTS['dd']
-ELEMENTS['pp'] = ELEMENTS['bb']
-ELEMENTS['l'] = ELEMENTS['r']
+_INTERRUPTOR = re.compile('[{}]'.format(re.escape(_SINGLE_CHAR_INTERRUPTORS)))
 
-VOWELS = {ELEMENTS[prefix + base]
-          for prefix, base in itertools.product(VOWEL_PREFIXES, VOWEL_BASES)
-          if prefix + base in ELEMENTS}
+_TOKEN = re.compile('[^{}]+'.format(re.escape(_SINGLE_CHAR_INTERRUPTORS)))
 
-DOUBLE_TO_COMBINED = {
-    'ㅗㅏ': 'ㅘ', 'ㅜㅣ': 'ㅟ', 'ㅜㅔ': 'ㅞ', 'ㅜㅓ': 'ㅝ', 'ㅗㅐ': 'ㅙ', 'ㅗㅣ': 'ㅚ', 'ㅡㅣ': 'ㅢ',
-    'ㄱㄱ': 'ㄲ', 'ㄷㄷ': 'ㄸ', 'ㅅㅅ': 'ㅆ', 'ㅈㅈ': 'ㅉ', 'ㅂㅂ': 'ㅃ', 'ㄱㅅ': 'ᆪ', 'ㄴㅈ': 'ᆬ',
-    'ㄴㅎ': 'ᆭ', 'ㄹㄱ': 'ᆰ', 'ㄹㅁ': 'ᆱ', 'ㄹㅂ': 'ᆲ', 'ㄹㅅ': 'ᆳ', 'ㄹㅌ': 'ᆴ', 'ㄹㅍ': 'ᆵ',
-    'ㄹㅎ': 'ᆶ', 'ㅂㅅ': 'ᆹ'}
+# token followed by a disambiguator, which belongs to the group in the romanized text
+_TOKEN_WITH_DISAMBIGUATOR = re.compile('[^{}]+[{}]?'.format(
+    re.escape(_SINGLE_CHAR_INTERRUPTORS), re.escape(''.join(sorted(DISAMBIGUATORS)))))
 
-COMBINED_TO_DOUBLE = {v: k for k, v in DOUBLE_TO_COMBINED.items()}
 
-# head jamo
+@functools.lru_cache(maxsize=8)
+def _element_or_interruptor_pattern(elements_regex: str) -> t.Pattern:
+    """Compile a pattern of elements of a scheme, only when the scheme is used the first time."""
+    return re.compile('{}|[{}]'.format(elements_regex, re.escape(_SINGLE_CHAR_INTERRUPTORS)))
 
-SINGLE_HEAD_JAMO = {'ㄱ', 'ㄴ', 'ㄷ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅅ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'}
 
-DOUBLE_HEAD_JAMO = {'ㄱㄱ', 'ㄷㄷ', 'ㅂㅂ', 'ㅅㅅ', 'ㅈㅈ'}
+_TOKEN_CACHE = None  # type: t.Optional[LRUCache]
 
-COMBINED_HEAD_JAMO = {DOUBLE_TO_COMBINED[_] for _ in DOUBLE_HEAD_JAMO}
+_HANGUL_CACHE = None  # type: t.Optional[LRUCache]
 
-HEAD_JAMO = SINGLE_HEAD_JAMO | COMBINED_HEAD_JAMO
 
-# body jamo
+def enable_cache(maxsize: int = 65536, *, tokens: bool = False) -> None:
+    """Cache conversion of jamo groups into hangul, and optionally of romanized tokens into jamo.
+
+    Token is a maximal run of romanized text without interruptors. Each cache keeps at most
+    maxsize most recently used entries. Enabling the cache again replaces the existing caches.
+    """
+    global _TOKEN_CACHE, _HANGUL_CACHE
+    _TOKEN_CACHE = LRUCache(maxsize) if tokens else None
+    _HANGUL_CACHE = LRUCache(maxsize)
+
 
-SINGLE_BODY_JAMO = {'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅛ', 'ㅜ', 'ㅠ', 'ㅡ', 'ㅣ'}
+def disable_cache() -> None:
+    global _TOKEN_CACHE, _HANGUL_CACHE
+    _TOKEN_CACHE = None
+    _HANGUL_CACHE = None
 
-DOUBLE_BODY_JAMO = {'ㅗㅏ', 'ㅗㅐ', 'ㅗㅣ', 'ㅜㅓ', 'ㅜㅔ', 'ㅜㅣ', 'ㅡㅣ'}
 
-COMBINED_BODY_JAMO = {DOUBLE_TO_COMBINED[_] for _ in DOUBLE_BODY_JAMO}
+def clear_cache() -> None:
+    for cache in (_TOKEN_CACHE, _HANGUL_CACHE):
+        if cache is not None:
+            cache.clear()
 
-BODY_JAMO = SINGLE_BODY_JAMO | COMBINED_BODY_JAMO
 
-# tail jamo
+def cache_stats() -> t.Dict[str, CacheStats]:
+    """Get statistics of enabled caches, by name ('tokens' and/or 'hangul')."""
+    caches = {'tokens': _TOKEN_CACHE, 'hangul': _HANGUL_CACHE}
+    return {name: cache.stats() for name, cache in caches.items() if cache is not None}
 
-SINGLE_TAIL_JAMO = {'ㄱ', 'ㄴ', 'ㄷ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅅ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'}
 
-DOUBLE_TAIL_JAMO = {
-    'ㄱㄱ', 'ㄱㅅ', 'ㄴㅈ', 'ㄴㅎ', 'ㄹㄱ', 'ㄹㅁ', 'ㄹㅂ', 'ㄹㅅ', 'ㄹㅌ', 'ㄹㅍ', 'ㄹㅎ', 'ㅂㅅ', 'ㅅㅅ'}
+def _token_to_jamo(text: str, begin: int, end: int) -> t.Tuple[str, int]:
+    """Convert a romanized token (i.e. text without interruptors) into jamo.
 
-COMBINED_TAIL_JAMO = {DOUBLE_TO_COMBINED[_] for _ in DOUBLE_TAIL_JAMO}
+    Return the jamo and the position where conversion stopped, which is before the end
+    if no element matches there.
+    """
+    jamo = []
+    while begin < end:
+        element, begin_ = match_element(text, begin)
+        if element is None:
+            break
+        jamo.append(element)
+        begin = begin_
+    return ''.join(jamo), begin
 
-TAIL_JAMO = SINGLE_TAIL_JAMO | COMBINED_TAIL_JAMO
 
+def _trie_tokenize(text: str, trie: t.Optional[t.Mapping[str, t.Any]] = None) \
+        -> t.Tuple[t.List[t.Tuple[str, int, int]], str, int, int]:
+    """Match romanized elements one by one, until the end of text or until no element matches.
 
-ALL_JAMO = HEAD_JAMO | BODY_JAMO | TAIL_JAMO
+    Return groups of jamo found so far, jamo of the group that was not finished yet,
+    position where that group begins, and position where matching stopped.
+    Tokens are cached only if elements are matched in the trie of the current scheme.
+    """
+    jamo_groups = []  # type: t.List[t.Tuple[str, int, int]]
+    jamo = []  # type: t.List[str]
+    begin = 0
+    end = 0
+    text_len = len(text)
+    if trie is None:
+        trie = _ELEMENTS_TRIE
+        token_cache = _TOKEN_CACHE
+    else:
+        token_cache = None
+    tracing = _LOG.isEnabledFor(logging.DEBUG)
+    if tracing:
+        _LOG.debug('to_jamo_groups: %s "%s" %i:%i "%s"', jamo_groups, '', begin, end, text)
+    while end < text_len:
+        char = text[end]
+        if char in INTERRUPTORS:
+            if jamo:
+                fixup = (0 if char in IGNORED_CHARACTERS else 1)
+                jamo_groups.append((''.join(jamo), begin, end + fixup))
+                jamo = []
+            end += 1
+            begin = end
+            if tracing:
+                _LOG.debug('to_jamo_groups: %s "%s" %i:%i "%s"',
+                           jamo_groups, ''.join(jamo), begin, end, text[end:])
+            continue
+        if token_cache is not None:
+            interruptor = _INTERRUPTOR.search(text, end)
+            token_end = text_len if interruptor is None else interruptor.start()
+            token = text[end:token_end]
+            token_jamo = token_cache.get(token)
+            if token_jamo is None:
+                token_jamo, stop = _token_to_jamo(text, end, token_end)
+                if stop < token_end:
+                    jamo.append(token_jamo)
+                    end = stop
+                    break
+                token_cache.put(token, token_jamo)
+            jamo.append(token_jamo)
+            end = token_end
+            if tracing:
+                _LOG.debug('to_jamo_groups: %s "%s" %i:%i "%s"',
+                           jamo_groups, ''.join(jamo), begin, end, text[end:])
+            continue
+        element, element_end = match_element(text, end, trie)
+        if element is None:
+            break
+        jamo.append(element)
+        end = element_end
+        if tracing:
+            _LOG.debug('to_jamo_groups: %s "%s" %i:%i "%s"',
+                       jamo_groups, ''.join(jamo), begin, end, text[end:])
+    return jamo_groups, ''.join(jamo), begin, end
 
-WHITESPACE = {' ', '\t', '\n', '\r\n'}
 
-PUNCTUATION = {',', '.', '?', '!', ';', ':', '(', ')', '[', ']', '{', '}', '<', '>'}
+def trie_tokenizer(text: str, trie: t.Optional[t.Mapping[str, t.Any]] = None) \
+        -> t.List[t.Tuple[str, int, int]]:
+    """Find all groups of jamo by matching romanized elements one by one in the trie of a scheme.
 
-IGNORED_CHARACTERS = WHITESPACE | PUNCTUATION
+    This is the reference tokenizer. The trie of the current scheme is used unless another
+    trie is given.
+    """
+    jamo_groups, jamo, begin, end = _trie_tokenize(text, trie)
+    if end < len(text):
+        raise ValueError((jamo_groups, jamo, text[end:]))
+    if jamo:
+        jamo_groups.append((jamo, begin, end))
+    return jamo_groups
 
-DISAMBIGUATORS = {'-'}
 
-ALL_UNAMBIGUOUS_JAMO = ALL_JAMO | DISAMBIGUATORS
+def trie_prefix_tokenizer(text: str, trie: t.Optional[t.Mapping[str, t.Any]] = None) \
+        -> t.Tuple[t.List[t.Tuple[str, int, int]], int]:
+    """Find groups of jamo in the longest prefix of the text that can be tokenized, in one pass.
 
-INTERRUPTORS = DISAMBIGUATORS | IGNORED_CHARACTERS
+    Return the groups and the length of the prefix. The groups are the same
+    as trie_tokenizer() finds in the prefix.
+    """
+    jamo_groups, jamo, begin, end = _trie_tokenize(text, trie)
+    if jamo:
+        jamo_groups.append((jamo, begin, end))
+    return jamo_groups, end
+
+
+# jamo of each element of the current scheme, and each interruptor as it is
+_JAMO_OR_INTERRUPTOR = {**ELEMENTS, **{_: _ for _ in _SINGLE_CHAR_INTERRUPTORS}}
+
+
+def _regex_tokenize(text: str) -> t.Optional[t.List[t.Tuple[str, int, int]]]:
+    parts = _element_or_interruptor_pattern(_SCHEME.regex).findall(text)
+    if sum(map(len, parts)) != len(text):
+        return None
+    jamo = ''.join(map(_JAMO_OR_INTERRUPTOR.__getitem__, parts))
+    spans = [_.span() for _ in _TOKEN_WITH_DISAMBIGUATOR.finditer(text)]
+    jamo_groups = [(jamo_group, begin, end) for jamo_group, (begin, end)
+                   in zip(_TOKEN.findall(jamo), spans)]
+    if _LOG.isEnabledFor(logging.DEBUG):
+        _LOG.debug('regex_tokenizer: %s', jamo_groups)
+    return jamo_groups
 
-SUBSTITUTED = {'ᅪ': 'ㅘ', 'ᅳ': 'ㅡ', 'ᄄ': 'ㄸ', 'ᄍ': 'ㅉ'}
 
+def regex_tokenizer(text: str) -> t.List[t.Tuple[str, int, int]]:
+    """Find all groups of jamo using compiled regular expressions.
 
-def to_jamo_groups(text: str) -> t.List[t.Tuple[str, int, int]]:
-    """Find all groups of jamo (i.e. hangul letters) in a romanized hangul text."""
-    jamo_groups = []
-    jamo = ''
-    begin = 0
-    end = 0
-    _LOG.debug('to_jamo_groups: %s "%s" %i:%i "%s"', jamo_groups, jamo, begin, end, text)
-    while text or jamo:
-        if text and text[0] in INTERRUPTORS or not text and jamo:
-            if text:
-                if jamo:
-                    fixup = (0 if text[0] in IGNORED_CHARACTERS else 1)
-                    jamo_groups.append((jamo, begin, end + fixup))
-                    jamo = ''
-                end += 1
-                begin = end
-                text = text[1:]
-            else:
-                jamo_groups.append((jamo, begin, end))
-                jamo = ''
-            _LOG.debug('to_jamo_groups: %s "%s" %i:%i "%s"', jamo_groups, jamo, begin, end, text)
-            continue
-        added = False
-        for length in (3, 2, 1):
-            if len(text) < length:
-                continue
-            if text[:length] in ELEMENTS:
-                # assert jamo or begin == end, (jamo, begin, end)
-                jamo += ELEMENTS[text[:length]]
-                text = text[length:]
-                end += length
-                _LOG.debug('to_jamo_groups: %s "%s" %i:%i "%s"',
-                           jamo_groups, jamo, begin, end, text)
-                added = True
-                break
-        if not added:
-            raise ValueError((jamo_groups, jamo, text))
+    The whole text is split into romanized elements and interruptors with one pattern, in which
+    longer elements come first. Then, groups are found in the resulting jamo and their spans
+    in the text with patterns that match tokens (i.e. text between interruptors).
+    """
+    jamo_groups = _regex_tokenize(text)
+    if jamo_groups is None:
+        # some characters are not elements, let the reference tokenizer find the first of them
+        trie_tokenizer(text)
+        raise AssertionError(text)  # unreachable unless both tokenizers disagree
     return jamo_groups
 
 
+def regex_prefix_tokenizer(text: str) -> t.Tuple[t.List[t.Tuple[str, int, int]], int]:
+    """Find groups of jamo in the longest prefix of the text that can be tokenized.
+
+    If the whole text can be tokenized, this is done like in regex_tokenizer(), otherwise
+    the reference tokenizer finds the prefix.
+    """
+    jamo_groups = _regex_tokenize(text)
+    if jamo_groups is None:
+        return trie_prefix_tokenizer(text)
+    return jamo_groups, len(text)
+
+
+Tokenizer = t.Callable[[str], t.List[t.Tuple[str, int, int]]]
+
+PrefixTokenizer = t.Callable[[str], t.Tuple[t.List[t.Tuple[str, int, int]], int]]
+
+TOKENIZERS = {'trie': trie_tokenizer, 'regex': regex_tokenizer}  # type: t.Dict[str, Tokenizer]
+
+# versions of tokenizers that tokenize the longest possible prefix of the text instead of failing
+PREFIX_TOKENIZERS = {
+    'trie': trie_prefix_tokenizer,
+    'regex': regex_prefix_tokenizer}  # type: t.Dict[str, PrefixTokenizer]
+
+_TOKENIZER_NAME = 'trie'
+
+_TOKENIZER = trie_tokenizer  # type: Tokenizer
+
+_PREFIX_TOKENIZER = trie_prefix_tokenizer  # type: PrefixTokenizer
+
+
+def get_tokenizer() -> str:
+    """Get name of the tokenizer used by to_jamo_groups() by default."""
+    return _TOKENIZER_NAME
+
+
+def set_tokenizer(name: str) -> None:
+    """Choose the tokenizer used by to_jamo_groups() by default, by its name in TOKENIZERS."""
+    global _TOKENIZER_NAME, _TOKENIZER, _PREFIX_TOKENIZER
+    if name not in TOKENIZERS:
+        raise ValueError('unknown tokenizer {}, expected one of {}'.format(name, list(TOKENIZERS)))
+    _TOKENIZER_NAME = name
+    _TOKENIZER = TOKENIZERS[name]
+    _PREFIX_TOKENIZER = PREFIX_TOKENIZERS[name]
+
+
+def _retrying_prefix_tokenizer(tokenizer: Tokenizer, text: str) \
+        -> t.Tuple[t.List[t.Tuple[str, int, int]], int]:
+    """Find the longest prefix of the text that the tokenizer accepts, by trying each of them."""
+    for end in range(len(text), 0, -1):
+        try:
+            return tokenizer(text[:end]), end
+        except ValueError:
+            continue
+    return [], 0
+
+
+def register_tokenizer(name: str, tokenizer: Tokenizer,
+                       prefix_tokenizer: t.Optional[PrefixTokenizer] = None) -> None:
+    """Make a tokenizer available to set_tokenizer() and to_jamo_groups() under a given name.
+
+    Tokenizer has to give the same results, and raise the same errors, as trie_tokenizer().
+    Its prefix version has to give the same results as trie_prefix_tokenizer(). If it is not
+    given, the prefix is found by calling the tokenizer on shorter and shorter prefixes.
+    """
+    if prefix_tokenizer is None:
+        prefix_tokenizer = functools.partial(_retrying_prefix_tokenizer, tokenizer)
+    TOKENIZERS[name] = tokenizer
+    PREFIX_TOKENIZERS[name] = prefix_tokenizer
+
+
+def check_tokenizer(name: str, texts: t.Iterable[str]) -> t.List[str]:
+    """Find texts for which a tokenizer gives other results or errors than the reference one.
+
+    Prefix versions of both tokenizers are compared as well.
+    """
+    mismatches = []
+    for text in texts:
+        results = []  # type: t.List[t.Any]
+        for tokenizer in (TOKENIZERS[name], trie_tokenizer):
+            try:
+                results.append(tokenizer(text))
+            except ValueError as err:
+                results.append(err.args)
+        if results[0] != results[1] \
+                or PREFIX_TOKENIZERS[name](text) != trie_prefix_tokenizer(text):
+            mismatches.append(text)
+    return mismatches
+
+
+set_tokenizer(os.environ.get('ROMANIZED_KOREAN_IME_TOKENIZER', 'trie'))
+
+Scheme = collections.namedtuple('Scheme', ['name', 'elements', 'trie', 'regex', 'max_element_len'])
+
+# separates names of schemes in the name of their union
+_SCHEME_SEPARATOR = '+'
+
+
+@functools.lru_cache(maxsize=None)
+def compile_scheme(name: str) -> Scheme:
+    """Get the elements of a romanization scheme and the structures in which they are looked up.
+
+    The name is a name in SCHEMES, or names joined with '+' for a union of schemes,
+    e.g. 'revised+yale'. If schemes in a union map the same romanized element to different
+    jamo, the first of them wins. Built-in schemes are compiled in advance by generate_tables
+    module, and other schemes and unions are compiled once, when they are used the first time.
+    Length of the longest romanized element is kept too, as it limits how far ahead tokenization
+    looks.
+    """
+    if name in SCHEME_TRIES:
+        return Scheme(name, SCHEMES[name], SCHEME_TRIES[name], SCHEME_REGEXES[name],
+                      max(map(len, SCHEMES[name])))
+    names = name.split(_SCHEME_SEPARATOR)
+    for name_ in names:
+        if name_ not in SCHEMES:
+            raise ValueError('unknown scheme {}, expected one of {}'.format(name_, list(SCHEMES)))
+    elements = {}  # type: t.Dict[str, str]
+    for name_ in reversed(names):
+        elements.update(SCHEMES[name_])
+    from .generate_tables import build_elements_trie, build_elements_regex
+    trie = build_elements_trie(elements)
+    return Scheme(name, elements, trie, build_elements_regex(trie), max(map(len, elements)))
+
+
+_SCHEME = compile_scheme('revised')
+
+
+def get_scheme() -> str:
+    """Get name of the romanization scheme used by to_jamo_groups() by default."""
+    return _SCHEME.name
+
+
+def set_scheme(name: str) -> None:
+    """Choose the romanization scheme used by to_jamo_groups() by default.
+
+    The name is given like to compile_scheme(). Tokenization is equally fast
+    with any scheme, including unions of schemes, because each has a single trie.
+    """
+    global _SCHEME, _ELEMENTS_TRIE, _JAMO_OR_INTERRUPTOR
+    _SCHEME = compile_scheme(name)
+    _ELEMENTS_TRIE = _SCHEME.trie
+    _JAMO_OR_INTERRUPTOR = {**_SCHEME.elements, **{_: _ for _ in _SINGLE_CHAR_INTERRUPTORS}}
+    # results that depend on elements of the previous scheme
+    if _TOKEN_CACHE is not None:
+        _TOKEN_CACHE.clear()
+
+
+def register_scheme(name: str, elements: t.Mapping[str, str]) -> None:
+    """Make a romanization scheme available to set_scheme() and compile_scheme() under a name.
+
+    Elements map romanized text to jamo, each to a single one, like in ELEMENTS.
+    Built-in schemes cannot be replaced.
+    """
+    if name in SCHEME_TRIES or not name or _SCHEME_SEPARATOR in name:
+        raise ValueError('cannot register scheme under name {}'.format(repr(name)))
+    invalid = [romanization for romanization, jamo in elements.items()
+               if not romanization or INTERRUPTORS.intersection(romanization)
+               or jamo not in ALL_JAMO]
+    if invalid:
+        raise ValueError('invalid elements {} of scheme {}'.format(invalid, name))
+    SCHEMES[name] = dict(elements)
+    compile_scheme.cache_clear()
+    if name in _SCHEME.name.split(_SCHEME_SEPARATOR):
+        set_scheme(_SCHEME.name)
+
+
+set_scheme(os.environ.get('ROMANIZED_KOREAN_IME_SCHEME', 'revised'))
+
+
+def to_jamo_groups(text: str, *, tokenizer: t.Optional[str] = None,
+                   scheme: t.Optional[str] = None) -> t.List[t.Tuple[str, int, int]]:
+    """Find all groups of jamo (i.e. hangul letters) in a romanized hangul text.
+
+    The tokenizer is given by its name in TOKENIZERS. By default, the one chosen
+    with set_tokenizer() is used, which is initially taken from ROMANIZED_KOREAN_IME_TOKENIZER
+    environment variable, or is 'trie' if it is not set.
+
+    Likewise, the romanization scheme is the one chosen with set_scheme(), initially taken
+    from ROMANIZED_KOREAN_IME_SCHEME environment variable, or 'revised'. If another scheme
+    is given, the reference tokenizer is used with it.
+    """
+    if scheme is not None and scheme != _SCHEME.name:
+        return trie_tokenizer(text, compile_scheme(scheme).trie)
+    if tokenizer is None:
+        return _TOKENIZER(text)
+    return TOKENIZERS[tokenizer](text)
+
+
+def to_jamo_groups_prefix(text: str, *, tokenizer: t.Optional[str] = None,
+                          scheme: t.Optional[str] = None) \
+        -> t.Tuple[t.List[t.Tuple[str, int, int]], int]:
+    """Find groups of jamo in the longest prefix of the text that can be converted into jamo.
+
+    Return the groups and the length of the prefix, instead of raising an error for text
+    that cannot be converted as a whole. The groups are the same as to_jamo_groups() finds
+    in the prefix. The tokenizer and the scheme are chosen like in to_jamo_groups().
+    """
+    if scheme is not None and scheme != _SCHEME.name:
+        return trie_prefix_tokenizer(text, compile_scheme(scheme).trie)
+    if tokenizer is None:
+        return _PREFIX_TOKENIZER(text)
+    return PREFIX_TOKENIZERS[tokenizer](text)
+
+
 def substitute_text(text: str, replacement: str, begin: int, end: int) -> str:
     return text[:begin] + replacement + text[end:]
 
 
-def to_jamo(text: str) -> str:
-    """Convert romanized korean text into jamo."""
-    jamo = text
-    jamo_groups = to_jamo_groups(text)
-    for jamo_group, begin, end in reversed(jamo_groups):
-        _LOG.debug('to_jamo: "%s" %s %i:%i', jamo, jamo_group, begin, end)
-        jamo = substitute_text(jamo, jamo_group, begin, end)
-    _LOG.debug('to_jamo: "%s"', jamo)
-    return jamo
+def substitute_groups(text: str, groups: t.Iterable[t.Tuple[str, int, int]]) -> str:
+    """Substitute text of each group between its begin and end with the group.
 
+    Groups must be ordered and must not overlap. Output is built in one pass and joined once.
+    """
+    pieces = []
+    end = 0
+    for group, group_begin, group_end in groups:
+        pieces.append(text[end:group_begin])
+        pieces.append(group)
+        end = group_end
+    pieces.append(text[end:])
+    return ''.join(pieces)
+
+
+def substitute_groups_with_offsets(text: str, groups: t.Iterable[t.Tuple[str, int, int]]) \
+        -> t.Tuple[str, OffsetMap]:
+    """Substitute groups like substitute_groups(), and map output characters to source spans."""
+    pieces = []
+    offsets = OffsetMap()
+    end = 0
+    for group, group_begin, group_end in groups:
+        pieces.append(text[end:group_begin])
+        offsets.append_copied(end, group_begin)
+        pieces.append(group)
+        offsets.append_converted(len(group), group_begin, group_end)
+        end = group_end
+    pieces.append(text[end:])
+    offsets.append_copied(end, len(text))
+    return ''.join(pieces), offsets
 
-def validate_jamo(jamo: str) -> str:
-    """Substitute auto-combining jamo with their not auto combining versions.
 
-    Some jamo has different unicode codes and they cause it to automatically combine into hangul
-    and this causes trouble when operating on them.
+def _trace_groups(function_name: str, groups: t.Sequence[t.Tuple[str, int, int]]) -> None:
+    if _LOG.isEnabledFor(logging.DEBUG):
+        for group, begin, end in groups:
+            _LOG.debug('%s: %s %i:%i', function_name, group, begin, end)
 
-    For example, ᄄ ᅳ ᆪ automatically combine into 뜫 if there are no spaces between them.
-    On the other hand ㄸㅡᆪ give no such trouble and don't merge into 뜫 (here as single character).
 
-    The characters involved:
-    https://en.wikipedia.org/wiki/Hangul_Jamo_(Unicode_block)
-    https://en.wikipedia.org/wiki/Hangul_Compatibility_Jamo
+def to_jamo(text: str, *, scheme: t.Optional[str] = None) -> str:
+    """Convert romanized korean text into jamo."""
+    jamo_groups = to_jamo_groups(text, scheme=scheme)
+    _trace_groups('to_jamo', jamo_groups)
+    return substitute_groups(text, jamo_groups)
 
-    To make things worse, sometimes it's versions from one group that merge,
-    sometimes from the other.
-    """
-    if all(_ in ALL_UNAMBIGUOUS_JAMO for _ in jamo):
-        return jamo
-    _LOG.info('repairing problematic characters in jamo text "%s"', jamo)
-    transformed = ''.join(SUBSTITUTED.get(_, _) for _ in jamo)
-    assert all(_ in ALL_UNAMBIGUOUS_JAMO for _ in transformed), transformed
-    return transformed
+
+def to_jamo_with_offsets(text: str, *,
+                         scheme: t.Optional[str] = None) -> t.Tuple[str, OffsetMap]:
+    """Convert romanized korean text into jamo, and map each jamo to its span in the text."""
+    jamo_groups = to_jamo_groups(text, scheme=scheme)
+    _trace_groups('to_jamo', jamo_groups)
+    return substitute_groups_with_offsets(text, jamo_groups)
 
 
-def jamo_to_hangul(jamo: str, *,
-                   warn: bool = False, limit: int = None, aggressive: bool = True) -> str:
+def jamo_to_hangul(jamo: str, *, warn: bool = False, limit: t.Optional[int] = None,
+                   aggressive: bool = True, lexicon: t.Optional[t.Any] = None) -> str:
     """Convert a string of jamo into a one or more hangul characters.
 
-    Function can warn if conversion is ambiguous.
+    Function can warn if conversion is ambiguous. If a lexicon is given, the sequence
+    is split into syllables so that it forms known words where possible, see lexicon.segment().
+    Raise InvalidJamoError if the sequence cannot be split into syllables.
     """
-    hangul = ''
     jamo = validate_jamo(jamo)
-    _LOG.debug('jamo_to_hangul: "%s" "%s"', hangul, jamo)
-    while jamo:
-        if jamo and jamo[0] in DISAMBIGUATORS:
-            jamo = jamo[1:]
-            _LOG.debug('jamo_to_hangul: "%s" "%s"', hangul, jamo)
-            continue
-        jamo = repair_head_jamo(jamo, hangul=hangul, aggressive=aggressive)
-        assert jamo[0] in HEAD_JAMO, (hangul, jamo[0], jamo)
-        assert len(jamo) >= 2, (hangul, jamo)
-        jamo = repair_body_jamo(jamo, hangul=hangul, aggressive=aggressive)
-        assert jamo[1] in BODY_JAMO, (hangul, jamo[1], jamo)
-        jamo = repair_tail_jamo(jamo, hangul=hangul, aggressive=aggressive)
-        if len(jamo) >= 3 and jamo[2] in TAIL_JAMO:
-            hangul += jamo_to_single_hangul(jamo[0], jamo[1], jamo[2])
-            if warn and len(jamo) >= 4:
-                try:
-                    short_next = jamo_to_hangul(jamo[2:], warn=False)
-                    short = jamo_to_hangul(jamo[:2], warn=False)
-                    hangul_next = jamo_to_hangul(jamo[3:], warn=False)
-                    _LOG.warning('conversion to hangul is ambiguous for jamo sequence "%s":'
-                                 ' both "%s"/"%s" into "%s" and "%s"/"%s" into "%s" are possible',
-                                 jamo, jamo[:2], jamo[2:], short + short_next,
-                                 jamo[:3], jamo[3:], hangul[-1] + hangul_next)
-                except AssertionError:
-                    pass
-            jamo = jamo[3:]
-        else:
-            hangul += jamo_to_single_hangul(jamo[0], jamo[1])
-            jamo = jamo[2:]
-        _LOG.debug('jamo_to_hangul: "%s" "%s"', hangul, jamo)
-        if limit is not None and len(hangul) >= limit:
-            break
+    if warn:
+        warn_if_ambiguous(jamo, aggressive=aggressive)
+    if lexicon is not None:
+        from .lexicon import segment
+        hangul = segment(jamo, lexicon, aggressive=aggressive)
+        if hangul is not None:
+            return hangul if limit is None else hangul[:limit]
+    hangul, end = _jamo_to_hangul_prefix(jamo, limit, aggressive)
+    if end < len(jamo) and (limit is None or len(hangul) < limit):
+        raise InvalidJamoError((hangul, jamo[end:], jamo))
     return hangul
 
 
-def repair_head_jamo(jamo: str, *, hangul: str = '', aggressive: bool = True) -> str:
-    """Insert/substitute jamo at the head position of the jamo sequence to make it canonical."""
-    if aggressive and jamo[0:2] in DOUBLE_HEAD_JAMO:
-        jamo = DOUBLE_TO_COMBINED[jamo[0:2]] + jamo[2:]
-        _LOG.debug('"%s" "%s"', hangul, jamo)
-    if jamo[0] in VOWELS:
-        jamo = ELEMENTS['ng'] + jamo
-        _LOG.debug('"%s" "%s"', hangul, jamo)
-    return jamo
-
+def warn_if_ambiguous(jamo: str, *, aggressive: bool = True) -> None:
+    """Log a warning with two possible conversions if jamo sequence is ambiguous."""
+    parses = enumerate_parses(jamo, limit=2, aggressive=aggressive)
+    if len(parses) > 1:
+        _LOG.warning('conversion to hangul is ambiguous for jamo sequence "%s":'
+                     ' both "%s" and "%s" are possible', jamo, *parses)
 
-def repair_body_jamo(jamo: str, *, hangul: str = '', aggressive: bool = True) -> str:
-    """Substitute jamo at the body position of the jamo sequence to make it canonical."""
-    if aggressive and len(jamo) >= 3 and jamo[1:3] in DOUBLE_BODY_JAMO:
-        jamo = jamo[0] + DOUBLE_TO_COMBINED[jamo[1:3]] + jamo[3:]
-        _LOG.debug('"%s" "%s"', hangul, jamo)
-    return jamo
 
+def _jamo_groups_to_hangul(jamo_groups: t.Sequence[str], backend: str,
+                           **kwargs) -> t.List[str]:
+    """Convert jamo sequences into hangul using a given backend, falling back to Python."""
+    if backend == 'numpy' and kwargs.get('lexicon') is None:
+        kwargs.pop('lexicon', None)
+        try:
+            from .vectorized import jamo_groups_to_hangul
+        except ImportError:
+            _LOG.debug('NumPy is not available, falling back to Python backend')
+        else:
+            return jamo_groups_to_hangul(jamo_groups, **kwargs)
+    elif backend not in BACKENDS:
+        raise ValueError('unknown backend {}, expected one of {}'.format(backend, BACKENDS))
+    return [jamo_to_hangul(_, **kwargs) for _ in jamo_groups]
 
-def repair_tail_jamo(jamo: str, *, hangul: str = '', aggressive: bool = True) -> str:
-    """Substitute jamo at the tail position of the jamo sequence to make it canonical."""
-    if aggressive and len(jamo) >= 4 and jamo[2:4] in DOUBLE_TAIL_JAMO:
-        jamo = jamo[0:2] + DOUBLE_TO_COMBINED[jamo[2:4]] + jamo[4:]
-        _LOG.debug('"%s" "%s"', hangul, jamo)
-    return jamo
 
+def to_hangul_groups(jamo_groups: t.Sequence[t.Tuple[str, int, int]], *,
+                     backend: str = 'python', **kwargs) -> t.List[t.Tuple[str, int, int]]:
+    """Convert all given jamo sequences into hangul sequences.
 
-def to_hangul_groups(jamo_groups: t.Sequence[t.Tuple[str, int, int]],
-                     **kwargs) -> t.List[t.Tuple[str, int, int]]:
-    """Convert all given jamo sequences into hangul sequences."""
+    Backend is one of BACKENDS. The 'numpy' backend splits each distinct sequence only once
+    and composes hangul for all sequences at once, which is faster for large batches
+    in which sequences repeat, and falls back to 'python' if NumPy is not installed
+    or if a lexicon is given. Results are cached if caching is enabled, except when warnings
+    about ambiguity are asked for, so that they are logged on every call.
+    """
+    hangul_cache = _HANGUL_CACHE
+    if hangul_cache is None or kwargs.get('warn'):
+        hangul_list = _jamo_groups_to_hangul(
+            [jamo_group for jamo_group, _, _ in jamo_groups], backend, **kwargs)
+    else:
+        options = tuple(sorted(kwargs.items()))
+        hangul_list = [hangul_cache.get((jamo_group, options)) for jamo_group, _, _ in jamo_groups]
+        missing = [i for i, hangul in enumerate(hangul_list) if hangul is None]
+        converted = _jamo_groups_to_hangul(
+            [jamo_groups[i][0] for i in missing], backend, **kwargs)
+        for i, hangul in zip(missing, converted):
+            hangul_list[i] = hangul
+            hangul_cache.put((jamo_groups[i][0], options), hangul)
     hangul_groups = []
-    for jamo_group, begin, end in jamo_groups:
-        hangul = jamo_to_hangul(jamo_group, **kwargs)
-        _LOG.debug('to_hangul_groups: "%s" %s %i:%i', hangul, jamo_group, begin, end)
+    tracing = _LOG.isEnabledFor(logging.DEBUG)
+    for hangul, (jamo_group, begin, end) in zip(hangul_list, jamo_groups):
+        if tracing:
+            _LOG.debug('to_hangul_groups: "%s" %s %i:%i', hangul, jamo_group, begin, end)
         hangul_groups.append((hangul, begin, end))
     return hangul_groups
 
 
-def to_hangul(text: str, **kwargs) -> str:
-    """Convert romanized korean text into hangul."""
-    hangul = text
-    hangul_groups = to_hangul_groups(to_jamo_groups(text), **kwargs)
-    for hangul_group, begin, end in reversed(hangul_groups):
-        _LOG.debug('to_hangul: "%s" %s %i:%i', hangul, hangul_group, begin, end)
-        hangul = substitute_text(hangul, hangul_group, begin, end)
-    _LOG.debug('to_hangul: "%s"', hangul)
-    return hangul
+def to_hangul(text: str, *, scheme: t.Optional[str] = None, **kwargs) -> str:
+    """Convert romanized korean text into hangul.
+
+    Romanization scheme is chosen like in to_jamo_groups(). Other keyword arguments
+    are passed on to to_hangul_groups() and jamo_to_hangul().
+    """
+    hangul_groups = to_hangul_groups(to_jamo_groups(text, scheme=scheme), **kwargs)
+    _trace_groups('to_hangul', hangul_groups)
+    return substitute_groups(text, hangul_groups)
+
+
+def to_hangul_with_offsets(text: str, *, scheme: t.Optional[str] = None,
+                           **kwargs) -> t.Tuple[str, OffsetMap]:
+    """Convert romanized korean text into hangul, and map each character to its span in the text.
+
+    Hangul converted from one jamo group maps to the span of the whole group.
+    Keyword arguments are passed on like in to_hangul().
+    """
+    hangul_groups = to_hangul_groups(to_jamo_groups(text, scheme=scheme), **kwargs)
+    _trace_groups('to_hangul', hangul_groups)
+    return substitute_groups_with_offsets(text, hangul_groups)
+
+
+def to_hangul_candidates(
+        text: str, count: int = 5, *, scheme: t.Optional[str] = None,
+        model: t.Optional[t.Any] = None, aggressive: bool = True,
+        beam_width: int = CANDIDATES_BEAM_WIDTH,
+        time_budget: t.Optional[float] = CANDIDATES_TIME_BUDGET) -> t.List[str]:
+    """List at most count best ways in which romanized korean text can be converted into hangul.
+
+    Candidates of each jamo group are found like in jamo_to_hangul_candidates(), and the best
+    combinations of them are kept group by group. The time budget is shared by all groups.
+    Raise InvalidJamoError if any group cannot be converted.
+    """
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    # best combinations so far, as negated score, ranks of candidates and hangul groups
+    combinations = [(0.0, (), ())]  # type: t.List[t.Tuple[float, t.Tuple[int, ...], tuple]]
+    for jamo, begin, end in to_jamo_groups(text, scheme=scheme):
+        jamo = validate_jamo(jamo)
+        candidates = _scored_candidates(jamo, count, model, aggressive, beam_width, deadline)
+        if not candidates:
+            jamo_to_hangul(jamo, aggressive=aggressive)  # raises InvalidJamoError
+        combinations = heapq.nsmallest(count, (
+            (negated_score + negated_group_score, ranks + (rank,),
+             hangul_groups + ((hangul, begin, end),))
+            for negated_score, ranks, hangul_groups in combinations
+            for rank, (negated_group_score, _, hangul) in enumerate(candidates)))
+    return [substitute_groups(text, hangul_groups) for _, _, hangul_groups in combinations]
+
+
+def to_hangul_stream(readable: t.Union[t.TextIO, t.Iterable[str]], chunk_size: int = 65536,
+                     **kwargs) -> t.Iterator[str]:
+    """Convert romanized korean text into hangul chunk by chunk.
+
+    The text is read from a file-like object (in chunks of given size) or from an iterable
+    of strings. Text that follows the last interruptor read so far is held back until
+    the next interruptor or the end of input, so that the result is the same as when converting
+    the whole text at once, and only the text since the last interruptor is kept in memory.
+    """
+    if hasattr(readable, 'read'):
+        chunks = iter(functools.partial(readable.read, chunk_size), '')
+    else:
+        chunks = iter(readable)
+    pending = []  # type: t.List[str]
+    for chunk in chunks:
+        split = max(chunk.rfind(_) for _ in INTERRUPTORS) + 1
+        if split == 0:
+            pending.append(chunk)
+            continue
+        pending.append(chunk[:split])
+        yield to_hangul(''.join(pending), **kwargs)
+        pending = [chunk[split:]] if split < len(chunk) else []
+    if pending:
+        yield to_hangul(''.join(pending), **kwargs)
+
+
+# settings of this module applied in this worker process, see _worker_settings()
+_APPLIED_WORKER_SETTINGS = None  # type: t.Optional[tuple]
+
+
+# key to compare settings by, and the current tokenizer, which is compared by its name only
+_WorkerSettings = t.Tuple[tuple, t.Tuple[Tokenizer, PrefixTokenizer]]
+
+
+def _worker_settings() -> _WorkerSettings:
+    """Get settings that a worker process needs to convert text like this process does.
+
+    Worker processes that are spawned instead of forked start with default settings.
+    """
+    registered_schemes = tuple(
+        (name, tuple(sorted(elements.items())))
+        for name, elements in SCHEMES.items() if name not in SCHEME_TRIES)
+    cache = None if _HANGUL_CACHE is None \
+        else (_HANGUL_CACHE.maxsize, _TOKEN_CACHE is not None)
+    key = (registered_schemes, _SCHEME.name, _TOKENIZER_NAME, cache)
+    return key, (_TOKENIZER, _PREFIX_TOKENIZER)
+
+
+def _apply_worker_settings(settings: _WorkerSettings) -> None:
+    global _APPLIED_WORKER_SETTINGS
+    key, (tokenizer, prefix_tokenizer) = settings
+    if key == _APPLIED_WORKER_SETTINGS:
+        return
+    registered_schemes, scheme, tokenizer_name, cache = key
+    for name, elements in registered_schemes:
+        register_scheme(name, dict(elements))
+    set_scheme(scheme)
+    register_tokenizer(tokenizer_name, tokenizer, prefix_tokenizer)
+    set_tokenizer(tokenizer_name)
+    if cache is None:
+        disable_cache()
+    else:
+        enable_cache(cache[0], tokens=cache[1])
+    _APPLIED_WORKER_SETTINGS = key
+
+
+def _to_hangul_or_error(text: str, **kwargs) -> t.Union[str, Exception]:
+    try:
+        return to_hangul(text, **kwargs)
+    except (ValueError, AssertionError) as err:
+        return err
+
+
+def _to_hangul_or_error_in_worker(settings: _WorkerSettings, text: str,
+                                  **kwargs) -> t.Union[str, Exception]:
+    _apply_worker_settings(settings)
+    return _to_hangul_or_error(text, **kwargs)
+
+
+def to_hangul_many(texts: t.Iterable[str], *, jobs: t.Optional[int] = 1, chunksize: int = 1024,
+                   mp_context: t.Optional[t.Any] = None,
+                   **kwargs) -> t.List[t.Union[str, Exception]]:
+    """Convert many romanized korean texts into hangul, in order, using many processes if asked.
+
+    Each distinct text is converted only once, and texts are sent to the worker processes
+    in chunks. Conversion of a text that fails does not abort the batch: in such case the result
+    for that text is the exception that was raised. If jobs is None, all CPUs are used.
+    Workers are started from the given multiprocessing context, or the default one, and they use
+    the same scheme, tokenizer and caching as this process, including registered schemes
+    and tokenizers (which therefore have to be picklable).
+    """
+    texts = list(texts)
+    unique_texts = list(dict.fromkeys(texts))
+    if jobs == 1 or len(unique_texts) <= chunksize:
+        results = list(map(functools.partial(_to_hangul_or_error, **kwargs), unique_texts))
+    else:
+        import concurrent.futures
+        convert = functools.partial(_to_hangul_or_error_in_worker, _worker_settings(), **kwargs)
+        executor_kwargs = {} if mp_context is None else {'mp_context': mp_context}
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, **executor_kwargs) \
+                as executor:
+            results = list(executor.map(convert, unique_texts, chunksize=chunksize))
+    _LOG.debug('to_hangul_many: converted %i unique texts out of %i', len(unique_texts), len(texts))
+    hangul_by_text = dict(zip(unique_texts, results))
+    return [hangul_by_text[text] for text in texts]
@@ -0,0 +1,152 @@
+"""Romanized elements and jamo, as written by hand.
+
+Tables derived from them are in _tables module, which is generated by generate_tables module.
+"""
+
+VOWEL_BASES = ('a', 'i', 'u', 'e', 'o', 'eo', 'eu', 'ae', 'oe', 'ui')
+
+VOWEL_PREFIXES = ('', 'y', 'w')
+
+DOUBLED_CONSONANTS = ('g', 'd', 's', 'j', 'b')
+
+REMAINING_CONSONANTS = ('k', 't', 'ch', 'h', 'p', 'm', 'ng', 'r', 'n')
+
+RELATED_CONSONANTS = ()
+
+ELEMENTS = {
+    'a': 'ㅏ', 'ya': 'ㅑ', 'wa': 'ㅘ',
+    'i': 'ㅣ', 'wi': 'ㅟ',
+    'u': 'ㅜ', 'yu': 'ㅠ',
+    'e': 'ㅔ', 'ye': 'ㅖ', 'we': 'ㅞ',
+    'o': 'ㅗ', 'yo': 'ㅛ', 'wo': 'ㅝ',
+    'eo': 'ㅓ', 'yeo': 'ㅕ',
+    'eu': 'ㅡ',
+    'ae': 'ㅐ', 'yae': 'ㅒ', 'wae': 'ㅙ',
+    'oe': 'ㅚ',
+    'ui': 'ㅢ',
+    'k': 'ㅋ',
+    'g': 'ㄱ', 'gg': 'ㄲ',
+    't': 'ㅌ',
+    'd': 'ㄷ', 'dd': 'ㄸ',
+    's': 'ㅅ', 'ss': 'ㅆ',
+    'j': 'ㅈ', 'jj': 'ㅉ',
+    'ch': 'ㅊ',
+    'h': 'ㅎ',
+    'b': 'ㅂ', 'bb': 'ㅃ',
+    'p': 'ㅍ',
+    'm': 'ㅁ',
+    'ng': 'ㅇ',
+    'r': 'ㄹ',
+    'n': 'ㄴ'}
+
+# synonyms
+ELEMENTS['kk'] = ELEMENTS['gg']
+ELEMENTS['tt'] = ELEMENTS['dd']
+ELEMENTS['pp'] = ELEMENTS['bb']
+ELEMENTS['l'] = ELEMENTS['r']
+
+# other romanization schemes, each maps romanized elements to jamo in the same way as ELEMENTS
+
+MCCUNE_REISCHAUER_ELEMENTS = {
+    'a': 'ㅏ', 'ya': 'ㅑ', 'wa': 'ㅘ',
+    'i': 'ㅣ', 'wi': 'ㅟ',
+    'u': 'ㅜ', 'yu': 'ㅠ',
+    'e': 'ㅔ', 'ye': 'ㅖ', 'we': 'ㅞ',
+    'o': 'ㅗ', 'yo': 'ㅛ', 'wŏ': 'ㅝ',
+    'ŏ': 'ㅓ', 'yŏ': 'ㅕ',
+    'ŭ': 'ㅡ',
+    'ae': 'ㅐ', 'yae': 'ㅒ', 'wae': 'ㅙ',
+    'oe': 'ㅚ',
+    'ŭi': 'ㅢ',
+    "k'": 'ㅋ',
+    'k': 'ㄱ', 'g': 'ㄱ', 'kk': 'ㄲ',
+    "t'": 'ㅌ',
+    't': 'ㄷ', 'd': 'ㄷ', 'tt': 'ㄸ',
+    's': 'ㅅ', 'sh': 'ㅅ', 'ss': 'ㅆ',
+    'ch': 'ㅈ', 'j': 'ㅈ', 'tch': 'ㅉ',
+    "ch'": 'ㅊ',
+    'h': 'ㅎ',
+    'p': 'ㅂ', 'b': 'ㅂ', 'pp': 'ㅃ',
+    "p'": 'ㅍ',
+    'm': 'ㅁ',
+    'ng': 'ㅇ',
+    'r': 'ㄹ', 'l': 'ㄹ',
+    'n': 'ㄴ'}
+
+YALE_ELEMENTS = {
+    'a': 'ㅏ', 'ya': 'ㅑ', 'wa': 'ㅘ',
+    'i': 'ㅣ', 'wi': 'ㅟ',
+    'wu': 'ㅜ', 'yu': 'ㅠ',
+    'ey': 'ㅔ', 'yey': 'ㅖ', 'wey': 'ㅞ',
+    'o': 'ㅗ', 'yo': 'ㅛ', 'we': 'ㅝ',
+    'e': 'ㅓ', 'ye': 'ㅕ',
+    'u': 'ㅡ',
+    'ay': 'ㅐ', 'yay': 'ㅒ', 'way': 'ㅙ',
+    'oy': 'ㅚ',
+    'uy': 'ㅢ',
+    'kh': 'ㅋ',
+    'k': 'ㄱ', 'kk': 'ㄲ',
+    'th': 'ㅌ',
+    't': 'ㄷ', 'tt': 'ㄸ',
+    's': 'ㅅ', 'ss': 'ㅆ',
+    'c': 'ㅈ', 'cc': 'ㅉ',
+    'ch': 'ㅊ',
+    'h': 'ㅎ',
+    'p': 'ㅂ', 'pp': 'ㅃ',
+    'ph': 'ㅍ',
+    'm': 'ㅁ',
+    'ng': 'ㅇ',
+    'l': 'ㄹ',
+    'n': 'ㄴ'}
+
+# romanization schemes by name, ELEMENTS are the Revised Romanization with a few additions
+SCHEMES = {
+    'revised': ELEMENTS,
+    'mccune-reischauer': MCCUNE_REISCHAUER_ELEMENTS,
+    'yale': YALE_ELEMENTS}
+
+DOUBLE_TO_COMBINED = {
+    'ㅗㅏ': 'ㅘ', 'ㅜㅣ': 'ㅟ', 'ㅜㅔ': 'ㅞ', 'ㅜㅓ': 'ㅝ', 'ㅗㅐ': 'ㅙ', 'ㅗㅣ': 'ㅚ', 'ㅡㅣ': 'ㅢ',
+    'ㄱㄱ': 'ㄲ', 'ㄷㄷ': 'ㄸ', 'ㅅㅅ': 'ㅆ', 'ㅈㅈ': 'ㅉ', 'ㅂㅂ': 'ㅃ', 'ㄱㅅ': 'ᆪ', 'ㄴㅈ': 'ᆬ',
+    'ㄴㅎ': 'ᆭ', 'ㄹㄱ': 'ᆰ', 'ㄹㅁ': 'ᆱ', 'ㄹㅂ': 'ᆲ', 'ㄹㅅ': 'ᆳ', 'ㄹㅌ': 'ᆴ', 'ㄹㅍ': 'ᆵ',
+    'ㄹㅎ': 'ᆶ', 'ㅂㅅ': 'ᆹ'}
+
+# head jamo
+
+SINGLE_HEAD_JAMO = {'ㄱ', 'ㄴ', 'ㄷ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅅ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'}
+
+DOUBLE_HEAD_JAMO = {'ㄱㄱ', 'ㄷㄷ', 'ㅂㅂ', 'ㅅㅅ', 'ㅈㅈ'}
+
+# body jamo
+
+SINGLE_BODY_JAMO = {'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅛ', 'ㅜ', 'ㅠ', 'ㅡ', 'ㅣ'}
+
+DOUBLE_BODY_JAMO = {'ㅗㅏ', 'ㅗㅐ', 'ㅗㅣ', 'ㅜㅓ', 'ㅜㅔ', 'ㅜㅣ', 'ㅡㅣ'}
+
+# tail jamo
+
+SINGLE_TAIL_JAMO = {'ㄱ', 'ㄴ', 'ㄷ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅅ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'}
+
+DOUBLE_TAIL_JAMO = {
+    'ㄱㄱ', 'ㄱㅅ', 'ㄴㅈ', 'ㄴㅎ', 'ㄹㄱ', 'ㄹㅁ', 'ㄹㅂ', 'ㄹㅅ', 'ㄹㅌ', 'ㄹㅍ', 'ㄹㅎ', 'ㅂㅅ', 'ㅅㅅ'}
+
+# other characters
+
+WHITESPACE = {' ', '\t', '\n', '\r\n'}
+
+PUNCTUATION = {',', '.', '?', '!', ';', ':', '(', ')', '[', ']', '{', '}', '<', '>'}
+
+DISAMBIGUATORS = {'-'}
+
+SUBSTITUTED = {'ᅪ': 'ㅘ', 'ᅳ': 'ㅡ', 'ᄄ': 'ㄸ', 'ᄍ': 'ㅉ'}
+
+# composition of hangul syllables
+
+HANGUL_SYLLABLES_BASE = 0xAC00
+
+# compatibility jamo in the order of their indices in the Unicode hangul syllable composition
+HEAD_ORDER = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+
+BODY_ORDER = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+
+TAIL_ORDER = 'ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ'
@@ -0,0 +1,89 @@
+"""Syllable frequencies learned from a word list, for ranking candidate conversions.
+
+A model is built from hangul words with their counts, e.g. from a frequency list with
+one word and its count per line:
+
+    model = FrequencyModel.load('frequencies.txt')
+    jamo_to_hangul_candidates(jamo, model=model)
+
+Each syllable is scored by how often it follows the previous syllable within words,
+backing off to how often it occurs at all. Counts of all syllables are kept in one array,
+and only pairs of syllables seen often enough are kept in a dictionary.
+"""
+
+import array
+import math
+import typing as t
+
+from .elements import HANGUL_SYLLABLES_BASE
+
+HANGUL_SYLLABLES_COUNT = 11172
+
+# weight of the score of a syllable alone when its pair with the previous one was not seen
+_BACKOFF = math.log(0.4)
+
+
+class FrequencyModel:
+
+    """Model scoring a hangul syllable given the syllable that precedes it.
+
+    Scores are natural logarithms of probabilities, so that the score of a sequence
+    is the sum of scores of its syllables, and higher is better.
+    """
+
+    __slots__ = ('_unigrams', '_bigrams')
+
+    def __init__(self, unigrams: t.Iterable[float], bigrams: t.Mapping[str, float]):
+        self._unigrams = array.array('f', unigrams)
+        if len(self._unigrams) != HANGUL_SYLLABLES_COUNT:
+            raise ValueError('expected {} syllable scores, got {}'.format(
+                HANGUL_SYLLABLES_COUNT, len(self._unigrams)))
+        self._bigrams = dict(bigrams)
+
+    @classmethod
+    def from_counts(cls, word_counts: t.Iterable[t.Tuple[str, int]], *,
+                    min_count: int = 1) -> 'FrequencyModel':
+        """Build model from pairs of words and their counts.
+
+        Characters other than hangul syllables split words. Pairs of syllables seen less
+        than min_count times are not kept.
+        """
+        syllable_counts = [0] * HANGUL_SYLLABLES_COUNT
+        pair_counts = {}  # type: t.Dict[str, int]
+        for word, count in word_counts:
+            previous = None
+            for char in word:
+                index = ord(char) - HANGUL_SYLLABLES_BASE
+                if not 0 <= index < HANGUL_SYLLABLES_COUNT:
+                    previous = None
+                    continue
+                syllable_counts[index] += count
+                if previous is not None:
+                    pair = previous + char
+                    pair_counts[pair] = pair_counts.get(pair, 0) + count
+                previous = char
+        total = sum(syllable_counts) + HANGUL_SYLLABLES_COUNT
+        # every syllable is counted once more, so that unseen ones are possible too
+        unigrams = [math.log((_ + 1) / total) for _ in syllable_counts]
+        bigrams = {
+            pair: math.log(count / syllable_counts[ord(pair[0]) - HANGUL_SYLLABLES_BASE])
+            for pair, count in pair_counts.items() if count >= min_count}
+        return cls(unigrams, bigrams)
+
+    @classmethod
+    def load(cls, path: str, *, min_count: int = 1) -> 'FrequencyModel':
+        """Build model from a text file with a word and optionally its count on each line."""
+        def word_counts(lines):
+            for line in lines:
+                fields = line.split()
+                if fields:
+                    yield fields[0], int(fields[1]) if len(fields) > 1 else 1
+        with open(path, encoding='utf-8') as words_file:
+            return cls.from_counts(word_counts(words_file), min_count=min_count)
+
+    def score(self, previous: str, syllable: str) -> float:
+        """Score syllable that follows the previous syllable, which is empty if there is none."""
+        unigram = self._unigrams[ord(syllable) - HANGUL_SYLLABLES_BASE]
+        if not previous:
+            return unigram
+        return self._bigrams.get(previous + syllable, _BACKOFF + unigram)
@@ -0,0 +1,171 @@
+"""Generating tables derived from romanized elements and jamo, as literals in _tables module.
+
+Run after changing elements module:
+
+    python -m romanized_korean_ime.generate_tables
+
+The derived tables are frozen as literals so that they do not have to be built each time
+the package is imported.
+"""
+
+import itertools
+import pathlib
+import re
+import typing as t
+
+from .elements import \
+    VOWEL_BASES, VOWEL_PREFIXES, ELEMENTS, DOUBLE_TO_COMBINED, \
+    SINGLE_HEAD_JAMO, DOUBLE_HEAD_JAMO, SINGLE_BODY_JAMO, DOUBLE_BODY_JAMO, \
+    SINGLE_TAIL_JAMO, DOUBLE_TAIL_JAMO, WHITESPACE, PUNCTUATION, DISAMBIGUATORS, SUBSTITUTED, \
+    HEAD_ORDER, BODY_ORDER, TAIL_ORDER, SCHEMES
+
+TABLES_PATH = pathlib.Path(__file__).with_name('_tables.py')
+
+
+def build_elements_trie(elements: t.Mapping[str, str]) -> t.Dict[str, t.Any]:
+    """Build a trie of romanized elements, in which each node maps characters to child nodes.
+
+    A node that ends a romanized element stores the corresponding jamo under the empty string key.
+    """
+    trie = {}  # type: t.Dict[str, t.Any]
+    for romanization, jamo in elements.items():
+        node = trie
+        for char in romanization:
+            node = node.setdefault(char, {})
+        node[''] = jamo
+    return trie
+
+
+def build_elements_regex(trie: t.Mapping[str, t.Any]) -> str:
+    """Build a regular expression that matches the longest romanized element from the trie.
+
+    Alternatives are nested like the trie nodes, so that the regex engine can reject them by their
+    first character, and longer elements are tried first thanks to the greedy optional groups.
+    """
+    alternatives = []
+    for char, node in sorted(trie.items()):
+        if not char:
+            continue
+        alternative = re.escape(char)
+        rest = build_elements_regex(node)
+        if rest:
+            alternative += '(?:{}){}'.format(rest, '?' if '' in node else '')
+        alternatives.append(alternative)
+    return '|'.join(alternatives)
+
+
+def build_jamo_normalization(all_jamo: t.AbstractSet[str]) -> t.Dict[int, str]:
+    """Build a str.translate() table that maps each jamo to its version used in ALL_JAMO.
+
+    Conjoining jamo are mapped to compatibility jamo, except for combined tails,
+    which in ALL_JAMO are conjoining, and so their compatibility versions are mapped to them.
+    """
+    normalization = dict(SUBSTITUTED)
+    normalization.update({chr(0x1100 + i): jamo for i, jamo in enumerate(HEAD_ORDER)})
+    normalization.update({chr(0x1161 + i): jamo for i, jamo in enumerate(BODY_ORDER)})
+    for i, jamo in enumerate(TAIL_ORDER, 1):
+        if jamo in all_jamo:
+            normalization[chr(0x11A7 + i)] = jamo
+        else:
+            normalization[jamo] = chr(0x11A7 + i)
+    assert set(normalization.values()) <= all_jamo, set(normalization.values()) - all_jamo
+    return str.maketrans({k: v for k, v in normalization.items() if k != v})
+
+
+def derive_tables() -> t.Dict[str, t.Any]:
+    """Derive all tables from the romanized elements and jamo."""
+    tables = {}  # type: t.Dict[str, t.Any]
+    tables['VOWELS'] = frozenset(
+        ELEMENTS[prefix + base] for prefix, base in itertools.product(VOWEL_PREFIXES, VOWEL_BASES)
+        if prefix + base in ELEMENTS)
+    tables['COMBINED_TO_DOUBLE'] = {v: k for k, v in DOUBLE_TO_COMBINED.items()}
+    for position, single, double in (('HEAD', SINGLE_HEAD_JAMO, DOUBLE_HEAD_JAMO),
+                                     ('BODY', SINGLE_BODY_JAMO, DOUBLE_BODY_JAMO),
+                                     ('TAIL', SINGLE_TAIL_JAMO, DOUBLE_TAIL_JAMO)):
+        combined = frozenset(DOUBLE_TO_COMBINED[_] for _ in double)
+        tables['COMBINED_{}_JAMO'.format(position)] = combined
+        tables['{}_JAMO'.format(position)] = frozenset(single) | combined
+    tables['ALL_JAMO'] = tables['HEAD_JAMO'] | tables['BODY_JAMO'] | tables['TAIL_JAMO']
+    tables['IGNORED_CHARACTERS'] = frozenset(WHITESPACE | PUNCTUATION)
+    tables['ALL_UNAMBIGUOUS_JAMO'] = tables['ALL_JAMO'] | DISAMBIGUATORS
+    tables['INTERRUPTORS'] = tables['IGNORED_CHARACTERS'] | DISAMBIGUATORS
+    # indices of both compatibility jamo and conjoining jamo (i.e. choseong, jungseong, jongseong)
+    tables['HEAD_INDEX'] = {
+        **{jamo: i for i, jamo in enumerate(HEAD_ORDER)},
+        **{chr(0x1100 + i): i for i in range(len(HEAD_ORDER))}}
+    tables['BODY_INDEX'] = {
+        **{jamo: i for i, jamo in enumerate(BODY_ORDER)},
+        **{chr(0x1161 + i): i for i in range(len(BODY_ORDER))}}
+    tables['TAIL_INDEX'] = {
+        '': 0,
+        **{jamo: i for i, jamo in enumerate(TAIL_ORDER, 1)},
+        **{chr(0x11A7 + i): i for i in range(1, len(TAIL_ORDER) + 1)}}
+    tables['JAMO_NORMALIZATION'] = build_jamo_normalization(tables['ALL_JAMO'])
+    # lookup structures of each romanization scheme, compiled here so that they are loaded as is
+    tables['SCHEME_TRIES'] = {name: build_elements_trie(elements)
+                              for name, elements in SCHEMES.items()}
+    tables['SCHEME_REGEXES'] = {name: build_elements_regex(trie)
+                                for name, trie in tables['SCHEME_TRIES'].items()}
+    return tables
+
+
+def _wrapped(opening: str, items: t.Iterable[str], closing: str, width: int = 96) -> str:
+    """Format items of a collection literal in lines of limited width.
+
+    Items that span several lines are put on lines of their own.
+    """
+    lines = []
+    line = ''
+    for item in items:
+        if line and ('\n' in item or len(line) + len(item) + 1 > width):
+            lines.append(line.rstrip())
+            line = ''
+        line += item.replace('\n', '\n    ') + ', '
+        if '\n' in item:
+            lines.append(line.rstrip())
+            line = ''
+    if line:
+        lines.append(line.rstrip())
+    lines[-1] = lines[-1].rstrip(',') + closing
+    return opening + '\n' + '\n'.join('    ' + _ for _ in lines)
+
+
+def _item(key: t.Any, value: t.Any, width: int) -> str:
+    """Format an item of a dict literal, wrapping its value if the item is too long."""
+    item = '{!r}: {!r}'.format(key, value)
+    if len(item) <= width or not isinstance(value, (dict, frozenset, str)):
+        return item
+    return '{!r}: {}'.format(key, _literal(value, width - 4))
+
+
+def _literal(value: t.Any, width: int = 96) -> str:
+    if isinstance(value, frozenset):
+        return _wrapped('frozenset({', [repr(_) for _ in sorted(value)], '})', width)
+    if isinstance(value, dict):
+        return _wrapped('{', [_item(k, v, width) for k, v in value.items()], '}', width)
+    assert isinstance(value, str), type(value)
+    # long strings are split into adjacent literals
+    chunks = [repr(value[i:i + width - 16]) for i in range(0, len(value), width - 16)]
+    return '(\n' + '\n'.join('    ' + _ for _ in chunks) + ')'
+
+
+def generate_tables() -> str:
+    """Generate source code of _tables module."""
+    lines = [
+        '"""Tables derived from romanized elements and jamo.',
+        '',
+        'Generated by generate_tables module, do not edit.',
+        '"""',
+        '']
+    for name, value in derive_tables().items():
+        lines += ['{} = {}'.format(name, _literal(value)), '']
+    return '\n'.join(lines)
+
+
+def main():
+    with TABLES_PATH.open('w', encoding='utf-8') as tables_file:
+        tables_file.write(generate_tables())
+
+
+if __name__ == '__main__':
+    main()
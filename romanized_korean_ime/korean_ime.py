@@ -1,46 +1,215 @@
 """IME input alike the Japanese IME but for hangul."""
 
+import array
+import collections
 import logging
-# import typing as t
-
-from .deromanize_hangul import to_jamo_groups, substitute_text, to_hangul_groups, to_jamo
+import os
+import re
+import typing as t
+import unicodedata
+
+from .deromanize_hangul import \
+    INTERRUPTORS, match_element, to_jamo_groups, to_jamo_groups_prefix, substitute_groups, \
+    substitute_groups_with_offsets, jamo_to_hangul_prefix, jamo_to_hangul_candidates, to_jamo, \
+    to_jamo_with_offsets, syllables_at, compile_scheme, get_scheme
+from .offset_map import OffsetMap
+from .syllables import _SYLLABLE_MAX_LEN
 
 _LOG = logging.getLogger(__name__)
 
+_INTERRUPTOR_CHARACTERS = ''.join(sorted(set(''.join(INTERRUPTORS))))
+
+# text up to and including a run of interruptors
+_SEGMENT = re.compile('[^{0}]*[{0}]*'.format(re.escape(_INTERRUPTOR_CHARACTERS)))
+
+
+def display_width(text: str) -> int:
+    """Count terminal columns taken by the text, given that hangul and jamo are double-width."""
+    # width of each distinct character is looked up once
+    return len(text) + sum(count for char, count in collections.Counter(text).items()
+                           if unicodedata.east_asian_width(char) in ('W', 'F'))
+
+
+def cursor_movement(output: str, begin: int, end: int) -> str:
+    """Create terminal output that moves the cursor within displayed output."""
+    if end <= begin:
+        return display_width(output[end:begin]) * '\b'
+    return output[begin:end]
+
+
+def output_delta(previous_output: str, output: str,
+                 previous_cursor: t.Optional[int] = None, cursor: t.Optional[int] = None,
+                 suffix: str = '') -> str:
+    """Create terminal output that turns previously displayed output into the current output.
+
+    Only the part after the common prefix of both outputs is erased and written again.
+    Cursor positions are given as offsets in the outputs, and by default the cursor is
+    after the output. If both outputs are followed by the same suffix, it is written again
+    only if the outputs differ, and then the cursor is moved back before it.
+    """
+    if previous_cursor is None:
+        previous_cursor = len(previous_output)
+    if cursor is None:
+        cursor = len(output)
+    common_len = len(os.path.commonprefix([previous_output, output]))
+    if common_len == len(previous_output) == len(output):
+        return cursor_movement(output, previous_cursor, cursor)
+    erased_width = display_width(previous_output[common_len:])
+    written = output[common_len:]
+    padding_width = max(0, erased_width - display_width(written))
+    return '{}{}{}{}{}'.format(
+        cursor_movement(previous_output, previous_cursor, common_len), written + suffix,
+        padding_width * ' ', padding_width * '\b',
+        display_width(output[cursor:] + suffix) * '\b')
+
 
 class KoreanIME:
 
-    """Korean IME."""
+    """Korean IME.
 
-    def __init__(self):
-        # stores text that could not be converted yet
-        self._unconverted_text = ''
+    Text that was typed is either committed or uncommitted. Committed text is never converted
+    again. It is kept in a single string together with a single string of its output,
+    and boundaries of committed segments in both strings are kept in one array.
+
+    Uncommitted text is split by two offsets into text that was converted into hangul,
+    text that could be converted only into jamo, and text that could not be converted yet.
+    Only the hangul is stored, and jamo is converted again from the text when needed.
+
+    Attributes are kept in slots, so that a server can keep many sessions in little memory.
+    """
 
-        # text that could be already converted to jamo but not to hangul
-        self._unconverted_jamo = ''
-        self._jamo_text = ''
+    __slots__ = ('_committed_text', '_committed_output', '_boundaries',
+                 '_text', '_hangul_end', '_jamo_end', '_hangul')
 
-        # text that could be already converted to hangul
+    def __init__(self):
+        self._committed_text = ''
+        self._committed_output = ''
+        # for each committed segment, end of its text, end of its hangul in committed output
+        # and end of its output; the output of a segment is its hangul followed by interruptors
+        self._boundaries = array.array('I')
+
+        # uncommitted text, and ends of its parts converted into hangul and into jamo
+        self._text = ''
+        self._hangul_end = 0
+        self._jamo_end = 0
         self._hangul = ''
-        self._hangul_jamo = ''
-        self._hangul_text = ''
+
+    @property
+    def _segments(self) -> t.List[t.Tuple[str, str, str, str]]:
+        """Committed segments, as tuples of text, jamo, hangul and output."""
+        segments = []
+        text_begin = 0
+        output_begin = 0
+        boundaries = self._boundaries
+        for i in range(0, len(boundaries), 3):
+            text_end, hangul_end, output_end = boundaries[i:i + 3]
+            text = self._committed_text[text_begin:text_end]
+            segments.append((text, to_jamo(text), self._committed_output[output_begin:hangul_end],
+                             self._committed_output[output_begin:output_end]))
+            text_begin = text_end
+            output_begin = output_end
+        return segments
 
     @property
     def text(self):
-        return self._hangul_text + self._jamo_text + self._unconverted_text
+        return self._committed_text + self._text
 
     @property
     def jamo(self):
-        return self._hangul_jamo + self._unconverted_jamo
+        return ''.join(jamo for _, jamo, _, _ in self._segments) \
+            + self._hangul_jamo + self._unconverted_jamo
 
     @property
     def hangul(self):
-        return self._hangul
+        if self._hangul:
+            return self._committed_output + self._hangul
+        boundaries = self._boundaries
+        for i in range(len(boundaries) - 3, -1, -3):
+            output_begin = boundaries[i - 1] if i else 0
+            hangul_end = boundaries[i + 1]
+            if hangul_end > output_begin:
+                return self._committed_output[:hangul_end]
+        return ''
 
     @property
     def output(self):
+        return self._committed_output + self._uncommitted_output
+
+    @property
+    def _hangul_text(self):
+        return self._text[:self._hangul_end]
+
+    @property
+    def _jamo_text(self):
+        return self._text[self._hangul_end:self._jamo_end]
+
+    @property
+    def _unconverted_text(self):
+        return self._text[self._jamo_end:]
+
+    @property
+    def _hangul_jamo(self):
+        return to_jamo(self._hangul_text)
+
+    @property
+    def _unconverted_jamo(self):
+        return to_jamo(self._jamo_text)
+
+    @property
+    def _uncommitted_text(self):
+        return self._text
+
+    @property
+    def _uncommitted_output(self):
         return self._hangul + self._unconverted_jamo + self._unconverted_text
 
+    def commit(self) -> bool:
+        """Commit the text that was converted into hangul, and the interruptors that follow it.
+
+        Return True if anything was committed.
+        """
+        jamo_text = self._jamo_text
+        interruptors_len = len(jamo_text) - len(jamo_text.lstrip(_INTERRUPTOR_CHARACTERS))
+        if not self._hangul_end and not interruptors_len:
+            return False
+        end = self._hangul_end + interruptors_len
+        text = self._text[:end]
+        _LOG.debug('committing %s', repr(text))
+        self._committed_text += text
+        self._committed_output += self._hangul
+        hangul_end = len(self._committed_output)
+        # interruptors are left as they are in both jamo and output
+        self._committed_output += text[self._hangul_end:]
+        self._boundaries.extend((len(self._committed_text), hangul_end,
+                                 len(self._committed_output)))
+        self._text = self._text[end:]
+        self._jamo_end -= end
+        self._hangul_end = 0
+        self._hangul = ''
+        return True
+
+    def uncommit(self) -> bool:
+        """Bring back the last committed segment so that it can be converted again.
+
+        This is possible only if there is no uncommitted text. Return True if anything was
+        uncommitted.
+        """
+        if not self._boundaries or self._text:
+            return False
+        _, hangul_end, output_end = self._boundaries[-3:]
+        del self._boundaries[-3:]
+        text_begin, _, output_begin = self._boundaries[-3:] if self._boundaries else (0, 0, 0)
+        text = self._committed_text[text_begin:]
+        _LOG.debug('uncommitting %s', repr(text))
+        self._committed_text = self._committed_text[:text_begin]
+        self._hangul = self._committed_output[output_begin:hangul_end]
+        self._committed_output = self._committed_output[:output_begin]
+        self._text = text
+        # the unconverted remainder of a committed segment consists only of interruptors
+        self._hangul_end = len(text) - (output_end - hangul_end)
+        self._jamo_end = len(text)
+        return True
+
 
 class GreedyKoreanIME(KoreanIME):
 
@@ -51,128 +220,409 @@ class GreedyKoreanIME(KoreanIME):
     - and try to convert as much as possible of jamo into hangul.
     """
 
-    def __init__(self):
-        super().__init__()
-        # self._jamo_groups = ''
+    __slots__ = ()
 
     def convert_text_to_jamo(self):
-        text = self.text
+        text = self._uncommitted_text
         if not text:
             return
-        _LOG.debug('converting %s to jamo', repr(text))
-        jamo_groups = []
-        end_of_conversion = 0
-        for i in range(len(text), 0, -1):
-            try:
-                jamo_groups = to_jamo_groups(text[:i])
-                end_of_conversion = i
-                _LOG.debug('settled on converting "%s"', text[:end_of_conversion])
-                break
-            except ValueError:
-                continue
+        tracing = _LOG.isEnabledFor(logging.DEBUG)
+        if tracing:
+            _LOG.debug('converting %s to jamo', repr(text))
+        _, end_of_conversion = to_jamo_groups_prefix(text)
+        if tracing:
+            _LOG.debug('settled on converting "%s"', text[:end_of_conversion])
         if end_of_conversion == 0:
             return
-        unconverted_jamo = text[:end_of_conversion]
-        for jamo, begin, end in reversed(jamo_groups):
-            unconverted_jamo = substitute_text(unconverted_jamo, jamo, begin, end)
-        self._unconverted_text = text[end_of_conversion:]
-        self._unconverted_jamo = unconverted_jamo
-        self._jamo_text = text[:end_of_conversion]
+        self._jamo_end = end_of_conversion
+        self._hangul_end = 0
         self._hangul = ''
-        self._hangul_jamo = ''
-        self._hangul_text = ''
 
-    def convert_jamo_to_hangul(self):
-        text = self._hangul_text + self._jamo_text
+    def convert_jamo_to_hangul(self) -> t.List[t.Tuple[str, int, int]]:
+        """Convert as much as possible of jamo into hangul, and return the hangul groups."""
+        text = self._text[:self._jamo_end]
         if not text:
-            return
-        _LOG.debug('converting %s to hangul', repr(text))
-        jamo_groups = []
+            return []
+        tracing = _LOG.isEnabledFor(logging.DEBUG)
+        if tracing:
+            _LOG.debug('converting %s to hangul', repr(text))
         hangul_groups = []
-        end_of_conversion = 0
-        for i in range(len(text), 0, -1):
-            try:
-                _LOG.debug('trying %i', i)
-                jamo_groups = to_jamo_groups(text[:i])
-                hangul_groups = to_hangul_groups(jamo_groups)
-                if not hangul_groups:
-                    continue
-                _LOG.debug('settled on converting %i jamo groups: %s',
-                           len(hangul_groups), hangul_groups)
-                end_of_conversion = hangul_groups[-1][2]
+        for jamo, begin, end in to_jamo_groups(text):
+            hangul, converted = jamo_to_hangul_prefix(jamo)
+            if converted < len(jamo):
+                # group is converted up to the element after which syllables stopped
+                end = begin
+                for _ in range(converted):
+                    _, end = match_element(text, end)
+                if hangul:
+                    hangul_groups.append((hangul, begin, end))
                 break
-            except AssertionError:
-                continue
-        if end_of_conversion == 0:
-            return
-
-        hangul = text[:end_of_conversion]
-        for hangul_group, begin, end in reversed(hangul_groups):
-            hangul = substitute_text(hangul, hangul_group, begin, end)
-        jamo = text[:end_of_conversion]
-        for jamo_group, begin, end in reversed(jamo_groups[:len(hangul_groups)]):
-            jamo = substitute_text(jamo, jamo_group, begin, end)
-
-        self._unconverted_jamo = to_jamo(text[end_of_conversion:])
-        self._jamo_text = text[end_of_conversion:]
-        self._hangul = hangul
-        self._hangul_jamo = jamo
-        self._hangul_text = text[:end_of_conversion]
+            hangul_groups.append((hangul, begin, end))
+        if tracing:
+            _LOG.debug('settled on converting %i jamo groups: %s',
+                       len(hangul_groups), hangul_groups)
+        if not hangul_groups:
+            return []
+        end_of_conversion = hangul_groups[-1][2]
+
+        self._hangul = substitute_groups(text[:end_of_conversion], hangul_groups)
+        self._hangul_end = end_of_conversion
+        return hangul_groups
+
+    @classmethod
+    def convert_with_offsets(cls, text: str) -> t.Tuple[str, OffsetMap]:
+        """Convert text as if it was typed into a new IME, and map its output to the text."""
+        ime = cls()
+        ime._text = text
+        ime.convert_text_to_jamo()
+        hangul_groups = ime.convert_jamo_to_hangul()
+        hangul, offsets = substitute_groups_with_offsets(ime._hangul_text, hangul_groups)
+        jamo, jamo_offsets = to_jamo_with_offsets(ime._jamo_text)
+        offsets.extend_shifted(jamo_offsets, ime._hangul_end)
+        offsets.append_copied(ime._jamo_end, len(text))
+        return hangul + jamo + ime._unconverted_text, offsets
+
+    def candidates(self, count: int = 5, **kwargs) -> t.List[str]:
+        """List best conversions of the last uncommitted jamo group converted into hangul.
+
+        Keyword arguments, e.g. the model and the time budget of the search, are passed on
+        to jamo_to_hangul_candidates(). The first candidate is the current conversion,
+        unless a model ranks another one higher.
+        """
+        jamo_groups = to_jamo_groups(self._hangul_text)
+        if not jamo_groups:
+            return []
+        return jamo_to_hangul_candidates(jamo_groups[-1][0], count, **kwargs)
 
     def type_printable_character(self, char: str) -> str:
         """Type one printable character into the IME."""
-        _LOG.info('typed "%s"', char)
-        output = self.output
-        output_len = len(output) + len(self._unconverted_jamo) + len(self._hangul)
+        tracing = _LOG.isEnabledFor(logging.INFO)
+        if tracing:
+            _LOG.info('typed "%s"', char)
+        output = self._uncommitted_output
 
-        self._unconverted_text = self._hangul_text + self._jamo_text + self._unconverted_text
-        self._unconverted_jamo = ''
-        self._jamo_text = ''
+        self._hangul_end = 0
+        self._jamo_end = 0
         self._hangul = ''
-        self._hangul_jamo = ''
-        self._hangul_text = ''
 
-        self._unconverted_text += char
+        self._text += char
         self.convert_text_to_jamo()
         self.convert_jamo_to_hangul()
-        _LOG.info('after conversion: "%s" ("%s", "%s"), "%s" ("%s"), "%s"',
-                  self._hangul, self._hangul_jamo, self._hangul_text,
-                  self._unconverted_jamo, self._jamo_text, self._unconverted_text)
-        _LOG.debug('all hangul: "%s"', self.hangul)
-        _LOG.debug('all jamo: "%s"', self.jamo)
-        _LOG.debug('all text: "%s"', self.text)
-
-        deleted_output = output_len * '\b'
-        _LOG.debug('previous output %s, len=%i', repr(output), output_len)
-        _LOG.debug('output deletion mask %s, len=%i', repr(deleted_output), len(deleted_output))
-        _LOG.debug('current output %s, len=%i', repr(self.output), len(self.output))
-
-        output_delta = '{}{}{}{}'.format(
-            deleted_output, output_len * ' ', deleted_output, self.output)
-        return output_delta
+        if tracing:
+            _LOG.info('after conversion: "%s" ("%s", "%s"), "%s" ("%s"), "%s"',
+                      self._hangul, self._hangul_jamo, self._hangul_text,
+                      self._unconverted_jamo, self._jamo_text, self._unconverted_text)
+            _LOG.debug('all hangul: "%s"', self.hangul)
+            _LOG.debug('all jamo: "%s"', self.jamo)
+            _LOG.debug('all text: "%s"', self.text)
+
+        delta = output_delta(output, self._uncommitted_output)
+        if tracing:
+            _LOG.debug('previous output %s', repr(output))
+            _LOG.debug('current output %s', repr(self._uncommitted_output))
+            _LOG.debug('output delta %s', repr(delta))
+        return delta
 
     def type_backspace(self) -> str:
         """Type backspace into the IME."""
-        _LOG.info('typed backspace')
-        output = self.output
-        output_len = len(output) + len(self._unconverted_jamo) + len(self._hangul)
+        tracing = _LOG.isEnabledFor(logging.INFO)
+        if tracing:
+            _LOG.info('typed backspace')
+        output = self._uncommitted_output
 
-        self._unconverted_text = self._hangul_text + self._jamo_text + self._unconverted_text
-        self._unconverted_jamo = ''
-        self._jamo_text = ''
+        self._hangul_end = 0
+        self._jamo_end = 0
         self._hangul = ''
-        self._hangul_jamo = ''
-        self._hangul_text = ''
 
-        self._unconverted_text = self._unconverted_text[:-1]
+        self._text = self._text[:-1]
         self.convert_text_to_jamo()
         self.convert_jamo_to_hangul()
-        _LOG.info('after conversion: "%s" ("%s", "%s"), "%s" ("%s"), "%s"',
-                  self._hangul, self._hangul_jamo, self._hangul_text,
-                  self._unconverted_jamo, self._jamo_text, self._unconverted_text)
+        if tracing:
+            _LOG.info('after conversion: "%s" ("%s", "%s"), "%s" ("%s"), "%s"',
+                      self._hangul, self._hangul_jamo, self._hangul_text,
+                      self._unconverted_jamo, self._jamo_text, self._unconverted_text)
+
+        return output_delta(output, self._uncommitted_output)
+
+
+class IncrementalKoreanIME(GreedyKoreanIME):
+
+    """Incremental Korean IME.
+
+    Works like the greedy IME, but whenever an interruptor is typed and all text typed so far
+    has been converted, the uncommitted text is committed. Syllables of the segment being typed
+    are committed too, once they are followed by enough characters to form any syllable that
+    could come next, because greedy conversion chooses a syllable by looking only that far
+    ahead. Each keystroke therefore re-converts only a few syllables at the end of the text,
+    regardless of how long the whole text is, even without interruptors, and the output
+    is identical to that of the greedy IME. Backspace brings such syllables back once they are
+    followed by too few characters again, and backspace typed right after a commit uncommits
+    the last segment.
+
+    Optionally, when the uncommitted text becomes longer than commit_limit, syllables that
+    were already converted into hangul are committed as well, as if a disambiguator was typed
+    after them. The last syllable is left uncommitted, and so are syllables followed by fewer
+    characters than the longest romanized element has, since the next keystroke could still
+    change them. This keeps keystroke latency bounded even for long text without interruptors,
+    at the cost of departing from the output of the greedy IME when a syllable is committed
+    before the jamo that would have changed it are typed.
+    """
+
+    __slots__ = ('_commit_limit',)
 
-        deleted_output = output_len * '\b'
+    def __init__(self, *, commit_limit: t.Optional[int] = None):
+        super().__init__()
+        self._commit_limit = commit_limit
+
+    def _is_converted(self) -> bool:
+        """Check if all uncommitted text was converted."""
+        return not self._unconverted_text and all(_ in INTERRUPTORS for _ in self._jamo_text)
+
+    def _syllable_ends(self) -> t.List[int]:
+        """List ends in text of syllables into which the first jamo group was converted.
+
+        The list is empty unless the uncommitted text starts with that group.
+        """
+        jamo_groups = to_jamo_groups(self._text[:self._jamo_end])
+        if not jamo_groups or jamo_groups[0][1] or not self._hangul_end:
+            return []
+        jamo = jamo_groups[0][0]
+        ends = []
+        begin = 0
+        text_end = 0
+        while begin < len(jamo) and text_end < self._hangul_end:
+            syllable_end = syllables_at(jamo, begin)[0][3]
+            for _ in range(syllable_end - begin):
+                _, text_end = match_element(self._text, text_end)
+            ends.append(text_end)
+            begin = syllable_end
+        return ends
+
+    def _commit_syllables(self, count: int, end: int) -> None:
+        """Commit the given number of leading syllables, converted from text up to end."""
+        text = self._text[:end]
+        _LOG.debug('committing syllables %s', repr(text))
+        self._committed_text += text
+        self._committed_output += self._hangul[:count]
+        self._boundaries.extend((len(self._committed_text), len(self._committed_output),
+                                 len(self._committed_output)))
+        self._text = self._text[end:]
+        self._hangul = self._hangul[count:]
+        self._hangul_end -= end
+        self._jamo_end -= end
+
+    def _commit_finished_syllables(self, elements_after: int) -> None:
+        """Commit syllables that precede the last one and that are followed by enough text.
+
+        Enough text is as long as the given number of the longest romanized elements.
+        """
+        margin = elements_after * compile_scheme(get_scheme()).max_element_len
+        ends = self._syllable_ends()[:-1]
+        while ends and ends[-1] + margin > len(self._text):
+            del ends[-1]
+        if ends:
+            self._commit_syllables(len(ends), ends[-1])
+
+    def _uncommit_syllables(self, text_len: int) -> None:
+        """Bring back committed syllables that would be followed by too little text.
+
+        The text would be as long as given. Segments ending with interruptors stay committed.
+        """
+        margin = _SYLLABLE_MAX_LEN * compile_scheme(get_scheme()).max_element_len
+        boundaries = self._boundaries
+        while boundaries and self._committed_text[-1] not in _INTERRUPTOR_CHARACTERS \
+                and boundaries[-3] + margin > text_len:
+            del boundaries[-3:]
+            text_begin, _, output_begin = boundaries[-3:] if boundaries else (0, 0, 0)
+            text = self._committed_text[text_begin:]
+            _LOG.debug('uncommitting syllables %s', repr(text))
+            self._text = text + self._text
+            self._hangul = self._committed_output[output_begin:] + self._hangul
+            self._hangul_end += len(text)
+            self._jamo_end += len(text)
+            self._committed_text = self._committed_text[:text_begin]
+            self._committed_output = self._committed_output[:output_begin]
+
+    def type_printable_character(self, char: str) -> str:
+        delta = super().type_printable_character(char)
+        if char in INTERRUPTORS and self._is_converted():
+            self.commit()
+        elif self._commit_limit is not None and len(self._uncommitted_text) > self._commit_limit:
+            self._commit_finished_syllables(1)
+        else:
+            # greedy conversion chooses each syllable by looking at most this many jamo ahead
+            self._commit_finished_syllables(_SYLLABLE_MAX_LEN)
+        return delta
 
-        output_delta = '{}{}{}{}'.format(
-            deleted_output, output_len * ' ', deleted_output, self.output)
-        return output_delta
+    def type_backspace(self) -> str:
+        self._uncommit_syllables(len(self._committed_text) + len(self._text) - 1)
+        self.uncommit()
+        return super().type_backspace()
+
+
+def split_segments(text: str) -> t.List[str]:
+    """Split text into segments, each ending after a run of interruptors."""
+    return [_ for _ in _SEGMENT.findall(text) if _]
+
+
+class EditableKoreanIME:
+
+    """Korean IME with a cursor that can be moved, and text that can be edited at the cursor.
+
+    Text is kept in segments that are split after each run of interruptors, and each segment
+    is converted on its own, in the same way as the greedy IME converts all of its text.
+    An edit converts again only the segment at the cursor, merged with its neighbours
+    or split if the edit moved the boundaries, so editing the middle of a long text costs
+    the same as typing at its end.
+
+    Like in other IMEs, each edit and cursor movement returns terminal output that updates
+    the displayed output. A cursor inside of a converted group of jamo is displayed before
+    the group.
+    """
+
+    __slots__ = ('_segments', '_index', '_offset')
+
+    def __init__(self):
+        # segments as tuples of text, output and map from output to text offsets
+        self._segments = []  # type: t.List[t.Tuple[str, str, OffsetMap]]
+
+        # cursor is at the offset in the text of the segment at the index; it is kept at the end
+        # of a segment rather than at the beginning of the next one
+        self._index = 0
+        self._offset = 0
+
+    @property
+    def text(self):
+        return ''.join(text for text, _, _ in self._segments)
+
+    @property
+    def output(self):
+        return ''.join(output for _, output, _ in self._segments)
+
+    @property
+    def cursor(self) -> int:
+        """Cursor position in the text."""
+        return sum(len(text) for text, _, _ in self._segments[:self._index]) + self._offset
+
+    @property
+    def output_cursor(self) -> int:
+        """Cursor position in the output."""
+        return self._output_cursor(0)
+
+    def _output_cursor(self, begin: int) -> int:
+        """Cursor position in output of segments starting from the one at the begin index."""
+        segments = self._segments
+        cursor = sum(len(output) for _, output, _ in segments[begin:self._index])
+        if self._index < len(segments):
+            cursor += segments[self._index][2].output_offset(self._offset)
+        return cursor
+
+    @staticmethod
+    def convert_segment(text: str) -> t.Tuple[str, str, OffsetMap]:
+        """Convert the segment like the greedy IME, and map its output to its text."""
+        output, offsets = GreedyKoreanIME.convert_with_offsets(text)
+        return text, output, offsets
+
+    def _set_cursor(self, index: int, offset: int) -> None:
+        """Place the cursor at the offset from the beginning of the segment at the index."""
+        segments = self._segments
+        while index < len(segments) and offset > len(segments[index][0]):
+            offset -= len(segments[index][0])
+            index += 1
+        if offset == 0 and index > 0:
+            index -= 1
+            offset = len(segments[index][0])
+        self._index = index
+        self._offset = offset
+
+    def _replace(self, begin: int, end: int, text: str, cursor: int) -> str:
+        """Replace segments between the indices with segments of the text.
+
+        Cursor is placed at the given offset in the text. Return the output delta.
+        """
+        segments = self._segments
+        # extend the replaced segments until boundaries of segments cannot change,
+        # and until the cursor is after the beginning of the first of them
+        while begin > 0 and (cursor == 0 or text and text[0] in _INTERRUPTOR_CHARACTERS):
+            begin -= 1
+            text = segments[begin][0] + text
+            cursor += len(segments[begin][0])
+        while end < len(segments) and text and text[-1] not in _INTERRUPTOR_CHARACTERS:
+            text += segments[end][0]
+            end += 1
+        previous_output = ''.join(output for _, output, _ in segments[begin:end])
+        previous_cursor = self._output_cursor(begin)
+        converted = {segment[0]: segment for segment in segments[begin:end]}
+        replacement = [converted[_] if _ in converted else self.convert_segment(_)
+                       for _ in split_segments(text)]
+        segments[begin:end] = replacement
+        self._set_cursor(begin, cursor)
+        end = begin + len(replacement)
+        return output_delta(
+            previous_output, ''.join(output for _, output, _ in replacement),
+            previous_cursor, self._output_cursor(begin),
+            ''.join(output for _, output, _ in segments[end:]))
+
+    def _edit(self, deleted_before: int, inserted: str, deleted_after: int) -> str:
+        """Delete characters before and after the cursor, and insert text at the cursor."""
+        segments = self._segments
+        begin = self._index
+        end = min(begin + 1, len(segments))
+        text = ''.join(text for text, _, _ in segments[begin:end])
+        cursor = self._offset
+        if deleted_after and cursor + deleted_after > len(text) and end < len(segments):
+            text += segments[end][0]
+            end += 1
+        if deleted_before > cursor or cursor + deleted_after > len(text):
+            return ''
+        text = text[:cursor - deleted_before] + inserted + text[cursor + deleted_after:]
+        return self._replace(begin, end, text, cursor - deleted_before + len(inserted))
+
+    def _move(self, index: int, offset: int) -> str:
+        """Move the cursor and return the output delta."""
+        previous_index = self._index
+        # the cursor can end up only in the segment at the index or in one of its neighbours
+        begin = max(0, min(previous_index, index - 1))
+        previous_cursor = self._output_cursor(begin)
+        self._set_cursor(index, offset)
+        end = max(previous_index, self._index) + 1
+        output = ''.join(output for _, output, _ in self._segments[begin:end])
+        return cursor_movement(output, previous_cursor, self._output_cursor(begin))
+
+    def type_printable_character(self, char: str) -> str:
+        """Insert one printable character at the cursor."""
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug('typed "%s" at %i', char, self._offset)
+        return self._edit(0, char, 0)
+
+    def type_backspace(self) -> str:
+        """Delete the character before the cursor."""
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug('typed backspace at %i', self._offset)
+        return self._edit(1, '', 0)
+
+    def type_delete(self) -> str:
+        """Delete the character after the cursor."""
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug('typed delete at %i', self._offset)
+        return self._edit(0, '', 1)
+
+    def move_left(self) -> str:
+        if self._offset == 0:
+            return ''
+        return self._move(self._index, self._offset - 1)
+
+    def move_right(self) -> str:
+        if self._index == len(self._segments) \
+                or self._offset == len(self._segments[self._index][0]) \
+                and self._index + 1 == len(self._segments):
+            return ''
+        return self._move(self._index, self._offset + 1)
+
+    def move_home(self) -> str:
+        return self._move(0, 0)
+
+    def move_end(self) -> str:
+        if not self._segments:
+            return ''
+        return self._move(len(self._segments) - 1, len(self._segments[-1][0]))
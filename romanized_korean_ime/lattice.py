@@ -0,0 +1,168 @@
+"""Segmentation lattice of jamo sequences: all the ways to split them into hangul syllables.
+
+The lattice is never built explicitly. Parses of each suffix of a sequence are counted
+in one pass from its end, and the counts guide enumeration of parses and the beam search
+for the best candidate conversions.
+"""
+
+import heapq
+import time
+import typing as t
+
+from .elements import DISAMBIGUATORS
+from .syllables import \
+    InvalidJamoError, validate_jamo, compose_hangul, syllables_at, _jamo_to_hangul_prefix
+
+__all__ = [
+    'count_parses', 'is_ambiguous', 'enumerate_parses', 'CANDIDATES_BEAM_WIDTH',
+    'CANDIDATES_TIME_BUDGET', 'jamo_to_hangul_candidates']
+
+
+def _count_parses(jamo: str, aggressive: bool, limit: t.Optional[int],
+                  deadline: t.Optional[float] = None) -> t.Optional[t.List[int]]:
+    """Count parses of each suffix of jamo like count_parses(), or return None at the deadline."""
+    counts = [0] * len(jamo) + [1]
+    for i in range(len(jamo) - 1, -1, -1):
+        if jamo[i] in DISAMBIGUATORS:
+            counts[i] = counts[i + 1]
+            continue
+        if deadline is not None and i % 64 == 0 and time.perf_counter() >= deadline:
+            return None
+        count = sum(counts[end] for _, _, _, end in syllables_at(jamo, i, aggressive=aggressive))
+        counts[i] = count if limit is None else min(count, limit)
+    return counts
+
+
+def count_parses(jamo: str, *, aggressive: bool = True,
+                 limit: t.Optional[int] = None) -> t.List[int]:
+    """Count ways in which each suffix of jamo sequence can be split into hangul syllables.
+
+    This is a single pass over the segmentation lattice of the sequence, from its end.
+    Item i of the result is the number of parses of jamo[i:], or the limit if there are more.
+    """
+    counts = _count_parses(jamo, aggressive, limit)
+    assert counts is not None, 'counting without a deadline always finishes'
+    return counts
+
+
+def is_ambiguous(jamo: str, *, aggressive: bool = True) -> bool:
+    """Check if jamo sequence can be converted into hangul in more than one way."""
+    return count_parses(validate_jamo(jamo), aggressive=aggressive, limit=2)[0] > 1
+
+
+def enumerate_parses(jamo: str, limit: t.Optional[int] = None, *,
+                     aggressive: bool = True) -> t.List[str]:
+    """List all (or at most limit) ways in which jamo sequence can be converted into hangul.
+
+    More preferred conversions come first. In particular, if jamo_to_hangul() succeeds
+    to convert the sequence, its result is the first one.
+    """
+    jamo = validate_jamo(jamo)
+    counts = count_parses(jamo, aggressive=aggressive, limit=limit)
+    parses = []  # type: t.List[str]
+    if not counts[0]:
+        return parses
+    # depth-first search, only through positions from which the rest of jamo can be parsed
+    stack = [(0, '')]
+    while stack and (limit is None or len(parses) < limit):
+        begin, hangul = stack.pop()
+        while begin < len(jamo) and jamo[begin] in DISAMBIGUATORS:
+            begin += 1
+        if begin == len(jamo):
+            parses.append(hangul)
+            continue
+        for head, body, tail, end in reversed(
+                syllables_at(jamo, begin, aggressive=aggressive)):
+            if counts[end]:
+                stack.append((end, hangul + compose_hangul(head, body, tail)))
+    return parses
+
+
+# default limits of the search for candidate conversions, see jamo_to_hangul_candidates()
+CANDIDATES_BEAM_WIDTH = 16
+
+CANDIDATES_TIME_BUDGET = 0.003
+
+
+_ScoredHangul = t.Tuple[float, t.Tuple[int, ...], str]
+
+
+def _complete_greedily(jamo: str, counts: t.Sequence[int], begin: int,
+                       hypothesis: _ScoredHangul, aggressive: bool) -> _ScoredHangul:
+    """Convert the rest of jamo after a partial conversion, choosing most preferred syllables."""
+    negated_score, ranks, hangul = hypothesis
+    syllables = [hangul]
+    while begin < len(jamo):
+        if jamo[begin] in DISAMBIGUATORS:
+            begin += 1
+            continue
+        for head, body, tail, end in syllables_at(jamo, begin, aggressive=aggressive):
+            if counts[end]:
+                syllables.append(compose_hangul(head, body, tail))
+                begin = end
+                break
+        else:
+            raise InvalidJamoError((''.join(syllables), jamo[begin:], jamo))
+    return negated_score, ranks, ''.join(syllables)
+
+
+def _scored_candidates(jamo: str, count: int, model: t.Optional[t.Any], aggressive: bool,
+                       beam_width: int, deadline: t.Optional[float]) -> t.List[_ScoredHangul]:
+    """Find best conversions of validated jamo, with their negated scores and syllable ranks."""
+    counts = _count_parses(jamo, aggressive, 1, deadline)
+    if counts is None:
+        # out of time already, so the conversion by jamo_to_hangul() is the only candidate
+        hangul, end = _jamo_to_hangul_prefix(jamo, None, aggressive)
+        if end == len(jamo):
+            return [(0.0, (), hangul)]
+        counts = count_parses(jamo, aggressive=aggressive, limit=1)
+    if not counts[0]:
+        return []
+    # hypotheses ending at each position, as negated score, ranks of syllables and hangul
+    beams = [[] for _ in range(len(jamo) + 1)]  # type: t.List[t.List[_ScoredHangul]]
+    beams[0].append((0.0, (), ''))
+    for begin in range(len(jamo)):
+        hypotheses = beams[begin]
+        beams[begin] = []
+        if not hypotheses:
+            continue
+        if deadline is not None and time.perf_counter() >= deadline:
+            return [_complete_greedily(jamo, counts, begin, min(hypotheses), aggressive)]
+        if jamo[begin] in DISAMBIGUATORS:
+            beams[begin + 1].extend(hypotheses)
+            continue
+        if len(hypotheses) > beam_width:
+            hypotheses = heapq.nsmallest(beam_width, hypotheses)
+        syllables = [(rank, compose_hangul(head, body, tail), end) for rank, (head, body, tail, end)
+                     in enumerate(syllables_at(jamo, begin, aggressive=aggressive)) if counts[end]]
+        for negated_score, ranks, hangul in hypotheses:
+            previous = hangul[-1:]
+            for rank, syllable, end in syllables:
+                beams[end].append((
+                    negated_score - model.score(previous, syllable) if model else negated_score,
+                    ranks + (rank,), hangul + syllable))
+    return heapq.nsmallest(count, beams[len(jamo)])
+
+
+def jamo_to_hangul_candidates(
+        jamo: str, count: int = 5, *, model: t.Optional[t.Any] = None, aggressive: bool = True,
+        beam_width: int = CANDIDATES_BEAM_WIDTH,
+        time_budget: t.Optional[float] = CANDIDATES_TIME_BUDGET) -> t.List[str]:
+    """List at most count best ways in which jamo sequence can be converted into hangul.
+
+    Conversions are ranked by the model, e.g. a frequency_model.FrequencyModel, which scores
+    each syllable given the previous one. Equally scored conversions, and all of them
+    if there is no model, are in the order of enumerate_parses(), so that the result
+    of jamo_to_hangul() comes first among them.
+
+    This is a beam search over the segmentation lattice, which keeps only beam_width best
+    partial conversions at each position of the sequence. The time budget in seconds is checked
+    while the lattice is built and at each position of the search. If it runs out before
+    the search, the result of jamo_to_hangul() is the only candidate, and if it runs out during
+    the search, only the best partial conversion is completed, with the most preferred
+    syllables. Either takes time linear in the length of the sequence. The result is never
+    empty if the sequence can be converted at all, even if that takes longer than the budget.
+    """
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    return [hangul for _, _, hangul in _scored_candidates(
+        validate_jamo(jamo), count, model, aggressive, beam_width, deadline)]
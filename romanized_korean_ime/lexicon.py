@@ -0,0 +1,225 @@
+"""Word list stored as a memory-mapped index, and splitting jamo into syllables guided by it.
+
+Build an index from a list of hangul words, one per line, with:
+
+    python -m romanized_korean_ime.lexicon words.txt lexicon.idx
+
+The index file is a header, then offsets of the words and then the words themselves,
+encoded in UTF-8 and sorted, so that a word is found by binary search over the mapped file.
+Opening an index does not read the words, and many processes that open the same file
+share its pages.
+"""
+
+import argparse
+import array
+import logging
+import mmap
+import struct
+import sys
+import typing as t
+
+from .deromanize_hangul import DISAMBIGUATORS, compose_hangul, count_parses, syllables_at
+
+_LOG = logging.getLogger(__name__)
+
+_MAGIC = b'RKIMLEX1'
+
+# magic, then number of words
+_HEADER = struct.Struct('<8sI')
+
+_OFFSET_SIZE = 4
+
+
+def write_lexicon(words: t.Iterable[str], path: str) -> int:
+    """Write an index of distinct words into a file, and return the number of words."""
+    encoded = sorted({_.encode() for _ in words if _})
+    offsets = array.array('I', [0])
+    for word in encoded:
+        offsets.append(offsets[-1] + len(word))
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+    with open(path, 'wb') as index_file:
+        index_file.write(_HEADER.pack(_MAGIC, len(encoded)))
+        index_file.write(offsets.tobytes())
+        index_file.write(b''.join(encoded))
+    return len(encoded)
+
+
+class Lexicon:
+
+    """Read-only word list backed by a memory-mapped index written by write_lexicon().
+
+    Lookups compare only the few words visited by binary search. Lexicon is pickled
+    by its path, so that worker processes map the same file instead of copying it.
+    """
+
+    __slots__ = ('path', '_mmap', '_offsets', '_data', '_data_begin', '_count')
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as index_file:
+            self._mmap = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC:
+            self._mmap.close()
+            raise ValueError('{} is not a lexicon index'.format(path))
+        offsets_end = _HEADER.size + (self._count + 1) * _OFFSET_SIZE
+        self._data = memoryview(self._mmap)
+        if sys.byteorder == 'little':
+            self._offsets = self._data[_HEADER.size:offsets_end].cast('I')  # type: t.Sequence[int]
+        else:
+            offsets = array.array('I', self._mmap[_HEADER.size:offsets_end])
+            offsets.byteswap()
+            self._offsets = offsets
+        self._data_begin = offsets_end
+
+    def __reduce__(self):
+        return type(self), (self.path,)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index: int) -> str:
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._word(index).decode()
+
+    def __contains__(self, word: str) -> bool:
+        return self.lookup(word)[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._data.release()
+        self._mmap.close()
+
+    def _span(self, index: int) -> t.Tuple[int, int]:
+        return self._data_begin + self._offsets[index], self._data_begin + self._offsets[index + 1]
+
+    def _word(self, index: int) -> bytes:
+        begin, end = self._span(index)
+        return self._mmap[begin:end]
+
+    def _is_less(self, index: int, key: bytes) -> bool:
+        """Check if the word at index is less than the key, without copying the word.
+
+        Bytes are compared one by one in the mapped file, up to the first that differs,
+        which in most steps of binary search is one of the first few.
+        """
+        data = self._mmap
+        offsets = self._offsets
+        i = self._data_begin + offsets[index]
+        end = self._data_begin + offsets[index + 1]
+        for byte in key:
+            if i == end:
+                return True
+            word_byte = data[i]
+            if word_byte != byte:
+                return word_byte < byte
+            i += 1
+        return False
+
+    def _starts_with(self, index: int, key: bytes) -> bool:
+        begin, end = self._span(index)
+        return end - begin >= len(key) and self._data[begin:begin + len(key)] == key
+
+    def _bisect(self, key: bytes) -> int:
+        """Find index of the first word that is not less than the key."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._is_less(middle, key):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def lookup(self, word: str) -> t.Tuple[bool, bool]:
+        """Check if the word is in the lexicon, and if any longer word in it starts with it."""
+        key = word.encode()
+        index = self._bisect(key)
+        if index == self._count or not self._starts_with(index, key):
+            return False, False
+        begin, end = self._span(index)
+        if end - begin > len(key):
+            return False, True
+        index += 1
+        return True, index < self._count and self._starts_with(index, key)
+
+
+def segment(jamo: str, lexicon: Lexicon, *, aggressive: bool = True) -> t.Optional[str]:
+    """Split jamo sequence into syllables so that as much of it as possible forms known words.
+
+    Each known word of n syllables scores n squared, so longer words are preferred over
+    several shorter ones, and the split with the highest total score wins. Among equally good
+    splits, the one that jamo_to_hangul() prefers wins, so without any known words the result
+    is the same as of jamo_to_hangul() whenever it succeeds. Return None if the sequence
+    cannot be converted at all.
+
+    This is a single backward pass over the segmentation lattice, in which words are extended
+    syllable by syllable only while the lexicon has words that start with them.
+    """
+    counts = count_parses(jamo, aggressive=aggressive, limit=1)
+    if not counts[0]:
+        return None
+    # best score of each suffix of jamo, and the hangul of the first word of the best split
+    scores = [0] * (len(jamo) + 1)
+    words = [''] * (len(jamo) + 1)
+    ends = [len(jamo)] * (len(jamo) + 1)
+    for begin in range(len(jamo) - 1, -1, -1):
+        if not counts[begin]:
+            continue
+        if jamo[begin] in DISAMBIGUATORS:
+            scores[begin] = scores[begin + 1]
+            ends[begin] = begin + 1
+            continue
+        best_score = -1
+        # depth-first search of words that start here, in order of preference of syllables
+        stack = [(begin, '', 0)]
+        while stack:
+            position, word, length = stack.pop()
+            options = []
+            for head, body, tail, end in syllables_at(jamo, position, aggressive=aggressive):
+                if not counts[end]:
+                    continue
+                extended = word + compose_hangul(head, body, tail)
+                found, extendable = lexicon.lookup(extended)
+                score = scores[end] + ((length + 1) ** 2 if found else 0)
+                if (found or length == 0) and score > best_score:
+                    best_score = score
+                    words[begin] = extended
+                    ends[begin] = end
+                if extendable and end < len(jamo):
+                    options.append((end, extended, length + 1))
+            stack.extend(reversed(options))
+        scores[begin] = best_score
+    hangul = []
+    begin = 0
+    while begin < len(jamo):
+        hangul.append(words[begin])
+        begin = ends[begin]
+    return ''.join(hangul)
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description='Build a lexicon index from a word list.')
+    parser.add_argument('words', help='text file with one hangul word per line')
+    parser.add_argument('index', help='index file to write')
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    parsed_args = parse_args(args)
+    with open(parsed_args.words, encoding='utf-8') as words_file:
+        count = write_lexicon((line.strip() for line in words_file), parsed_args.index)
+    print('wrote {} words to {}'.format(count, parsed_args.index))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,10 @@
 
 import argparse
 import logging
-import pprint
+import os
 
-import readchar
-
-from .deromanize_hangul import ELEMENTS, DOUBLE_TO_COMBINED
-from .korean_ime import GreedyKoreanIME
+from .deromanize_hangul import DOUBLE_TO_COMBINED, compile_scheme, get_scheme
+from .korean_ime import IncrementalKoreanIME
 
 _INTERRUPTS = {chr(3)}
 
@@ -40,9 +38,14 @@ def parse_args(args=None):
 def main(args=None):
     """Entry point of command-line interface."""
     parsed_args = parse_args(args)
+    if os.environ.get('LOGGING_LEVEL', False):
+        logging.basicConfig(level=getattr(logging, os.environ['LOGGING_LEVEL'].upper()))
     if parsed_args.help_input:
-        print('All romanized input that will be converted into jamo:')
-        _ = ['{:3}: {}'.format(romanization, jamo) for romanization, jamo in ELEMENTS.items()]
+        scheme = compile_scheme(get_scheme())
+        print('All romanized input that will be converted into jamo ({} scheme):'.format(
+            scheme.name))
+        _ = ['{:3}: {}'.format(romanization, jamo)
+             for romanization, jamo in scheme.elements.items()]
         n_col_print(_, 6, '    ')
         # pprint.pprint(_)  # print('\n'.join(_))
         print('All pairs of simple jamo that will be combined into a single two-component jamo:')
@@ -50,9 +53,11 @@ def main(args=None):
         n_col_print(_, 4)
         # pprint.pprint(_)  # print('\n'.join(_))
         return
+    import readchar  # slow to import, and needed only in interactive mode
+
     logging.basicConfig(level=logging.DEBUG, filename='korean_ime.log')
     # logging.getLogger('deromanize_hangul').setLevel(logging.INFO)
-    ime = GreedyKoreanIME()
+    ime = IncrementalKoreanIME()
     char = ''
     while char not in _ENDINGS:
         char = readchar.readchar()
@@ -0,0 +1,72 @@
+"""Mapping between positions in converted output and in the romanized source text."""
+
+import array
+import bisect
+import typing as t
+
+
+class OffsetMap:
+
+    """Map from each character of converted output to the span of source text it came from.
+
+    Characters converted from a group of jamo all map to the span of the whole group,
+    and characters copied from the source map to their own one-character span. Spans are kept
+    in two arrays, so that the map takes a few bytes per output character.
+    """
+
+    __slots__ = ('begins', 'ends')
+
+    def __init__(self, begins: t.Iterable[int] = (), ends: t.Iterable[int] = ()):
+        self.begins = array.array('I', begins)
+        self.ends = array.array('I', ends)
+        assert len(self.begins) == len(self.ends), (len(self.begins), len(self.ends))
+
+    def __len__(self):
+        return len(self.begins)
+
+    def __eq__(self, other):
+        if not isinstance(other, OffsetMap):
+            return NotImplemented
+        return self.begins == other.begins and self.ends == other.ends
+
+    def __repr__(self):
+        return '{}({}, {})'.format(type(self).__name__, list(self.begins), list(self.ends))
+
+    def append_copied(self, begin: int, end: int) -> None:
+        """Map output characters copied from source text between begin and end."""
+        self.begins.extend(range(begin, end))
+        self.ends.extend(range(begin + 1, end + 1))
+
+    def append_converted(self, length: int, begin: int, end: int) -> None:
+        """Map output characters converted from source text between begin and end."""
+        self.begins.extend([begin] * length)
+        self.ends.extend([end] * length)
+
+    def extend_shifted(self, other: 'OffsetMap', shift: int) -> None:
+        """Map output characters mapped by the other map, with source offsets shifted."""
+        self.begins.extend(_ + shift for _ in other.begins)
+        self.ends.extend(_ + shift for _ in other.ends)
+
+    def span(self, index: int) -> t.Tuple[int, int]:
+        """Get source span of the output character at the index."""
+        return self.begins[index], self.ends[index]
+
+    def source_span(self, begin: int, end: int) -> t.Tuple[int, int]:
+        """Get source span of output between begin and end, e.g. to highlight a selection."""
+        if begin >= end:
+            source_offset = self.source_offset(begin)
+            return source_offset, source_offset
+        return self.begins[begin], self.ends[end - 1]
+
+    def source_offset(self, offset: int) -> int:
+        """Map a cursor position in output to a cursor position in the source text."""
+        if offset < len(self.begins):
+            return self.begins[offset]
+        return self.ends[-1] if self.ends else 0
+
+    def output_offset(self, source_offset: int) -> int:
+        """Map a cursor position in the source text to a cursor position in output.
+
+        A cursor inside of a span of a converted group is moved to the beginning of the group.
+        """
+        return bisect.bisect_right(self.ends, source_offset)
@@ -0,0 +1,108 @@
+"""Turning hangul into romanized korean text that deromanize_hangul converts back."""
+
+import logging
+import typing as t
+
+from .deromanize_hangul import \
+    ELEMENTS, COMBINED_TO_DOUBLE, HANGUL_SYLLABLES_BASE, HEAD_ORDER, BODY_ORDER, TAIL_ORDER, \
+    to_hangul, to_hangul_many
+
+_LOG = logging.getLogger(__name__)
+
+TAILS_COUNT = len(TAIL_ORDER) + 1
+
+SYLLABLES_COUNT = len(HEAD_ORDER) * len(BODY_ORDER) * TAILS_COUNT
+
+# first romanization of each jamo in ELEMENTS, so that synonyms are not used
+ROMANIZED_JAMO = {}  # type: t.Dict[str, str]
+for _romanization, _jamo in ELEMENTS.items():
+    ROMANIZED_JAMO.setdefault(_jamo, _romanization)
+
+# head ㅇ is implied by a vowel at the beginning of a syllable
+ROMANIZED_HEADS = ['' if _ == 'ㅇ' else ROMANIZED_JAMO[_] for _ in HEAD_ORDER]
+
+ROMANIZED_BODIES = [ROMANIZED_JAMO[_] for _ in BODY_ORDER]
+
+# tails that are not elements are split into two jamo, looking them up as conjoining jamo
+ROMANIZED_TAILS = [''] + [
+    ROMANIZED_JAMO[jamo] if jamo in ROMANIZED_JAMO
+    else ''.join(ROMANIZED_JAMO[_] for _ in COMBINED_TO_DOUBLE[chr(0x11A7 + i)])
+    for i, jamo in enumerate(TAIL_ORDER, 1)]
+
+
+def _romanize_syllable(code: int) -> str:
+    head, rest = divmod(code, len(BODY_ORDER) * TAILS_COUNT)
+    body, tail = divmod(rest, TAILS_COUNT)
+    return ROMANIZED_HEADS[head] + ROMANIZED_BODIES[body] + ROMANIZED_TAILS[tail]
+
+
+ROMANIZED_SYLLABLES = [_romanize_syllable(_) for _ in range(SYLLABLES_COUNT)]
+
+# whether a disambiguator is needed between two syllables, by _disambiguation_key()
+_DISAMBIGUATION = {}  # type: t.Dict[int, bool]
+
+
+def _disambiguation_key(previous: int, following: int) -> int:
+    """Identify a pair of syllables by body and tail of the first and head and body of the next.
+
+    Only these can change how the pair is deromanized when it is written without a disambiguator.
+    """
+    return (previous % (len(BODY_ORDER) * TAILS_COUNT)) * len(HEAD_ORDER) * len(BODY_ORDER) \
+        + following // TAILS_COUNT
+
+
+def _is_disambiguation_needed(previous: int, following: int) -> bool:
+    key = _disambiguation_key(previous, following)
+    needed = _DISAMBIGUATION.get(key)
+    if needed is None:
+        # a pair with the same key: previous with head ㄱ, following without tail
+        previous = previous % (len(BODY_ORDER) * TAILS_COUNT)
+        following = following // TAILS_COUNT * TAILS_COUNT
+        pair = chr(HANGUL_SYLLABLES_BASE + previous) + chr(HANGUL_SYLLABLES_BASE + following)
+        try:
+            needed = to_hangul(ROMANIZED_SYLLABLES[previous] + ROMANIZED_SYLLABLES[following],
+                               scheme='revised') != pair
+        except (ValueError, AssertionError):
+            needed = True
+        _DISAMBIGUATION[key] = needed
+    return needed
+
+
+def romanize(hangul: str) -> str:
+    """Convert hangul into romanized korean text.
+
+    Syllables are decomposed arithmetically and written using the romanization of jamo
+    from ELEMENTS. A disambiguator is put between two syllables only if without it they would
+    be deromanized differently. Characters other than hangul syllables are kept as they are.
+    """
+    parts = []
+    previous = -1
+    for char in hangul:
+        code = ord(char) - HANGUL_SYLLABLES_BASE
+        if 0 <= code < SYLLABLES_COUNT:
+            if previous >= 0 and _is_disambiguation_needed(previous, code):
+                parts.append('-')
+            parts.append(ROMANIZED_SYLLABLES[code])
+            previous = code
+        else:
+            parts.append(char)
+            previous = -1
+    return ''.join(parts)
+
+
+def round_trip_failures(texts: t.Iterable[str], **kwargs) -> t.List[t.Tuple[str, str, t.Any]]:
+    """Find hangul texts that are not converted back into themselves after romanization.
+
+    Return tuples of hangul, its romanization, and the result of converting it back
+    (which is an exception if the conversion failed). Keyword arguments are passed on
+    to to_hangul_many().
+    """
+    kwargs.setdefault('scheme', 'revised')
+    texts = list(texts)
+    romanized = [romanize(_) for _ in texts]
+    failures = []
+    for hangul, text, result in zip(texts, romanized, to_hangul_many(romanized, **kwargs)):
+        if result != hangul:
+            failures.append((hangul, text, result))
+    _LOG.debug('round_trip_failures: %i out of %i texts', len(failures), len(texts))
+    return failures
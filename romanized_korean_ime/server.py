@@ -0,0 +1,171 @@
+"""Serving the Korean IME to many clients at once, over TCP or Unix sockets.
+
+Run with:
+
+    python -m romanized_korean_ime.server --port 8765
+    python -m romanized_korean_ime.server --unix /tmp/korean_ime.sock
+
+Protocol is newline-delimited JSON. Each request is one of:
+
+    {"type": "key", "char": "a"}
+    {"type": "backspace"}
+    {"type": "state"}
+
+and for each request, in order, the server sends one response: {"delta": "..."} for keystrokes,
+{"text": "...", "jamo": "...", "hangul": "...", "output": "..."} for state,
+or {"error": "..."} if the request could not be handled. If a request has an "id",
+it is copied into the response.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import typing as t
+
+from .korean_ime import GreedyKoreanIME, IncrementalKoreanIME
+
+_LOG = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+DEFAULT_LINE_LIMIT = 4096
+
+DEFAULT_BACKLOG = 1024
+
+
+class KoreanIMEServer:
+
+    """Asyncio server that keeps one IME per connection.
+
+    Requests of each session are handled one at a time, and the next request is read only after
+    the response to the previous one was flushed to the client, so a client that does not read
+    its responses stops being served instead of making the server buffer them.
+    Sessions that send nothing for idle_timeout seconds are closed.
+    """
+
+    def __init__(self, ime_factory: t.Callable[[], GreedyKoreanIME] = IncrementalKoreanIME, *,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 line_limit: int = DEFAULT_LINE_LIMIT):
+        self.ime_factory = ime_factory
+        self.idle_timeout = idle_timeout
+        self.line_limit = line_limit
+        self.sessions = {}  # type: t.Dict[int, GreedyKoreanIME]
+        self.evicted_count = 0
+        self._session_ids = itertools.count()
+
+    async def start_tcp(self, host: str = '127.0.0.1', port: int = 0,
+                        **kwargs) -> asyncio.base_events.Server:
+        """Start serving on a TCP socket. Port 0 means any free port."""
+        kwargs.setdefault('backlog', DEFAULT_BACKLOG)
+        return await asyncio.start_server(
+            self.handle_connection, host, port, limit=self.line_limit, **kwargs)
+
+    async def start_unix(self, path: str, **kwargs) -> asyncio.base_events.Server:
+        """Start serving on a Unix socket."""
+        kwargs.setdefault('backlog', DEFAULT_BACKLOG)
+        return await asyncio.start_unix_server(
+            self.handle_connection, path, limit=self.line_limit, **kwargs)
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        """Serve one session until the client disconnects or is idle for too long."""
+        session_id = next(self._session_ids)
+        ime = self.ime_factory()
+        self.sessions[session_id] = ime
+        _LOG.debug('session %i started, %i sessions', session_id, len(self.sessions))
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    self.evicted_count += 1
+                    _LOG.debug('session %i evicted after being idle', session_id)
+                    break
+                except ValueError:
+                    # raised by readline() when line is longer than the limit
+                    await self._respond(writer, {'error': 'request too long'})
+                    break
+                if not line:
+                    break
+                await self._respond(writer, self.handle_request(ime, line))
+        except ConnectionError:
+            _LOG.debug('session %i lost connection', session_id)
+        finally:
+            del self.sessions[session_id]
+            writer.close()
+            _LOG.debug('session %i ended, %i sessions', session_id, len(self.sessions))
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, response: t.Mapping[str, t.Any]) -> None:
+        writer.write(json.dumps(response, ensure_ascii=False).encode() + b'\n')
+        await writer.drain()
+
+    @staticmethod
+    def handle_request(ime: GreedyKoreanIME, line: bytes) -> t.Dict[str, t.Any]:
+        """Handle one request of a session and create the response to it."""
+        try:
+            request = json.loads(line.decode())
+            if not isinstance(request, dict):
+                raise ValueError('request must be an object')
+        except ValueError as err:
+            return {'error': 'invalid request: {}'.format(err)}
+        response = {}  # type: t.Dict[str, t.Any]
+        if 'id' in request:
+            response['id'] = request['id']
+        request_type = request.get('type')
+        try:
+            if request_type == 'key':
+                char = request.get('char')
+                if not isinstance(char, str) or len(char) != 1:
+                    raise ValueError('"char" must be a single character')
+                response['delta'] = ime.type_printable_character(char)
+            elif request_type == 'backspace':
+                response['delta'] = ime.type_backspace()
+            elif request_type == 'state':
+                response.update(text=ime.text, jamo=ime.jamo, hangul=ime.hangul,
+                                output=ime.output)
+            else:
+                raise ValueError('unknown request type {}'.format(repr(request_type)))
+        except ValueError as err:
+            response['error'] = str(err)
+        return response
+
+
+async def serve(server: KoreanIMEServer, host: str = '127.0.0.1', port: int = 0,
+                unix_path: t.Optional[str] = None) -> None:
+    """Serve forever on a TCP socket or, if path is given, on a Unix socket."""
+    if unix_path is None:
+        asyncio_server = await server.start_tcp(host, port)
+    else:
+        asyncio_server = await server.start_unix(unix_path)
+    for sock in asyncio_server.sockets:
+        _LOG.warning('serving Korean IME on %s', sock.getsockname())
+    async with asyncio_server:
+        await asyncio_server.serve_forever()
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description='Romanized Korean IME server.')
+    parser.add_argument('--host', default='127.0.0.1', help='host to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='TCP port to listen on')
+    parser.add_argument('--unix', metavar='PATH', help='listen on Unix socket instead of TCP')
+    parser.add_argument(
+        '--idle-timeout', type=float, default=DEFAULT_IDLE_TIMEOUT,
+        help='seconds after which an idle session is closed')
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    parsed_args = parse_args(args)
+    logging.basicConfig()
+    server = KoreanIMEServer(idle_timeout=parsed_args.idle_timeout)
+    try:
+        asyncio.run(serve(server, parsed_args.host, parsed_args.port, parsed_args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""Splitting jamo into hangul syllables and composing them.
+
+A syllable is a head jamo, a body jamo and an optional tail jamo, where each may be a pair
+of jamo combined into one. Which syllables can start at a position depends only on the next
+few jamo, so the options are computed once for each such window and cached.
+"""
+
+import functools
+import logging
+import typing as t
+
+from ._tables import \
+    VOWELS, HEAD_JAMO, BODY_JAMO, TAIL_JAMO, ALL_UNAMBIGUOUS_JAMO, HEAD_INDEX, BODY_INDEX, \
+    TAIL_INDEX, JAMO_NORMALIZATION
+from .elements import \
+    ELEMENTS, DOUBLE_TO_COMBINED, DOUBLE_HEAD_JAMO, DOUBLE_BODY_JAMO, DOUBLE_TAIL_JAMO, \
+    DISAMBIGUATORS, HANGUL_SYLLABLES_BASE, BODY_ORDER, TAIL_ORDER
+
+__all__ = [
+    'InvalidJamoError', 'validate_jamo', 'compose_hangul', 'jamo_to_hangul_prefix',
+    'leading_syllables', 'syllables_at']
+
+_LOG = logging.getLogger(__name__)
+
+
+class InvalidJamoError(ValueError, AssertionError):
+
+    """Jamo sequence that cannot be converted into hangul.
+
+    It is also an AssertionError, which is what failed conversion raised before.
+    """
+
+
+def validate_jamo(jamo: str) -> str:
+    """Substitute auto-combining jamo with their not auto combining versions.
+
+    Some jamo has different unicode codes and they cause it to automatically combine into hangul
+    and this causes trouble when operating on them.
+
+    For example, ᄄ ᅳ ᆪ automatically combine into 뜫 if there are no spaces between them.
+    On the other hand ㄸㅡᆪ give no such trouble and don't merge into 뜫 (here as single character).
+
+    The characters involved:
+    https://en.wikipedia.org/wiki/Hangul_Jamo_(Unicode_block)
+    https://en.wikipedia.org/wiki/Hangul_Compatibility_Jamo
+
+    To make things worse, sometimes it's versions from one group that merge,
+    sometimes from the other. All jamo are therefore mapped to their versions in ALL_JAMO
+    using JAMO_NORMALIZATION table.
+    """
+    if ALL_UNAMBIGUOUS_JAMO.issuperset(jamo):
+        return jamo
+    _LOG.info('repairing problematic characters in jamo text "%s"', jamo)
+    transformed = jamo.translate(JAMO_NORMALIZATION)
+    invalid = set(transformed) - ALL_UNAMBIGUOUS_JAMO
+    if invalid:
+        raise InvalidJamoError((transformed, invalid))
+    return transformed
+
+
+def compose_hangul(head: str, body: str, tail: str = '') -> str:
+    """Compose a single hangul syllable from its head, body and (optional) tail jamo."""
+    return chr(HANGUL_SYLLABLES_BASE
+               + (HEAD_INDEX[head] * len(BODY_ORDER) + BODY_INDEX[body]) * (len(TAIL_ORDER) + 1)
+               + TAIL_INDEX[tail])
+
+
+def _jamo_to_hangul_prefix(jamo: str, limit: t.Optional[int],
+                           aggressive: bool) -> t.Tuple[str, int]:
+    hangul = []  # type: t.List[str]
+    tracing = _LOG.isEnabledFor(logging.DEBUG)
+    if tracing:
+        _LOG.debug('jamo_to_hangul: "%s" "%s"', '', jamo)
+    begin = 0
+    jamo_len = len(jamo)
+    while begin < jamo_len:
+        if jamo[begin] in DISAMBIGUATORS:
+            begin += 1
+            continue
+        syllables = leading_syllables(jamo[begin:begin + _SYLLABLE_MAX_LEN], aggressive)
+        if not syllables:
+            break
+        head, body, tail, length = syllables[0]
+        hangul.append(compose_hangul(head, body, tail))
+        begin += length
+        if tracing:
+            _LOG.debug('jamo_to_hangul: "%s" "%s"', ''.join(hangul), jamo[begin:])
+        if limit is not None and len(hangul) >= limit:
+            break
+    return ''.join(hangul), begin
+
+
+def jamo_to_hangul_prefix(jamo: str, *, limit: t.Optional[int] = None,
+                          aggressive: bool = True) -> t.Tuple[str, int]:
+    """Convert the longest prefix of jamo sequence that can be converted into hangul.
+
+    Syllables are matched in one pass, by a state machine that goes from head to body
+    to tail position, and stops at the first jamo that cannot take its position.
+    Return the hangul and the length of the converted prefix, which is shorter than
+    the sequence if it cannot be converted whole, or if the limit of syllables was reached.
+    Syllables are the same as jamo_to_hangul() would make.
+    """
+    return _jamo_to_hangul_prefix(validate_jamo(jamo), limit, aggressive)
+
+
+# at most 6 jamo form one syllable: a combined head, a combined body and a combined tail
+_SYLLABLE_MAX_LEN = 6
+
+
+@functools.lru_cache(maxsize=65536)
+def leading_syllables(jamo: str,
+                      aggressive: bool = True) -> t.Tuple[t.Tuple[str, str, str, int], ...]:
+    """List all valid hangul syllables at the beginning of a jamo sequence.
+
+    Each syllable is given as its head, body and tail jamo (tail is empty if there is none)
+    and its length in jamo. More preferred syllables come first: a combined jamo over two
+    separate ones in each position, and a tail over no tail. The first syllable is the one
+    that jamo_to_hangul() chooses. Only the first few jamo matter, so callers pass at most
+    that many, and results are cached.
+    """
+    syllables = []
+    # jamo that can take a position, with the position right after it
+    heads = ()  # type: t.Tuple[t.Tuple[str, int], ...]
+    bodies = ()  # type: t.Tuple[t.Tuple[str, int], ...]
+    # first jamo of each double jamo is a valid single jamo in the same position
+    first = jamo[:1]
+    if aggressive and jamo[:2] in DOUBLE_HEAD_JAMO:
+        heads = ((DOUBLE_TO_COMBINED[jamo[:2]], 2), (first, 1))
+    elif first in HEAD_JAMO:
+        heads = ((first, 1),)
+    elif first in VOWELS:
+        heads = ((ELEMENTS['ng'], 0),)
+    else:
+        return ()
+    for head, i in heads:
+        first = jamo[i:i + 1]
+        if aggressive and jamo[i:i + 2] in DOUBLE_BODY_JAMO:
+            bodies = ((DOUBLE_TO_COMBINED[jamo[i:i + 2]], i + 2), (first, i + 1))
+        elif first in BODY_JAMO:
+            bodies = ((first, i + 1),)
+        else:
+            continue
+        for body, j in bodies:
+            if aggressive and jamo[j:j + 2] in DOUBLE_TAIL_JAMO:
+                syllables.append((head, body, DOUBLE_TO_COMBINED[jamo[j:j + 2]], j + 2))
+            if jamo[j:j + 1] in TAIL_JAMO:
+                syllables.append((head, body, jamo[j], j + 1))
+            syllables.append((head, body, '', j))
+    return tuple(syllables)
+
+
+def syllables_at(jamo: str, begin: int, *,
+                 aggressive: bool = True) -> t.List[t.Tuple[str, str, str, int]]:
+    """List all valid hangul syllables that start at a given position of jamo sequence.
+
+    Each syllable is given as its head, body and tail jamo and the position right after it
+    in the sequence. Syllables are in the order of leading_syllables(), in which
+    jamo_to_hangul() prefers them.
+    """
+    return [(head, body, tail, begin + length) for head, body, tail, length
+            in leading_syllables(jamo[begin:begin + _SYLLABLE_MAX_LEN], aggressive)]
@@ -0,0 +1,103 @@
+"""Conversion of many jamo groups into hangul at once, using NumPy.
+
+Only composing of syllables is vectorized. Each distinct jamo group is split into syllables
+once, in a Python loop that chooses the first of syllables_at() at each position like
+jamo_to_hangul() does, and then the jamo of all syllables of all groups are mapped to their
+indices and composed into hangul syllables in a few array operations over the whole batch.
+Splitting takes most of the time, so this backend is faster only because groups that repeat,
+as words of natural text do, are split only once. Batches of distinct groups are converted
+no faster than by the 'python' backend, and even a little slower.
+"""
+
+import typing as t
+
+import numpy as np
+
+from .deromanize_hangul import \
+    DISAMBIGUATORS, HANGUL_SYLLABLES_BASE, HEAD_INDEX, BODY_INDEX, TAIL_INDEX, BODY_ORDER, \
+    TAIL_ORDER, validate_jamo, syllables_at, warn_if_ambiguous, jamo_to_hangul
+
+# no tail is represented by NUL character
+_NO_TAIL = '\0'
+
+
+def _index_table(index: t.Mapping[str, int]) -> np.ndarray:
+    """Create an array that maps code points of jamo to their indices."""
+    table = np.zeros(max(ord(_) for _ in index if _) + 1, dtype=np.uint32)
+    for jamo, i in index.items():
+        table[ord(jamo or _NO_TAIL)] = i
+    return table
+
+
+HEAD_INDEX_TABLE = _index_table(HEAD_INDEX)
+
+BODY_INDEX_TABLE = _index_table(BODY_INDEX)
+
+TAIL_INDEX_TABLE = _index_table(TAIL_INDEX)
+
+
+def split_syllables(jamo: str, heads: t.List[str], bodies: t.List[str], tails: t.List[str], *,
+                    limit: t.Optional[int] = None, aggressive: bool = True) -> t.Optional[int]:
+    """Split a jamo sequence into syllables in the same way as jamo_to_hangul() does.
+
+    Head, body and tail jamo of each syllable are appended to the given lists. Return the number
+    of syllables, or None if jamo_to_hangul() would fail to convert the sequence.
+    """
+    count = 0
+    i = 0
+    while i < len(jamo):
+        if jamo[i] in DISAMBIGUATORS:
+            i += 1
+            continue
+        syllables = syllables_at(jamo, i, aggressive=aggressive)
+        if not syllables:
+            return None
+        head, body, tail, i = syllables[0]
+        heads.append(head)
+        bodies.append(body)
+        tails.append(tail or _NO_TAIL)
+        count += 1
+        if limit is not None and count >= limit:
+            break
+    return count
+
+
+def _code_points(jamo: t.List[str]) -> np.ndarray:
+    return np.frombuffer(''.join(jamo).encode('utf-32-le'), dtype=np.uint32)
+
+
+def jamo_groups_to_hangul(jamo_groups: t.Iterable[str], *, warn: bool = False,
+                          limit: t.Optional[int] = None, aggressive: bool = True) -> t.List[str]:
+    """Convert many jamo sequences into hangul, with the same results as jamo_to_hangul().
+
+    Each distinct sequence is split into syllables only once. If conversion of any
+    of the sequences fails, the same exception as in jamo_to_hangul() is raised for the first
+    such sequence.
+    """
+    jamo_groups = list(jamo_groups)
+    unique_groups = list(dict.fromkeys(jamo_groups))
+    heads = []  # type: t.List[str]
+    bodies = []  # type: t.List[str]
+    tails = []  # type: t.List[str]
+    counts = []
+    for jamo in unique_groups:
+        jamo = validate_jamo(jamo)
+        if warn:
+            warn_if_ambiguous(jamo, aggressive=aggressive)
+        count = split_syllables(jamo, heads, bodies, tails, limit=limit, aggressive=aggressive)
+        if count is None:
+            jamo_to_hangul(jamo, limit=limit, aggressive=aggressive)
+            raise AssertionError(jamo)  # unreachable unless both conversions disagree
+        counts.append(count)
+    head_indices = HEAD_INDEX_TABLE[_code_points(heads)]
+    body_indices = BODY_INDEX_TABLE[_code_points(bodies)]
+    tail_indices = TAIL_INDEX_TABLE[_code_points(tails)]
+    codes = HANGUL_SYLLABLES_BASE + (
+        head_indices * len(BODY_ORDER) + body_indices) * (len(TAIL_ORDER) + 1) + tail_indices
+    hangul = codes.astype('<u4').tobytes().decode('utf-32-le')
+    hangul_by_jamo = {}
+    end = 0
+    for jamo, count in zip(unique_groups, counts):
+        hangul_by_jamo[jamo] = hangul[end:end + count]
+        end += count
+    return [hangul_by_jamo[_] for _ in jamo_groups]
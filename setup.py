@@ -16,6 +16,7 @@ class Package(setup_boilerplate.Package):
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3 :: Only']
     keywords = ['korean', 'ime', 'hangul', 'jamo']
+    extras_require = {'numpy': ['numpy']}
 
 
 if __name__ == '__main__':
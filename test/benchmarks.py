@@ -0,0 +1,235 @@
+"""Performance benchmarks of hangul deromanization and of the Korean IME.
+
+Run with:
+
+    python -m test.benchmarks --output results.json
+    python -m test.benchmarks --baseline results.json
+
+Timings are best-of-several seconds per call, and memory taken by idle IME sessions is in bytes
+per session, all written as JSON. When a baseline file is given, each result is compared
+against it and the exit status is non-zero if any of them regressed
+by more than the given tolerance.
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import platform
+import sys
+import timeit
+import tracemalloc
+import typing as t
+
+from romanized_korean_ime.deromanize_hangul import \
+    to_jamo_groups, jamo_to_hangul, jamo_to_hangul_candidates, to_hangul_groups, to_hangul, \
+    to_hangul_with_offsets
+from romanized_korean_ime.korean_ime import \
+    KoreanIME, GreedyKoreanIME, IncrementalKoreanIME, EditableKoreanIME
+
+_LOG = logging.getLogger(__name__)
+
+SAMPLE_TEXT = (
+    'mu-seun yeong-hwa-reul bul-gga-yo? ne, joh-a-yo. sa-rang-ha-da ji-geum '
+    'han-gug-eo bo-da ye-bbeu-da gat-i hwa gang san-sung ')
+
+# syllables of distinct words, see unique_text()
+SAMPLE_SYLLABLES = (
+    'mu', 'seun', 'yeong', 'hwa', 'reul', 'bul', 'gga', 'yo', 'ne', 'joh', 'sa', 'rang', 'ha',
+    'da', 'ji', 'geum', 'han', 'gug', 'eo', 'bo')
+
+INPUT_SIZES = {
+    'word': 7,
+    'sentence': 35,
+    '10KB': 10 * 1024,
+    '1MB': 1024 * 1024}
+
+BUFFER_LENGTHS = (10, 100, 300)
+
+IME_CLASSES = (GreedyKoreanIME, IncrementalKoreanIME, EditableKoreanIME)
+
+# union of all built-in romanization schemes, in which the sample text is still understood
+UNION_SCHEME = 'revised+mccune-reischauer+yale'
+
+# benchmarks slower than this are measured only once
+SLOW_BENCHMARK = 1.0
+
+# number of idle sessions created to measure memory taken by one session
+SESSIONS_COUNT = 1000
+
+DEFAULT_TOLERANCE = 0.5
+
+
+def sample_text(size: int) -> str:
+    """Create romanized korean text of a given size by repeating a sample text."""
+    text = SAMPLE_TEXT * (size // len(SAMPLE_TEXT) + 2)
+    end = size
+    # avoid cutting the text in the middle of a syllable
+    while end > 0 and text[end] not in ' -':
+        end -= 1
+    return text[:end]
+
+
+def unique_text(size: int) -> str:
+    """Create romanized korean text of at most a given size, in which no word repeats."""
+    words = (''.join(_) for length in itertools.count(1)
+             for _ in itertools.product(SAMPLE_SYLLABLES, repeat=length))
+    text = []
+    text_len = 0
+    for word in words:
+        text_len += len(word) + 1
+        if text_len > size:
+            break
+        text.append(word)
+    return ' '.join(text)
+
+
+def measure(function: t.Callable[[], t.Any], repeat: int = 5) -> float:
+    """Measure the best time of a single call of a function, in seconds."""
+    timer = timeit.Timer(function)
+    duration = timer.timeit(number=1)
+    if duration >= SLOW_BENCHMARK:
+        return duration
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def prefill(ime: t.Union[KoreanIME, EditableKoreanIME], text: str) -> None:
+    """Put text into the IME buffer as if it was typed."""
+    if isinstance(ime, (IncrementalKoreanIME, EditableKoreanIME)):
+        for char in text:
+            ime.type_printable_character(char)
+        return
+    # state of the greedy IME depends only on the whole text typed so far
+    ime._text = text
+    ime.convert_text_to_jamo()
+    ime.convert_jamo_to_hangul()
+
+
+def measure_keystroke(ime: t.Union[KoreanIME, EditableKoreanIME]) -> float:
+    """Measure time of typing one character into the IME."""
+    def keystroke_and_backspace():
+        ime.type_printable_character('a')
+        ime.type_backspace()
+    return measure(keystroke_and_backspace) / 2
+
+
+def measure_session_size(ime_class: t.Type[t.Union[KoreanIME, EditableKoreanIME]], text: str,
+                         count: int = SESSIONS_COUNT) -> float:
+    """Measure memory taken by one idle IME session into which the text was typed, in bytes."""
+    ime = ime_class()
+    prefill(ime, text)  # warm up caches so that only the sessions are measured
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        sessions = []
+        for _ in range(count):
+            ime = ime_class()
+            prefill(ime, text)
+            sessions.append(ime)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count
+
+
+def run_benchmarks(sizes: t.Iterable[str] = tuple(INPUT_SIZES),
+                   buffer_lengths: t.Iterable[int] = BUFFER_LENGTHS) -> t.Dict[str, float]:
+    """Run all benchmarks and return a mapping from benchmark name to its result."""
+    results = {}
+    for size in sizes:
+        text = sample_text(INPUT_SIZES[size])
+        jamo_groups = to_jamo_groups(text)
+        # the numpy backend gains mostly by converting repeated groups once, which these lack
+        unique_jamo_groups = to_jamo_groups(unique_text(INPUT_SIZES[size]))
+        benchmarks = {
+            'to_jamo_groups': lambda: to_jamo_groups(text),
+            'to_jamo_groups.regex': lambda: to_jamo_groups(text, tokenizer='regex'),
+            'to_jamo_groups.union': lambda: to_jamo_groups(text, scheme=UNION_SCHEME),
+            'jamo_to_hangul': lambda: [jamo_to_hangul(jamo) for jamo, _, _ in jamo_groups],
+            'jamo_to_hangul_candidates': lambda: [
+                jamo_to_hangul_candidates(jamo) for jamo, _, _ in jamo_groups],
+            'to_hangul_groups': lambda: to_hangul_groups(jamo_groups),
+            'to_hangul_groups.numpy': lambda: to_hangul_groups(jamo_groups, backend='numpy'),
+            'to_hangul_groups.unique': lambda: to_hangul_groups(unique_jamo_groups),
+            'to_hangul_groups.numpy.unique': lambda: to_hangul_groups(
+                unique_jamo_groups, backend='numpy'),
+            'to_hangul': lambda: to_hangul(text),
+            'to_hangul_with_offsets': lambda: to_hangul_with_offsets(text)}
+        for name, function in benchmarks.items():
+            key = '{}[{}]'.format(name, size)
+            results[key] = measure(function)
+            _LOG.info('%s: %.3e s', key, results[key])
+    for ime_class in IME_CLASSES:
+        for buffer_length in buffer_lengths:
+            ime = ime_class()
+            prefill(ime, sample_text(buffer_length))
+            key = '{}.keystroke[{}]'.format(ime_class.__name__, buffer_length)
+            results[key] = measure_keystroke(ime)
+            _LOG.info('%s: %.3e s', key, results[key])
+            if isinstance(ime, EditableKoreanIME):
+                for _ in range(len(ime.text) // 2):
+                    ime.move_left()
+                key = '{}.keystroke_in_middle[{}]'.format(ime_class.__name__, buffer_length)
+                results[key] = measure_keystroke(ime)
+                _LOG.info('%s: %.3e s', key, results[key])
+        for buffer_length in buffer_lengths:
+            key = '{}.session_bytes[{}]'.format(ime_class.__name__, buffer_length)
+            results[key] = measure_session_size(ime_class, sample_text(buffer_length))
+            _LOG.info('%s: %.0f B', key, results[key])
+    return results
+
+
+def compare_results(results: t.Mapping[str, float], baseline: t.Mapping[str, float],
+                    tolerance: float = DEFAULT_TOLERANCE) -> t.List[str]:
+    """Compare results against a baseline, and return names of benchmarks that regressed."""
+    regressions = []
+    for key, duration in results.items():
+        if key not in baseline:
+            continue
+        ratio = duration / baseline[key]
+        print('{:50} {:10.3e} s {:10.3e} s {:8.2f}x'.format(key, baseline[key], duration, ratio))
+        if ratio > 1 + tolerance:
+            regressions.append(key)
+    return regressions
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description='Benchmarks of romanized Korean IME.')
+    parser.add_argument(
+        '--sizes', nargs='+', choices=list(INPUT_SIZES), default=list(INPUT_SIZES),
+        help='input sizes to benchmark conversion functions with')
+    parser.add_argument(
+        '--buffer-lengths', nargs='+', type=int, default=list(BUFFER_LENGTHS),
+        help='lengths of IME buffers to benchmark keystroke latency with')
+    parser.add_argument('--output', help='file to write the results to, as JSON')
+    parser.add_argument('--baseline', help='JSON file with results to compare against')
+    parser.add_argument(
+        '--tolerance', type=float, default=DEFAULT_TOLERANCE,
+        help='relative slowdown compared to baseline that is considered a regression')
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    parsed_args = parse_args(args)
+    logging.basicConfig()
+    _LOG.setLevel(logging.INFO)
+    results = run_benchmarks(parsed_args.sizes, parsed_args.buffer_lengths)
+    data = {'python': platform.python_version(), 'results': results}
+    if parsed_args.output:
+        with open(parsed_args.output, 'w') as output_file:
+            json.dump(data, output_file, indent=2)
+    else:
+        json.dump(data, sys.stdout, indent=2)
+        print()
+    if parsed_args.baseline:
+        with open(parsed_args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+        regressions = compare_results(results, baseline, parsed_args.tolerance)
+        if regressions:
+            print('regressions:', ', '.join(regressions))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Load test of the Korean IME server.
+
+Run with:
+
+    python -m test.load_test --sessions 1000
+    python -m test.load_test --sessions 1000 --port 8765
+
+Without a port, a server is started in the same process on a free port on localhost.
+Each session connects, types a sample text key by key waiting for each response, and stays
+connected until all sessions are done, so that all of them are open at the same time.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+import typing as t
+
+from romanized_korean_ime.server import KoreanIMEServer
+
+from .benchmarks import sample_text
+
+_LOG = logging.getLogger(__name__)
+
+DEFAULT_SESSIONS = 1000
+
+DEFAULT_TEXT_LENGTH = 35
+
+# connections opened at the same time, to not overflow the listen backlog
+CONNECTING_LIMIT = 100
+
+
+async def run_session(host: str, port: int, text: str, connecting: asyncio.Semaphore,
+                      all_typed: asyncio.Event, latencies: t.List[float]) -> str:
+    """Type the text in one session and return the final output."""
+    async with connecting:
+        reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for char in text:
+            start = time.perf_counter()
+            writer.write(json.dumps({'type': 'key', 'char': char}).encode() + b'\n')
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - start)
+            if 'error' in response:
+                raise RuntimeError(response['error'])
+        writer.write(b'{"type": "state"}\n')
+        output = json.loads(await reader.readline())['output']
+        await all_typed.wait()
+        return output
+    finally:
+        writer.close()
+
+
+async def run_load_test(host: str, port: int, sessions: int, text: str) -> t.Dict[str, t.Any]:
+    connecting = asyncio.Semaphore(CONNECTING_LIMIT)
+    all_typed = asyncio.Event()
+    latencies = []  # type: t.List[float]
+    start = time.perf_counter()
+    tasks = [asyncio.ensure_future(
+        run_session(host, port, text, connecting, all_typed, latencies))
+             for _ in range(sessions)]
+    while len(latencies) < sessions * len(text) and not any(_.done() for _ in tasks):
+        await asyncio.sleep(0.01)
+    all_typed.set()
+    outputs = await asyncio.gather(*tasks)
+    duration = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'sessions': sessions,
+        'keystrokes': len(latencies),
+        'seconds': duration,
+        'keystrokes_per_second': len(latencies) / duration,
+        'latency_median': statistics.median(latencies),
+        'latency_p99': latencies[int(len(latencies) * 0.99)],
+        'distinct_outputs': len(set(outputs))}
+
+
+async def run_with_server(args) -> t.Dict[str, t.Any]:
+    text = sample_text(args.text_length)
+    if args.port is not None:
+        return await run_load_test(args.host, args.port, args.sessions, text)
+    server = KoreanIMEServer()
+    asyncio_server = await server.start_tcp(args.host, 0)
+    port = asyncio_server.sockets[0].getsockname()[1]
+    try:
+        results = await run_load_test(args.host, port, args.sessions, text)
+    finally:
+        asyncio_server.close()
+        await asyncio_server.wait_closed()
+    return results
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description='Load test of romanized Korean IME server.')
+    parser.add_argument('--host', default='127.0.0.1', help='host of the server')
+    parser.add_argument('--port', type=int, help='port of a running server to test')
+    parser.add_argument('--sessions', type=int, default=DEFAULT_SESSIONS,
+                        help='number of concurrent sessions')
+    parser.add_argument('--text-length', type=int, default=DEFAULT_TEXT_LENGTH,
+                        help='length of text typed in each session')
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    parsed_args = parse_args(args)
+    logging.basicConfig()
+    results = asyncio.run(run_with_server(parsed_args))
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == '__main__':
+    main()
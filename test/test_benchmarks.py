@@ -0,0 +1,44 @@
+"""Tests for the benchmark helpers."""
+
+import unittest
+
+from romanized_korean_ime.deromanize_hangul import to_jamo_groups
+from romanized_korean_ime.korean_ime import KoreanIME, GreedyKoreanIME
+
+from .benchmarks import INPUT_SIZES, sample_text, unique_text, prefill, compare_results
+
+
+class Tests(unittest.TestCase):
+
+    def test_sample_text(self):
+        for name, size in INPUT_SIZES.items():
+            with self.subTest(size=name):
+                text = sample_text(size)
+                self.assertLessEqual(len(text), size)
+                self.assertGreater(len(text), size - 10)
+                to_jamo_groups(text)
+
+    def test_unique_text(self):
+        for name, size in INPUT_SIZES.items():
+            with self.subTest(size=name):
+                text = unique_text(size)
+                self.assertLessEqual(len(text), size)
+                self.assertGreater(len(text), size - 40)
+                words = text.split()
+                self.assertEqual(len(set(words)), len(words))
+
+    def test_prefill(self):
+        text = sample_text(100)
+        typed = GreedyKoreanIME()
+        for char in text:
+            typed.type_printable_character(char)
+        prefilled = GreedyKoreanIME()
+        prefill(prefilled, text)
+        for name in KoreanIME.__slots__:
+            self.assertEqual(getattr(prefilled, name), getattr(typed, name), msg=name)
+
+    def test_compare_results(self):
+        baseline = {'a': 1.0, 'b': 1.0, 'c': 1.0}
+        results = {'a': 0.5, 'b': 1.2, 'c': 2.0, 'd': 5.0}
+        self.assertListEqual(compare_results(results, baseline, 0.5), ['c'])
+        self.assertListEqual(compare_results(results, baseline, 0.1), ['b', 'c'])
@@ -0,0 +1,81 @@
+"""Tests for caching of conversion results."""
+
+import concurrent.futures
+import itertools
+import logging
+import unittest
+
+from romanized_korean_ime.caching import LRUCache
+from romanized_korean_ime.deromanize_hangul import \
+    enable_cache, disable_cache, clear_cache, cache_stats, to_jamo_groups, to_hangul
+
+from .test_deromanize_hangul import \
+    UNAMBIGUOUS_STANDARD_EXAMPLES, UNAMBIGUOUS_NONSTANDARD_EXAMPLES, AMBIGUOUS_EXAMPLES
+
+EXAMPLES = list(itertools.chain(
+    UNAMBIGUOUS_STANDARD_EXAMPLES.keys(), UNAMBIGUOUS_NONSTANDARD_EXAMPLES.keys(),
+    AMBIGUOUS_EXAMPLES))
+
+
+class Tests(unittest.TestCase):
+
+    def tearDown(self):
+        disable_cache()
+
+    def test_lru_cache(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('b', 0), 0)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats(), (2, 2, 1, 2, 2))
+        cache.clear()
+        self.assertEqual(cache.stats(), (0, 0, 0, 0, 2))
+
+    def test_lru_cache_threads(self):
+        cache = LRUCache(100)
+
+        def use_cache(i):
+            for j in range(1000):
+                key = (i * j) % 150
+                if cache.get(key) is None:
+                    cache.put(key, key)
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            list(executor.map(use_cache, range(8)))
+        stats = cache.stats()
+        self.assertEqual(stats.hits + stats.misses, 8000)
+        self.assertEqual(stats.size, 100)
+        self.assertEqual(stats.misses - stats.evictions, stats.size)
+
+    def test_cached_conversion(self):
+        expected = [(to_jamo_groups(_), to_hangul(_)) for _ in EXAMPLES]
+        self.assertEqual(cache_stats(), {})
+        for tokens in (False, True):
+            with self.subTest(tokens=tokens):
+                enable_cache(16, tokens=tokens)
+                for _ in range(2):
+                    self.assertListEqual(
+                        [(to_jamo_groups(_), to_hangul(_)) for _ in EXAMPLES], expected)
+                stats = cache_stats()
+                self.assertEqual(set(stats), {'hangul', 'tokens'} if tokens else {'hangul'})
+                for name, cache_stats_ in stats.items():
+                    self.assertGreater(cache_stats_.hits, 0, msg=name)
+                    self.assertGreater(cache_stats_.evictions, 0, msg=name)
+                    self.assertEqual(cache_stats_.size, 16)
+                self.assertEqual(to_hangul('hoa', aggressive=False), '호아')
+                self.assertEqual(to_hangul('hoa'), '화')
+                with self.assertRaises(ValueError):
+                    to_hangul('fujisan')
+                clear_cache()
+                self.assertEqual(cache_stats()['hangul'].size, 0)
+
+    def test_cached_warnings(self):
+        enable_cache(16)
+        for _ in range(2):
+            with self.assertLogs('romanized_korean_ime.deromanize_hangul', logging.WARNING):
+                self.assertEqual(to_hangul('sarang', warn=True), '살앙')
+        self.assertEqual(cache_stats()['hangul'].size, 0)
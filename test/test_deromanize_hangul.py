@@ -4,8 +4,13 @@ import contextlib
 import io
 import itertools
 import logging
-# import os
+import multiprocessing
+import os
+import subprocess
+import sys
+import unicodedata
 import unittest
+import unittest.mock
 
 import hangul_romanize
 import hangul_romanize.rule
@@ -15,7 +20,15 @@ import kroman
 # import pandas as pd
 
 from romanized_korean_ime.deromanize_hangul import \
-    IGNORED_CHARACTERS, to_jamo_groups, jamo_to_hangul, to_hangul
+    ELEMENTS, HEAD_JAMO, BODY_JAMO, TAIL_JAMO, IGNORED_CHARACTERS, TOKENIZERS, PREFIX_TOKENIZERS, \
+    SCHEMES, match_element, get_tokenizer, set_tokenizer, register_tokenizer, check_tokenizer, \
+    compile_scheme, get_scheme, set_scheme, register_scheme, enable_cache, disable_cache, \
+    InvalidJamoError, to_jamo_groups, to_jamo_groups_prefix, compose_hangul, jamo_to_hangul, \
+    jamo_to_hangul_prefix, leading_syllables, syllables_at, is_ambiguous, validate_jamo, \
+    enumerate_parses, jamo_to_hangul_candidates, substitute_text, substitute_groups, to_jamo, \
+    to_jamo_with_offsets, to_hangul, to_hangul_with_offsets, to_hangul_candidates, \
+    to_hangul_stream, to_hangul_many
+from romanized_korean_ime.generate_tables import TABLES_PATH, generate_tables
 
 _LOG = logging.getLogger(__name__)
 
@@ -91,6 +104,159 @@ class Tests(unittest.TestCase):
                                      jamo_.split('-'))
                 # _LOG.info('%s %i:%i', jamo_to_hangul(jamo_group), begin, end)
 
+    def test_generated_tables(self):
+        with TABLES_PATH.open(encoding='utf-8') as tables_file:
+            self.assertEqual(tables_file.read(), generate_tables(),
+                             msg='run: python -m romanized_korean_ime.generate_tables')
+
+    def test_generated_tables_style(self):
+        for number, line in enumerate(generate_tables().splitlines(), 1):
+            with self.subTest(line=number):
+                self.assertLessEqual(len(line), 100)
+                self.assertEqual(line, line.rstrip())
+
+    def test_tokenizers(self):
+        texts = list(itertools.chain(
+            UNAMBIGUOUS_STANDARD_EXAMPLES, UNAMBIGUOUS_NONSTANDARD_EXAMPLES, AMBIGUOUS_EXAMPLES,
+            ['', '-', 'fujisan', 'sa-rang-', ' ddeugs\tx', 'han\r\ngug', '---ㅍㅛ']))
+        texts += [''.join(_) for _ in itertools.product('angyo-, x', repeat=4)]
+        for name in TOKENIZERS:
+            with self.subTest(tokenizer=name):
+                self.assertEqual(check_tokenizer(name, texts), [])
+                self.assertEqual(to_jamo_groups('sa-rang', tokenizer=name),
+                                 [('ㅅㅏ', 0, 3), ('ㄹㅏㅇ', 3, 7)])
+
+    def test_set_tokenizer(self):
+        with self.assertRaises(ValueError):
+            set_tokenizer('nonexistent')
+        register_tokenizer('upper', lambda text: [(text.upper(), 0, len(text))])
+        try:
+            set_tokenizer('upper')
+            self.assertEqual(get_tokenizer(), 'upper')
+            self.assertEqual(to_jamo_groups('abc'), [('ABC', 0, 3)])
+            self.assertEqual(check_tokenizer('upper', ['', 'a']), ['', 'a'])
+            self.assertEqual(to_jamo_groups_prefix('abc'), ([('ABC', 0, 3)], 3))
+        finally:
+            set_tokenizer('trie')
+            del TOKENIZERS['upper']
+            del PREFIX_TOKENIZERS['upper']
+        result = subprocess.run(
+            [sys.executable, '-c', 'from romanized_korean_ime.deromanize_hangul import *;'
+             'print(get_tokenizer())'],
+            env={**os.environ, 'ROMANIZED_KOREAN_IME_TOKENIZER': 'regex'},
+            stdout=subprocess.PIPE, check=True, universal_newlines=True)
+        self.assertEqual(result.stdout.strip(), 'regex')
+
+    def test_schemes(self):
+        self.assertEqual(get_scheme(), 'revised')
+        self.assertEqual(to_hangul('han-gug-eo', scheme='revised'), '한국어')
+        self.assertEqual(to_hangul('hankwuk-e khe-phi', scheme='yale'), '한국어 커피')
+        self.assertEqual(to_hangul("ch'ŏl-su p'yo", scheme='mccune-reischauer'), '철수 표')
+        for name in SCHEMES:
+            scheme = compile_scheme(name)
+            for romanization, jamo_ in scheme.elements.items():
+                with self.subTest(scheme=name, romanization=romanization):
+                    self.assertEqual(match_element(romanization, 0, scheme.trie),
+                                     (jamo_, len(romanization)))
+        union = compile_scheme('revised+yale')
+        self.assertEqual((union.elements['e'], union.elements['wu']), ('ㅔ', 'ㅜ'))
+        self.assertEqual(compile_scheme('yale+revised').elements['e'], 'ㅓ')
+        self.assertIs(compile_scheme('yale+revised'), compile_scheme('yale+revised'))
+        with self.assertRaises(ValueError):
+            compile_scheme('revised+nonexistent')
+
+    def test_set_scheme(self):
+        texts = ['', 'hankwuk-e', 'khe-phi', 'sa-rang', 'fujisan']
+        texts += [''.join(_) for _ in itertools.product('akhey-, x', repeat=4)]
+        enable_cache(tokens=True)
+        try:
+            self.assertEqual(to_hangul('ke'), '케')
+            set_scheme('yale')
+            self.assertEqual(get_scheme(), 'yale')
+            self.assertEqual(to_hangul('ke'), '거')
+            for name in TOKENIZERS:
+                with self.subTest(tokenizer=name):
+                    self.assertEqual(check_tokenizer(name, texts), [])
+                    self.assertEqual(to_jamo_groups('hankwuk-e', tokenizer=name),
+                                     [('ㅎㅏㄴㄱㅜㄱ', 0, 8), ('ㅓ', 8, 9)])
+            self.assertEqual(to_hangul('sa-rang', scheme='revised'), '사랑')
+        finally:
+            set_scheme('revised')
+            disable_cache()
+        with self.assertRaises(ValueError):
+            set_scheme('nonexistent')
+        result = subprocess.run(
+            [sys.executable, '-c', 'from romanized_korean_ime.deromanize_hangul import *;'
+             'print(get_scheme(), to_hangul("kho-phi"))'],
+            env={**os.environ, 'ROMANIZED_KOREAN_IME_SCHEME': 'yale+revised'},
+            stdout=subprocess.PIPE, check=True, universal_newlines=True)
+        self.assertEqual(result.stdout.strip(), 'yale+revised 코피')
+
+    def test_register_scheme(self):
+        with self.assertRaises(ValueError):
+            register_scheme('yale', {'a': 'ㅏ'})
+        with self.assertRaises(ValueError):
+            register_scheme('dashed', {'a-': 'ㅏ'})
+        with self.assertRaises(ValueError):
+            register_scheme('not jamo', {'a': 'a'})
+        register_scheme('long', {'aaaaaaaa': 'ㅏ', 'a': 'ㅓ', 'kkkkk': 'ㄲ', 'k': 'ㄱ'})
+        try:
+            self.assertEqual(to_jamo('kkkkkaaaaaaaaa k', scheme='long'), 'ㄲㅏㅓ ㄱ')
+            set_scheme('long+revised')
+            self.assertEqual(to_hangul('kkkkkaaaaaaaa sa-rang'), '까 서렁')
+            for name in TOKENIZERS:
+                self.assertEqual(check_tokenizer(name, ['kkkkaaaaaaaaaaa', 'akkkkkk-ka']), [])
+            register_scheme('long', {'aaaaaaaa': 'ㅓ'})
+            self.assertEqual(to_jamo('aaaaaaaa'), 'ㅓ')
+        finally:
+            set_scheme('revised')
+            del SCHEMES['long']
+
+    def test_to_jamo_groups_prefix(self):
+        texts = ['', 'sa-rang', 'sa-rang fujisan', 'x', 'hanx', 'sa-q', 'han\r\ngugx']
+        texts += [''.join(_) for _ in itertools.product('angyo-, x', repeat=4)]
+        for name in PREFIX_TOKENIZERS:
+            for text in texts:
+                with self.subTest(tokenizer=name, text=text):
+                    jamo_groups, end = to_jamo_groups_prefix(text, tokenizer=name)
+                    self.assertEqual(jamo_groups, to_jamo_groups(text[:end]))
+                    if end < len(text):
+                        with self.assertRaises(ValueError):
+                            to_jamo_groups(text[:end + 1])
+        self.assertEqual(to_jamo_groups_prefix('sa-rang fujisan'),
+                         ([('ㅅㅏ', 0, 3), ('ㄹㅏㅇ', 3, 7)], 8))
+        with self.assertRaises(ValueError):
+            to_jamo_groups('sa-rang fujisan')
+
+    def test_match_element(self):
+        for romanization, jamo_ in ELEMENTS.items():
+            with self.subTest(romanization=romanization):
+                self.assertEqual(match_element(romanization, 0), (jamo_, len(romanization)))
+                self.assertEqual(match_element('-' + romanization, 1),
+                                 (jamo_, len(romanization) + 1))
+        self.assertEqual(match_element('yeong', 0), ('ㅕ', 3))
+        self.assertEqual(match_element('xa', 0), (None, 0))
+        self.assertEqual(match_element('y', 0), (None, 0))
+
+    def test_to_jamo_groups_long_text(self):
+        for text_, (jamo_, _) in UNAMBIGUOUS_STANDARD_EXAMPLES.items():
+            with self.subTest(text=text_):
+                jamo_groups = to_jamo_groups(text_)
+                repeated_groups = to_jamo_groups(' '.join(itertools.repeat(text_, 1000)))
+                self.assertEqual(len(repeated_groups), 1000 * len(jamo_groups))
+                for i, (jamo_group, begin, end) in enumerate(repeated_groups):
+                    offset = (i // len(jamo_groups)) * (len(text_) + 1)
+                    self.assertEqual((jamo_group, begin - offset, end - offset),
+                                     jamo_groups[i % len(jamo_groups)])
+
+    def test_compose_hangul(self):
+        for head, body in itertools.product(HEAD_JAMO, BODY_JAMO):
+            with self.subTest(head=head, body=body):
+                self.assertEqual(compose_hangul(head, body), jamo.jamo_to_hangul(head, body))
+                for tail in TAIL_JAMO:
+                    self.assertEqual(compose_hangul(head, body, tail),
+                                     jamo.jamo_to_hangul(head, body, tail))
+
     def test_jamo_to_hangul(self):
         for _, (jamo_, hangul_) in UNAMBIGUOUS_STANDARD_EXAMPLES.items():
             hangul = jamo_to_hangul(jamo_)
@@ -101,6 +267,113 @@ class Tests(unittest.TestCase):
             with self.assertRaises(AssertionError):
                 jamo_to_hangul(jamo_)
 
+    def test_jamo_to_hangul_prefix(self):
+        for _, (jamo_, hangul_) in UNAMBIGUOUS_STANDARD_EXAMPLES.items():
+            self.assertEqual(jamo_to_hangul_prefix(jamo_), (hangul_, len(jamo_)))
+        for jamo_, hangul_ in BAD_JAMO:
+            self.assertEqual(jamo_to_hangul_prefix(jamo_), (hangul_, 3))
+        self.assertEqual(jamo_to_hangul_prefix(''), ('', 0))
+        self.assertEqual(jamo_to_hangul_prefix('ㅅㅏ-ㄹ'), ('사', 3))
+        self.assertEqual(jamo_to_hangul_prefix('ㅅㅏ-ㄹㅏㅇ', limit=1), ('사', 2))
+        self.assertEqual(jamo_to_hangul_prefix('ㅎㅗㅏ', aggressive=False), ('호아', 3))
+        for jamo_ in itertools.product('ㅅㅏㄹㄱㅗㅃ-', repeat=5):
+            jamo_ = ''.join(jamo_)
+            hangul, end = jamo_to_hangul_prefix(jamo_)
+            self.assertEqual(jamo_to_hangul(jamo_[:end]), hangul, msg=jamo_)
+            if end < len(jamo_):
+                with self.assertRaises(InvalidJamoError, msg=jamo_):
+                    jamo_to_hangul(jamo_)
+            else:
+                self.assertEqual(jamo_to_hangul(jamo_), hangul, msg=jamo_)
+
+    def test_optimized_bad_jamo_to_hangul(self):
+        result = subprocess.run(
+            [sys.executable, '-O', '-c', 'from romanized_korean_ime.deromanize_hangul import *\n'
+             'for jamo in ("ㅅㅏㄹㄹㄹ", "ㄹ", "ㅅㅏx"):\n'
+             '    try:\n'
+             '        print(jamo_to_hangul(jamo))\n'
+             '    except InvalidJamoError:\n'
+             '        print("error")\n'
+             'print(*jamo_to_hangul_prefix("ㅅㅏㄹㄹㄹ"))'],
+            stdout=subprocess.PIPE, check=True, universal_newlines=True)
+        self.assertEqual(result.stdout.split('\n'), ['error', 'error', 'error', '살 3', ''])
+
+    def test_leading_syllables(self):
+        self.assertEqual(leading_syllables('ㅎㅗㅏㄴ'), (
+            ('ㅎ', 'ㅘ', 'ㄴ', 4), ('ㅎ', 'ㅘ', '', 3), ('ㅎ', 'ㅗ', '', 2)))
+        self.assertEqual(leading_syllables('ㅎㅗㅏㄴ', aggressive=False), (
+            ('ㅎ', 'ㅗ', '', 2),))
+        self.assertEqual(leading_syllables('ㅏ'), (('ㅇ', 'ㅏ', '', 1),))
+        self.assertEqual(leading_syllables('ㄹ'), ())
+        self.assertEqual(leading_syllables(''), ())
+        self.assertEqual(syllables_at('-ㅎㅗㅏㄴ', 1), [
+            ('ㅎ', 'ㅘ', 'ㄴ', 5), ('ㅎ', 'ㅘ', '', 4), ('ㅎ', 'ㅗ', '', 3)])
+
+    def test_enumerate_parses(self):
+        self.assertEqual(enumerate_parses('ㅅㅏㄹㅏㅇ'), ['살앙', '사랑'])
+        self.assertEqual(enumerate_parses('ㅅㅏㄹㅏㅇ', limit=1), ['살앙'])
+        self.assertEqual(enumerate_parses('ㅅㅏ-ㄹㅏㅇ'), ['사랑'])
+        self.assertEqual(enumerate_parses('ㅎㅗㅏ'), ['화', '호아'])
+        self.assertEqual(enumerate_parses('ㅎㅗㅏ', aggressive=False), ['호아'])
+        self.assertIn('한국어', enumerate_parses('ㅎㅏㄴㄱㅜㄱㅓ'))
+        for jamo_, _ in BAD_JAMO:
+            self.assertEqual(enumerate_parses(jamo_), [])
+        for jamo_ in itertools.product('ㅅㅏㄹㄱㅗ', repeat=5):
+            jamo_ = ''.join(jamo_)
+            parses = enumerate_parses(jamo_)
+            try:
+                hangul = jamo_to_hangul(jamo_)
+            except AssertionError:
+                hangul = None
+            if hangul is not None:
+                self.assertEqual(parses[0], hangul, msg=jamo_)
+            self.assertEqual(len(parses), len(set(parses)), msg=jamo_)
+            self.assertEqual(is_ambiguous(jamo_), len(parses) > 1, msg=jamo_)
+
+    def test_jamo_to_hangul_candidates(self):
+        self.assertEqual(jamo_to_hangul_candidates('ㅅㅏㄹㅏㅇ'), ['살앙', '사랑'])
+        self.assertEqual(jamo_to_hangul_candidates('ㅅㅏㄹㅏㅇ', 1), ['살앙'])
+        self.assertEqual(jamo_to_hangul_candidates('ㅎㅗㅏ', aggressive=False), ['호아'])
+        for jamo_, _ in BAD_JAMO:
+            self.assertEqual(jamo_to_hangul_candidates(jamo_), [])
+        for jamo_ in itertools.product('ㅅㅏㄹㄱㅗ-', repeat=5):
+            jamo_ = ''.join(jamo_)
+            self.assertEqual(jamo_to_hangul_candidates(jamo_, 4, time_budget=None),
+                             enumerate_parses(jamo_, 4), msg=jamo_)
+        jamo_ = 'ㅅㅏㄹㅏㅇ' * 1000
+        self.assertEqual(jamo_to_hangul_candidates(jamo_, time_budget=0), [jamo_to_hangul(jamo_)])
+        # budget runs out in the middle of the search
+        clock = itertools.chain([0.0] * 50, itertools.repeat(1.0))
+        with unittest.mock.patch('time.perf_counter', lambda: next(clock)):
+            candidates = jamo_to_hangul_candidates('ㅅㅏㄹㅏㅇ' * 100, time_budget=0.5)
+        self.assertEqual(candidates, ['살앙' * 100])
+
+    def test_to_hangul_candidates(self):
+        self.assertEqual(to_hangul_candidates('sarang, hoa!', 3),
+                         ['살앙, 화!', '살앙, 호아!', '사랑, 화!'])
+        self.assertEqual(to_hangul_candidates('sa-rang', 3), ['사랑'])
+        self.assertEqual(to_hangul_candidates('...'), ['...'])
+        self.assertEqual(to_hangul_candidates('sarang ' * 100, time_budget=0),
+                         [to_hangul('sarang ' * 100)])
+        with self.assertRaises(InvalidJamoError):
+            to_hangul_candidates('sa salll')
+
+    def test_is_ambiguous(self):
+        for _, (jamo_, _) in UNAMBIGUOUS_STANDARD_EXAMPLES.items():
+            with self.subTest(jamo=jamo_):
+                self.assertFalse(is_ambiguous(jamo_))
+        for text_ in ('sarang', 'hangugeo', 'jigeum', 'boda', 'gati', 'hoa'):
+            with self.subTest(text=text_):
+                self.assertTrue(any(is_ambiguous(jamo_) for jamo_, _, _ in to_jamo_groups(text_)))
+        self.assertTrue(is_ambiguous('ㅅㅏㄹㅏㅇ' * 10000))
+
+    def test_warn_ambiguous(self):
+        logger = 'romanized_korean_ime.deromanize_hangul'
+        with self.assertLogs(logger, level=logging.WARNING) as logs:
+            self.assertEqual(jamo_to_hangul('ㅅㅏㄹㅏㅇ', warn=True), '살앙')
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('사랑', logs.output[0])
+
     def test_compare_kroman(self):
         for example in UNAMBIGUOUS_STANDARD_EXAMPLES:
             hangul = to_hangul(example)
@@ -149,6 +422,16 @@ class Tests(unittest.TestCase):
                 self.assertEqual(list(jamo.jamo_to_hangul(*good))[0], jamo_to_hangul(good))
                 self.assertEqual(list(jamo.jamo_to_hangul(*bad))[0], jamo_to_hangul(bad))
 
+    def test_validate_jamo(self):
+        self.assertEqual(validate_jamo('ㄸㅡᆪ'), 'ㄸㅡᆪ')
+        self.assertEqual(validate_jamo('뜫'), 'ㄸㅡᆪ')
+        self.assertEqual(validate_jamo('ㄸㅡㄳ'), 'ㄸㅡᆪ')
+        for head, body, tail in itertools.product(HEAD_JAMO, BODY_JAMO, TAIL_JAMO):
+            decomposed = unicodedata.normalize('NFD', jamo.jamo_to_hangul(head, body, tail))
+            self.assertEqual(validate_jamo(decomposed), head + body + tail)
+        with self.assertRaises(AssertionError):
+            validate_jamo('ㅅㅏx')
+
     def test_preserve_ignored_characters(self):
         for example in itertools.chain(
                 UNAMBIGUOUS_STANDARD_EXAMPLES.keys(), UNAMBIGUOUS_NONSTANDARD_EXAMPLES.keys(),
@@ -165,6 +448,90 @@ class Tests(unittest.TestCase):
                 hangul_ = jamo_to_hangul(jamo_)
                 self.assertEqual(hangul_, hangul)
 
+    def test_substitute_groups(self):
+        text = 'ab cd ef'
+        groups = [('X', 0, 2), ('YY', 3, 4), ('', 6, 8)]
+        expected = text
+        for group, begin, end in reversed(groups):
+            expected = substitute_text(expected, group, begin, end)
+        self.assertEqual(substitute_groups(text, groups), expected)
+        self.assertEqual(substitute_groups(text, []), text)
+
+    def test_with_offsets(self):
+        for example in itertools.chain(
+                UNAMBIGUOUS_STANDARD_EXAMPLES.keys(), UNAMBIGUOUS_NONSTANDARD_EXAMPLES.keys(),
+                AMBIGUOUS_EXAMPLES, ['', 'sa-rang, hangug-eo?']):
+            for convert, convert_with_offsets in ((to_jamo, to_jamo_with_offsets),
+                                                  (to_hangul, to_hangul_with_offsets)):
+                with self.subTest(example=example, convert=convert.__name__):
+                    output, offsets = convert_with_offsets(example)
+                    self.assertEqual(output, convert(example))
+                    self.assertEqual(len(offsets), len(output))
+                    self.assertEqual(offsets.source_span(0, len(output)), (0, len(example)))
+                    spans = [offsets.span(_) for _ in range(len(output))]
+                    self.assertEqual(spans, sorted(spans))
+                    self.assertTrue(all(begin < end for begin, end in spans))
+        hangul, offsets = to_hangul_with_offsets('sa-rang, hangug-eo')
+        self.assertEqual(hangul, '사랑, 항욱어')
+        self.assertEqual([offsets.span(_) for _ in range(3)], [(0, 3), (3, 7), (7, 8)])
+
+    def test_to_hangul_stream(self):
+        text = ' '.join(itertools.chain(
+            UNAMBIGUOUS_STANDARD_EXAMPLES.keys(), UNAMBIGUOUS_NONSTANDARD_EXAMPLES.keys(),
+            AMBIGUOUS_EXAMPLES)) * 10
+        hangul = to_hangul(text)
+        for chunk_size in (1, 2, 3, 7, 100, len(text)):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(''.join(to_hangul_stream(io.StringIO(text), chunk_size)), hangul)
+                chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+                self.assertEqual(''.join(to_hangul_stream(chunks)), hangul)
+        with self.assertRaises(ValueError):
+            ''.join(to_hangul_stream(io.StringIO('sa-rang fujisan'), 4))
+
+    def test_to_hangul_many(self):
+        examples = list(itertools.chain(
+            UNAMBIGUOUS_STANDARD_EXAMPLES.keys(), UNAMBIGUOUS_NONSTANDARD_EXAMPLES.keys(),
+            AMBIGUOUS_EXAMPLES, ['fujisan', 'salll']))
+        texts = examples * 3
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs):
+                results = to_hangul_many(texts, jobs=jobs, chunksize=4)
+                self.assertEqual(len(results), len(texts))
+                for text, result in zip(texts, results):
+                    if text == 'fujisan':
+                        self.assertIsInstance(result, ValueError)
+                    elif text == 'salll':
+                        self.assertIsInstance(result, AssertionError)
+                    else:
+                        self.assertEqual(result, to_hangul(text))
+
+    def test_to_hangul_many_settings(self):
+        texts = ['ke', 'khe-phi', 'kkkkkaaaaaaaa', 'x'] * 3
+        register_scheme('long', {'aaaaaaaa': 'ㅏ', 'kkkkk': 'ㄲ'})
+        set_scheme('yale+long')
+        set_tokenizer('regex')
+        enable_cache(16)
+        try:
+            expected = to_hangul_many(texts)
+            self.assertEqual(expected[:3], ['거', '커피', '까'])
+            for start_method in multiprocessing.get_all_start_methods():
+                with self.subTest(start_method=start_method):
+                    self.assertEqual(to_hangul_many(
+                        texts, jobs=2, chunksize=1,
+                        mp_context=multiprocessing.get_context(start_method))[:3], expected[:3])
+        finally:
+            set_scheme('revised')
+            set_tokenizer('trie')
+            disable_cache()
+            del SCHEMES['long']
+
+    def test_tracing(self):
+        with self.assertLogs('romanized_korean_ime', level=logging.DEBUG) as logs:
+            to_hangul('sa-rang')
+        self.assertTrue(any(_.startswith('DEBUG:') for _ in logs.output))
+        self.assertTrue(any('to_jamo_groups' in _ for _ in logs.output))
+        self.assertTrue(any('jamo_to_hangul' in _ for _ in logs.output))
+
     def test_errors(self):
         with self.assertRaises(ValueError):
             to_jamo_groups('fujisan')
@@ -0,0 +1,65 @@
+"""Tests for the syllable frequency model and candidates ranked by it."""
+
+import os
+import pickle
+import tempfile
+import unittest
+
+from romanized_korean_ime.deromanize_hangul import \
+    to_jamo, enumerate_parses, jamo_to_hangul_candidates, to_hangul_candidates
+from romanized_korean_ime.frequency_model import HANGUL_SYLLABLES_COUNT, FrequencyModel
+from romanized_korean_ime.korean_ime import GreedyKoreanIME
+
+from .test_korean_ime import type_keystrokes
+
+WORD_COUNTS = [('사랑', 10), ('사랑하다', 5), ('지금', 3), ('한국어', 4), ('살', 1), ('x', 7)]
+
+
+class Tests(unittest.TestCase):
+
+    def setUp(self):
+        self.model = FrequencyModel.from_counts(WORD_COUNTS)
+
+    def test_score(self):
+        self.assertGreater(self.model.score('', '사'), self.model.score('', '살'))
+        self.assertGreater(self.model.score('', '살'), self.model.score('', '앙'))
+        self.assertGreater(self.model.score('사', '랑'), self.model.score('사', '앙'))
+        self.assertGreater(self.model.score('사', '랑'), self.model.score('', '랑'))
+        self.assertAlmostEqual(self.model.score('사', '랑'), 0)
+        with self.assertRaises(ValueError):
+            FrequencyModel([0.0], {})
+
+    def test_min_count(self):
+        model = FrequencyModel.from_counts(WORD_COUNTS, min_count=4)
+        self.assertAlmostEqual(model.score('사', '랑'), 0)
+        self.assertLess(model.score('지', '금'), self.model.score('지', '금'))
+
+    def test_load_and_pickle(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'frequencies.txt')
+            with open(path, 'w', encoding='utf-8') as words_file:
+                words_file.write(''.join('{} {}\n'.format(*_) for _ in WORD_COUNTS) + '\n지금\n')
+            model = FrequencyModel.load(path)
+        self.assertEqual(len(model._unigrams), HANGUL_SYLLABLES_COUNT)
+        self.assertGreater(model.score('지', '금'), model.score('지', '음'))
+        model = pickle.loads(pickle.dumps(self.model))
+        self.assertEqual(model.score('사', '랑'), self.model.score('사', '랑'))
+
+    def test_ranked_candidates(self):
+        self.assertEqual(jamo_to_hangul_candidates(to_jamo('sarang'), model=self.model),
+                         ['사랑', '살앙'])
+        self.assertEqual(jamo_to_hangul_candidates(to_jamo('saranghada'), 2, model=self.model),
+                         ['사랑하다', '사랑핟아'])
+        self.assertEqual(to_hangul_candidates('sarang jigeum', 3, model=self.model),
+                         ['사랑 지금', '사랑 직음', '살앙 지금'])
+        ime = GreedyKoreanIME()
+        type_keystrokes(ime, 'sarang')
+        self.assertEqual(ime.hangul, '살앙')
+        self.assertEqual(ime.candidates(model=self.model), ['사랑', '살앙'])
+
+    def test_time_budget(self):
+        jamo = to_jamo('saranghada' * 100)
+        self.assertEqual(jamo_to_hangul_candidates(jamo, model=self.model, time_budget=0),
+                         enumerate_parses(jamo, 1))
+        self.assertEqual(jamo_to_hangul_candidates(jamo, 1, model=self.model, time_budget=None),
+                         ['사랑하다' * 100])
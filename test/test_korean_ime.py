@@ -0,0 +1,295 @@
+"""Tests for the Korean IME."""
+
+import array
+import itertools
+import logging
+import unittest
+import unittest.mock
+
+from romanized_korean_ime.deromanize_hangul import INTERRUPTORS, to_hangul
+from romanized_korean_ime import korean_ime
+from romanized_korean_ime.korean_ime import \
+    display_width, output_delta, split_segments, GreedyKoreanIME, IncrementalKoreanIME, \
+    EditableKoreanIME
+
+from .test_deromanize_hangul import \
+    UNAMBIGUOUS_STANDARD_EXAMPLES, UNAMBIGUOUS_NONSTANDARD_EXAMPLES, AMBIGUOUS_EXAMPLES
+
+_LOG = logging.getLogger(__name__)
+
+_BACKSPACE = '\b'
+
+KEYSTROKE_EXAMPLES = [
+    'sarang\b\b\b-rang',
+    'sa-rang ha\b\b\bha-da',
+    'ne, joh-a-yo.\b\b\b\b\b\b\b\ba-yo?',
+    'salll ga\b\b\b\b\b ga',
+    'sa x ga',
+    'sa--rang\b\b\b\b\b\b\b\b\b\b',
+    'hangugeohaneun' * 5 + '\b' * 40 + 'saranghaeyo']
+
+
+def type_keystrokes(ime, keystrokes):
+    outputs = []
+    for char in keystrokes:
+        try:
+            if char == _BACKSPACE:
+                delta = ime.type_backspace()
+            else:
+                delta = ime.type_printable_character(char)
+        except ValueError:
+            outputs.append(ValueError)
+            break
+        outputs.append((delta, ime.output, ime.text, ime.jamo, ime.hangul))
+    return outputs
+
+
+# editing keys alike in Emacs: home, left, delete, end and right
+EDITING_KEYS = {'\x01': 'move_home', '\x02': 'move_left', '\x04': 'type_delete',
+                '\x05': 'move_end', '\x06': 'move_right', _BACKSPACE: 'type_backspace'}
+
+EDITING_EXAMPLES = [
+    'sa-rang\x02\x02\x02\x02\x04',
+    'sa-rang ha-da\x01hae\x06\x06\x04\x04 \x05\b\by',
+    'han-gug\x02\x02\x02\x02-\x02\x02\x02\x02\x02\x02\b\x04',
+    'mu-seun yeonghwa-reul\x01\x06\x06\x06\x06\x06\x06\x06\x06 \x05.',
+    'a b c\x02\x02\b\b\x02\x06\x06\x06\x06\b\x01\x01\x04\x04\x04\x04\x04']
+
+
+def edit(ime, keystrokes):
+    """Type keystrokes into an editable IME, and for each get text, cursor, output and delta."""
+    results = []
+    for char in keystrokes:
+        if char in EDITING_KEYS:
+            delta = getattr(ime, EDITING_KEYS[char])()
+        else:
+            delta = ime.type_printable_character(char)
+        results.append((ime.text, ime.cursor, ime.output, ime.output_cursor, delta))
+    return results
+
+
+def render(screen, cursor, delta):
+    """Apply terminal output to a single line of cells, and return the new cursor position."""
+    for char in delta:
+        if char == '\b':
+            cursor -= 1
+            continue
+        width = display_width(char)
+        screen[cursor:cursor + width] = [char] + [''] * (width - 1)
+        cursor += width
+    return cursor
+
+
+class Tests(unittest.TestCase):
+
+    def test_output_delta(self):
+        self.assertEqual(output_delta('사랑', '사랑하'), '하')
+        self.assertEqual(output_delta('사랑ㅎ', '사랑하'), '\b\b하')
+        self.assertEqual(output_delta('사랑하', '사랑ㅎ'), '\b\bㅎ')
+        self.assertEqual(output_delta('사랑 ha', '사랑 '), '\b\b  \b\b')
+        self.assertEqual(output_delta('살앙', '사랑'), '\b\b\b\b사랑')
+        self.assertEqual(output_delta('', ''), '')
+
+    def test_output_delta_rendering(self):
+        for example in KEYSTROKE_EXAMPLES + ['sa-rang ha-da\b\b\b\b\b\b\bx', 'ha\b\b\b']:
+            with self.subTest(example=example):
+                ime = IncrementalKoreanIME()
+                screen = []
+                cursor = 0
+                for delta, output, _, _, _ in type_keystrokes(ime, example):
+                    cursor = render(screen, cursor, delta)
+                    self.assertEqual(cursor, display_width(output))
+                    self.assertEqual(''.join(screen).rstrip(' '), output.rstrip(' '))
+
+    def test_converted_prefix(self):
+        for keystrokes, outputs in [
+                ('add', ['아', '앋', '아ㄸ']),
+                ('adda', ['아', '앋', '아ㄸ', '아따']),
+                ('chx', ['c', 'ㅊ', 'ㅊx']),
+                ('salll', ['ㅅ', '사', '살', '살ㄹ', '살ㄹㄹ'])]:
+            with self.subTest(keystrokes=keystrokes):
+                ime = GreedyKoreanIME()
+                self.assertEqual([_[1] for _ in type_keystrokes(ime, keystrokes)], outputs)
+
+    def test_candidates(self):
+        for keystrokes, candidates in [
+                ('', []), ('x', []), ('sarang', ['살앙', '사랑']), ('sa-rang hoa', ['화', '호아']),
+                ('salll', ['살'])]:
+            with self.subTest(keystrokes=keystrokes):
+                ime = GreedyKoreanIME()
+                type_keystrokes(ime, keystrokes)
+                self.assertEqual(ime.candidates(), candidates)
+        ime = IncrementalKoreanIME()
+        type_keystrokes(ime, 'sarang')
+        self.assertEqual(ime.candidates(1, time_budget=0), ['살앙'])
+        type_keystrokes(ime, ' ')
+        self.assertEqual(ime.candidates(), [])
+
+    def test_incremental_same_as_greedy(self):
+        for example in itertools.chain(
+                UNAMBIGUOUS_STANDARD_EXAMPLES.keys(), UNAMBIGUOUS_NONSTANDARD_EXAMPLES.keys(),
+                AMBIGUOUS_EXAMPLES, KEYSTROKE_EXAMPLES, [' '.join(UNAMBIGUOUS_STANDARD_EXAMPLES)]):
+            with self.subTest(example=example):
+                greedy = type_keystrokes(GreedyKoreanIME(), example)
+                incremental = type_keystrokes(IncrementalKoreanIME(), example)
+                self.assertListEqual(greedy, incremental)
+
+    def test_incremental_commits_segments(self):
+        ime = IncrementalKoreanIME()
+        type_keystrokes(ime, 'sa-rang ha-da')
+        self.assertEqual(ime.output, '사랑 하다')
+        self.assertEqual(len(ime._segments), 3)
+        self.assertEqual(ime._uncommitted_text, 'da')
+        type_keystrokes(ime, '\b' * 6)
+        self.assertEqual(ime.output, '사랑')
+        self.assertEqual(ime.text, 'sa-rang')
+
+    def test_commit_and_uncommit(self):
+        ime = GreedyKoreanIME()
+        type_keystrokes(ime, 'salll ga')
+        self.assertEqual(ime.output, '살ㄹㄹ ㄱㅏ')
+        self.assertFalse(ime.uncommit())
+        self.assertTrue(ime.commit())
+        self.assertEqual(ime._segments, [('sal', 'ㅅㅏㄹ', '살', '살')])
+        self.assertEqual(ime._uncommitted_text, 'll ga')
+        self.assertEqual(ime.output, '살ㄹㄹ ㄱㅏ')
+        type_keystrokes(ime, '\b' * 5)
+        self.assertEqual(ime.output, '살')
+        self.assertFalse(ime.commit())
+        self.assertTrue(ime.uncommit())
+        self.assertEqual(ime._segments, [])
+        self.assertEqual((ime.text, ime.jamo, ime.hangul, ime.output), ('sal', 'ㅅㅏㄹ', '살', '살'))
+        self.assertFalse(ime.uncommit())
+
+    def test_incremental_commits_syllables(self):
+        ime = IncrementalKoreanIME()
+        type_keystrokes(ime, 'hangugeohaneun' * 5)
+        self.assertEqual(ime.output, to_hangul('hangugeohaneun' * 5))
+        self.assertLess(len(ime._uncommitted_text), 30)
+        type_keystrokes(ime, '\b' * 70)
+        self.assertEqual(ime._boundaries, array.array('I'))
+
+    def test_keystroke_work_independent_of_text_length(self):
+        converted_lens = []
+        for words_count in (7, 214):
+            ime = IncrementalKoreanIME()
+            for char in 'hangugeohaneun' * words_count:
+                ime.type_printable_character(char)
+            with unittest.mock.patch.object(
+                    korean_ime, 'to_jamo_groups_prefix',
+                    wraps=korean_ime.to_jamo_groups_prefix) as to_jamo_groups_prefix:
+                type_keystrokes(ime, 'hangugeo')
+            converted_lens.append(
+                [len(text) for (text,), _ in to_jamo_groups_prefix.call_args_list])
+        self.assertEqual(converted_lens[0], converted_lens[1])
+        self.assertLess(max(converted_lens[1]), 30)
+
+    def test_commit_limit(self):
+        ime = IncrementalKoreanIME(commit_limit=5)
+        type_keystrokes(ime, 'saranghaeyo ga')
+        self.assertEqual(ime.output, to_hangul('sarang-haeyo ga'))
+        self.assertEqual([text for text, _, _, _ in ime._segments], ['sar', 'ang', 'haeyo '])
+        type_keystrokes(ime, '\b' * 6)
+        self.assertEqual(ime.output, '살앙하')
+        self.assertEqual(ime.text, 'sarangha')
+        type_keystrokes(ime, '\b' * 3)
+        self.assertEqual(ime.output, '살안')
+        self.assertEqual([text for text, _, _, _ in ime._segments], [])
+
+    def test_commit_limit_same_as_greedy(self):
+        for example in ('hangugeohangugeo', 'saranghaeyo ga' + '\b' * 9):
+            for commit_limit in (5, 10):
+                with self.subTest(example=example, commit_limit=commit_limit):
+                    greedy = type_keystrokes(GreedyKoreanIME(), example)
+                    incremental = type_keystrokes(
+                        IncrementalKoreanIME(commit_limit=commit_limit), example)
+                    self.assertListEqual(greedy, incremental)
+
+    def test_compact_state(self):
+        ime = IncrementalKoreanIME()
+        type_keystrokes(ime, 'sa-rang ha-da')
+        self.assertFalse(hasattr(ime, '__dict__'))
+        self.assertEqual(ime._committed_text + ime._text, ime.text)
+        self.assertEqual(list(ime._boundaries), [3, 1, 1, 8, 2, 3, 11, 4, 4])
+
+    def test_output_delta_with_cursor(self):
+        self.assertEqual(output_delta('사랑', '사랑', 2, 1), '\b\b')
+        self.assertEqual(output_delta('사랑', '사랑', 0, 2), '사랑')
+        self.assertEqual(output_delta('살', '사', 1, 1), '\b\b사')
+        self.assertEqual(output_delta('사', '살', 0, 0), '살\b\b')
+        self.assertEqual(output_delta('사', '사ㄹ', 1, 2, '랑'), 'ㄹ랑\b\b')
+
+    def test_split_segments(self):
+        self.assertEqual(split_segments(''), [])
+        self.assertEqual(split_segments('sa-rang ha-da'), ['sa-', 'rang ', 'ha-', 'da'])
+        self.assertEqual(split_segments(' a,  b.'), [' ', 'a,  ', 'b.'])
+
+    def test_convert_with_offsets(self):
+        output, offsets = GreedyKoreanIME.convert_with_offsets('sa-rang hx')
+        self.assertEqual(output, '사랑 ㅎx')
+        self.assertEqual([offsets.span(_) for _ in range(len(output))],
+                         [(0, 3), (3, 7), (7, 8), (8, 9), (9, 10)])
+
+    def test_editable(self):
+        ime = EditableKoreanIME()
+        edit(ime, 'sa-rang ha-da')
+        self.assertEqual((ime.output, ime.cursor, ime.output_cursor), ('사랑 하다', 13, 5))
+        edit(ime, '\x01\x06\x06\x06' + 'rang-')
+        self.assertEqual(ime.text, 'sa-rang-rang ha-da')
+        self.assertEqual(ime.output, '사랑랑 하다')
+        self.assertEqual((ime.cursor, ime.output_cursor), (8, 2))
+        edit(ime, '\x05\b\b')
+        self.assertEqual(ime.output, '사랑랑 하')
+        self.assertEqual(ime.cursor, len(ime.text))
+
+    def test_editable_rendering(self):
+        for example in EDITING_EXAMPLES + KEYSTROKE_EXAMPLES:
+            with self.subTest(example=example):
+                ime = EditableKoreanIME()
+                text = ''
+                text_cursor = 0
+                screen = []
+                cursor = 0
+                for char, (text_, text_cursor_, output, output_cursor, delta) \
+                        in zip(example, edit(ime, example)):
+                    if char == _BACKSPACE:
+                        text = text[:max(0, text_cursor - 1)] + text[text_cursor:]
+                        text_cursor = max(0, text_cursor - 1)
+                    elif char == '\x04':
+                        text = text[:text_cursor] + text[text_cursor + 1:]
+                    elif char in EDITING_KEYS:
+                        text_cursor = {'\x01': 0, '\x02': max(0, text_cursor - 1),
+                                       '\x05': len(text),
+                                       '\x06': min(len(text), text_cursor + 1)}[char]
+                    else:
+                        text = text[:text_cursor] + char + text[text_cursor:]
+                        text_cursor += 1
+                    self.assertEqual((text_, text_cursor_), (text, text_cursor))
+                    self.assertEqual(output, ''.join(
+                        EditableKoreanIME.convert_segment(_)[1] for _ in split_segments(text)))
+                    cursor = render(screen, cursor, delta)
+                    self.assertEqual(cursor, display_width(output[:output_cursor]))
+                    self.assertEqual(''.join(screen).rstrip(' '), output.rstrip(' '))
+
+    def test_editable_same_as_greedy(self):
+        for example in KEYSTROKE_EXAMPLES:
+            with self.subTest(example=example):
+                greedy = GreedyKoreanIME()
+                editable = EditableKoreanIME()
+                for text, _, output, _, _ in edit(editable, example):
+                    greedy._text = text
+                    greedy.convert_text_to_jamo()
+                    greedy.convert_jamo_to_hangul()
+                    # segments that cannot be fully converted do not stop conversion of the next
+                    if not greedy._unconverted_text \
+                            and all(_ in INTERRUPTORS for _ in greedy._jamo_text):
+                        self.assertEqual(output, greedy.output)
+
+    def test_editable_converts_only_edited_segment(self):
+        ime = EditableKoreanIME()
+        edit(ime, 'sa-rang ha-da ' * 10 + '\x01\x06\x06')
+        segments = list(ime._segments)
+        edit(ime, 'n')
+        self.assertEqual(ime.output, '산랑 하다 ' + '사랑 하다 ' * 9)
+        self.assertIsNot(ime._segments[0], segments[0])
+        self.assertTrue(all(a is b for a, b in zip(ime._segments[1:], segments[1:])))
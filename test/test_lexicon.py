@@ -0,0 +1,104 @@
+"""Tests for the lexicon index and segmentation guided by it."""
+
+import os
+import pickle
+import tempfile
+import unittest
+
+from romanized_korean_ime.deromanize_hangul import \
+    enable_cache, disable_cache, to_jamo, jamo_to_hangul, to_hangul, to_hangul_many
+from romanized_korean_ime.lexicon import Lexicon, write_lexicon, segment, main
+
+WORDS = ['사랑', '지금', '한국', '한국어', '사랑방', '하다', '사랑', '']
+
+SEGMENTED_EXAMPLES = {
+    'sarang': ('살앙', '사랑'),
+    'jigeum': ('직음', '지금'),
+    'saranghada': ('살앙핟아', '사랑하다'),
+    'sarangbang': ('살앙방', '사랑방'),
+    'sa-rang': ('사랑', '사랑'),
+    'sal-ang': ('살앙', '살앙'),
+    'gati': ('같이', '같이')}
+
+
+class Tests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._directory.name, 'lexicon.idx')
+        self.assertEqual(write_lexicon(WORDS, self.path), 6)
+        self.lexicon = Lexicon(self.path)
+
+    def tearDown(self):
+        self.lexicon.close()
+        self._directory.cleanup()
+
+    def test_lookup(self):
+        self.assertEqual(len(self.lexicon), 6)
+        self.assertEqual(list(self.lexicon), sorted(set(WORDS) - {''}))
+        self.assertIn('사랑방', self.lexicon)
+        self.assertNotIn('사', self.lexicon)
+        self.assertEqual(self.lexicon.lookup('사'), (False, True))
+        self.assertEqual(self.lexicon.lookup('사랑'), (True, True))
+        self.assertEqual(self.lexicon.lookup('한국어'), (True, False))
+        self.assertEqual(self.lexicon.lookup('힣'), (False, False))
+        self.assertEqual(self.lexicon.lookup('가'), (False, False))
+
+    def test_empty_and_invalid(self):
+        path = os.path.join(self._directory.name, 'empty.idx')
+        write_lexicon([], path)
+        with Lexicon(path) as lexicon:
+            self.assertEqual(len(lexicon), 0)
+            self.assertEqual(lexicon.lookup('사랑'), (False, False))
+        with open(path, 'wb') as index_file:
+            index_file.write(b'not an index')
+        with self.assertRaises(ValueError):
+            Lexicon(path)
+
+    def test_pickle(self):
+        lexicon = pickle.loads(pickle.dumps(self.lexicon))
+        self.assertEqual(lexicon.path, self.path)
+        self.assertEqual(list(lexicon), list(self.lexicon))
+        lexicon.close()
+
+    def test_segment(self):
+        for text, (greedy, segmented) in SEGMENTED_EXAMPLES.items():
+            with self.subTest(text=text):
+                self.assertEqual(to_hangul(text), greedy)
+                self.assertEqual(to_hangul(text, lexicon=self.lexicon), segmented)
+        self.assertEqual(segment(to_jamo('saranghada'), self.lexicon), '사랑하다')
+        self.assertEqual(segment('ㅅㅏㄹ-ㅏㅇ', self.lexicon), '살앙')
+        self.assertEqual(segment('ㅅㅏ-ㄹㅏㅇ', self.lexicon), '사랑')
+        self.assertIsNone(segment('ㅅㅏㄹㄹㄹ', self.lexicon))
+        self.assertEqual(jamo_to_hangul('ㅅㅏㄹㅏㅇㅎㅏㄷㅏ', lexicon=self.lexicon, limit=3), '사랑하')
+
+    def test_segment_without_words(self):
+        path = os.path.join(self._directory.name, 'empty.idx')
+        write_lexicon([], path)
+        with Lexicon(path) as lexicon:
+            for text in SEGMENTED_EXAMPLES:
+                with self.subTest(text=text):
+                    self.assertEqual(to_hangul(text, lexicon=lexicon), to_hangul(text))
+
+    def test_to_hangul_options(self):
+        texts = list(SEGMENTED_EXAMPLES) * 3
+        expected = [segmented for _, segmented in SEGMENTED_EXAMPLES.values()] * 3
+        self.assertEqual(to_hangul(' '.join(texts), backend='numpy', lexicon=self.lexicon),
+                         ' '.join(expected))
+        self.assertEqual(to_hangul_many(texts, jobs=2, chunksize=2, lexicon=self.lexicon),
+                         expected)
+        enable_cache()
+        try:
+            self.assertEqual(to_hangul('sarang'), '살앙')
+            self.assertEqual(to_hangul('sarang', lexicon=self.lexicon), '사랑')
+        finally:
+            disable_cache()
+
+    def test_main(self):
+        words_path = os.path.join(self._directory.name, 'words.txt')
+        with open(words_path, 'w', encoding='utf-8') as words_file:
+            words_file.write('\n'.join(WORDS) + '\n')
+        index_path = os.path.join(self._directory.name, 'main.idx')
+        main([words_path, index_path])
+        with Lexicon(index_path) as lexicon:
+            self.assertEqual(list(lexicon), list(self.lexicon))
@@ -0,0 +1,51 @@
+"""Tests for the command-line interface."""
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import unittest
+
+from romanized_korean_ime.main import main
+
+# modules that are slow to import and are not needed unless the IME is used interactively,
+# and the module that derives tables, which are loaded already derived instead
+DEFERRED_MODULES = (
+    'readchar', 'concurrent.futures', 'numpy', 'pprint', 'romanized_korean_ime.generate_tables')
+
+
+def import_times(module: str) -> dict:
+    """Import a module in a fresh interpreter and return cumulative import time of each module."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import {}'.format(module)],
+        stderr=subprocess.PIPE, check=True, universal_newlines=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+class Tests(unittest.TestCase):
+
+    def test_help_input(self):
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            main(['--help-input'])
+        self.assertIn('ng : ㅇ', output.getvalue())
+        self.assertIn('ㄹㅎ: ᆶ', output.getvalue())
+
+    def test_deferred_imports(self):
+        times = import_times('romanized_korean_ime.main')
+        self.assertIn('romanized_korean_ime.deromanize_hangul', times)
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, times)
+
+    def test_no_logging_configuration_at_import(self):
+        result = subprocess.run(
+            [sys.executable, '-c', 'import logging, romanized_korean_ime.main;'
+             'print(len(logging.getLogger().handlers))'],
+            env={**os.environ, 'LOGGING_LEVEL': 'debug'},
+            stdout=subprocess.PIPE, check=True, universal_newlines=True)
+        self.assertEqual(result.stdout.strip(), '0')
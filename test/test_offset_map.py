@@ -0,0 +1,29 @@
+"""Tests for mapping of output positions to source positions."""
+
+import unittest
+
+from romanized_korean_ime.offset_map import OffsetMap
+
+
+class Tests(unittest.TestCase):
+
+    def test_offset_map(self):
+        # 'ab' copied, 'ccc' converted into 2 characters, 'd' copied
+        offsets = OffsetMap()
+        offsets.append_copied(0, 2)
+        offsets.append_converted(2, 2, 5)
+        offsets.append_copied(5, 6)
+        self.assertEqual(offsets, OffsetMap([0, 1, 2, 2, 5], [1, 2, 5, 5, 6]))
+        self.assertEqual(len(offsets), 5)
+        self.assertEqual(offsets.span(3), (2, 5))
+        self.assertEqual(offsets.source_span(1, 3), (1, 5))
+        self.assertEqual(offsets.source_span(2, 2), (2, 2))
+        self.assertEqual([offsets.source_offset(_) for _ in range(6)], [0, 1, 2, 2, 5, 6])
+        self.assertEqual([offsets.output_offset(_) for _ in range(7)], [0, 1, 2, 2, 2, 4, 5])
+
+    def test_empty(self):
+        offsets = OffsetMap()
+        self.assertEqual(len(offsets), 0)
+        self.assertEqual(offsets.source_offset(0), 0)
+        self.assertEqual(offsets.output_offset(0), 0)
+        self.assertEqual(offsets.source_span(0, 0), (0, 0))
@@ -0,0 +1,46 @@
+"""Tests for hangul romanization."""
+
+import itertools
+import unittest
+
+from romanized_korean_ime.deromanize_hangul import HEAD_ORDER, BODY_ORDER, to_hangul
+from romanized_korean_ime.romanize_hangul import \
+    SYLLABLES_COUNT, romanize, round_trip_failures
+
+from .test_deromanize_hangul import UNAMBIGUOUS_STANDARD_EXAMPLES
+
+ALL_SYLLABLES = [chr(0xAC00 + _) for _ in range(SYLLABLES_COUNT)]
+
+
+class Tests(unittest.TestCase):
+
+    def test_romanize(self):
+        self.assertEqual(romanize('사랑'), 'sa-rang')
+        self.assertEqual(romanize('살앙'), 'sarang')
+        self.assertEqual(romanize('한국어'), 'han-gugeo')
+        self.assertEqual(romanize('화'), 'hwa')
+        self.assertEqual(romanize('무슨 영화를?'), 'mu-seun yeonghwa-reur?')
+        self.assertEqual(romanize('hello 뚦'), 'hello ddurm')
+
+    def test_examples(self):
+        for _, (_, hangul_) in UNAMBIGUOUS_STANDARD_EXAMPLES.items():
+            with self.subTest(hangul=hangul_):
+                self.assertEqual(to_hangul(romanize(hangul_)), hangul_)
+
+    def test_all_syllables(self):
+        for syllable in ALL_SYLLABLES:
+            self.assertEqual(to_hangul(romanize(syllable)), syllable, msg=syllable)
+
+    def test_syllable_pairs(self):
+        # all combinations of body and tail of the first syllable and head of the next
+        previous = [chr(0xAC00 + _) for _ in range(len(BODY_ORDER) * 28)]
+        following = [ALL_SYLLABLES[_ * len(BODY_ORDER) * 28] for _ in range(len(HEAD_ORDER))]
+        following += [ALL_SYLLABLES[11 * len(BODY_ORDER) * 28 + _ * 28]
+                      for _ in range(len(BODY_ORDER))]  # head ㅇ with every body
+        texts = [a + b for a, b in itertools.product(previous, following)]
+        self.assertEqual(round_trip_failures(texts), [])
+
+    def test_round_trip_failures(self):
+        self.assertEqual(round_trip_failures(['사랑', '한국어 공부']), [])
+        failures = round_trip_failures(['사-랑'])
+        self.assertEqual(failures, [('사-랑', 'sa-rang', '사랑')])
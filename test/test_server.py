@@ -0,0 +1,145 @@
+"""Tests for the Korean IME server."""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from romanized_korean_ime.korean_ime import IncrementalKoreanIME
+from romanized_korean_ime.server import KoreanIMEServer
+
+from .test_korean_ime import KEYSTROKE_EXAMPLES
+
+_BACKSPACE = '\b'
+
+
+def keystroke_request(char):
+    if char == _BACKSPACE:
+        return {'type': 'backspace'}
+    return {'type': 'key', 'char': char}
+
+
+async def request(reader, writer, *requests):
+    for request_ in requests:
+        writer.write(json.dumps(request_).encode() + b'\n')
+    await writer.drain()
+    return [json.loads(await reader.readline()) for _ in requests]
+
+
+def run_with_server(coroutine_function, **kwargs):
+    """Run the coroutine function with the address of a server on localhost."""
+    async def run():
+        server = KoreanIMEServer(**kwargs)
+        asyncio_server = await server.start_tcp()
+        port = asyncio_server.sockets[0].getsockname()[1]
+        try:
+            result = await coroutine_function(server, '127.0.0.1', port)
+            # let the server notice that the clients disconnected
+            while server.sessions:
+                await asyncio.sleep(0.01)
+            return result
+        finally:
+            asyncio_server.close()
+            await asyncio_server.wait_closed()
+    return asyncio.run(run())
+
+
+class Tests(unittest.TestCase):
+
+    def test_keystrokes(self):
+        async def type_examples(server, host, port):
+            for keystrokes in KEYSTROKE_EXAMPLES:
+                reader, writer = await asyncio.open_connection(host, port)
+                responses = await request(
+                    reader, writer, *[keystroke_request(_) for _ in keystrokes],
+                    {'type': 'state'})
+                writer.close()
+                ime = IncrementalKoreanIME()
+                for char, response in zip(keystrokes, responses):
+                    if char == _BACKSPACE:
+                        self.assertEqual(response, {'delta': ime.type_backspace()})
+                    else:
+                        self.assertEqual(response, {'delta': ime.type_printable_character(char)})
+                self.assertEqual(responses[-1], {
+                    'text': ime.text, 'jamo': ime.jamo, 'hangul': ime.hangul,
+                    'output': ime.output})
+        run_with_server(type_examples)
+
+    def test_errors(self):
+        async def send_invalid(server, host, port):
+            reader, writer = await asyncio.open_connection(host, port)
+            responses = await request(
+                reader, writer, {'type': 'key', 'char': 'sa'}, {'type': 'typo', 'id': 7},
+                {'type': 'key', 'char': 's', 'id': 'a'}, [])
+            writer.write(b'{not json\n')
+            responses.append(json.loads(await reader.readline()))
+            writer.close()
+            return responses
+        responses = run_with_server(send_invalid)
+        self.assertIn('error', responses[0])
+        self.assertEqual(responses[1], {'id': 7, 'error': "unknown request type 'typo'"})
+        self.assertEqual(responses[2], {'id': 'a', 'delta': 'ㅅ'})
+        self.assertIn('error', responses[3])
+        self.assertIn('error', responses[4])
+
+    def test_too_long_request(self):
+        async def send_long(server, host, port):
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b'{"type": "key", "char": "' + b'a' * 100 + b'"}\n')
+            response = json.loads(await reader.readline())
+            self.assertEqual(await reader.read(), b'')
+            writer.close()
+            return response
+        self.assertEqual(run_with_server(send_long, line_limit=64), {'error': 'request too long'})
+
+    def test_idle_eviction(self):
+        async def stay_idle(server, host, port):
+            reader, writer = await asyncio.open_connection(host, port)
+            await request(reader, writer, {'type': 'key', 'char': 'a'})
+            self.assertEqual(len(server.sessions), 1)
+            self.assertEqual(await asyncio.wait_for(reader.read(), 5), b'')
+            writer.close()
+            self.assertEqual(server.sessions, {})
+            self.assertEqual(server.evicted_count, 1)
+        run_with_server(stay_idle, idle_timeout=0.1)
+
+    def test_concurrent_sessions(self):
+        sessions_count = 200
+
+        async def type_in_parallel(server, host, port):
+            connections = [await asyncio.open_connection(host, port)
+                           for _ in range(sessions_count)]
+            for reader, writer in connections:
+                await request(reader, writer, {'type': 'key', 'char': 'h'})
+            self.assertEqual(len(server.sessions), sessions_count)
+            responses = await asyncio.gather(*[
+                request(reader, writer, *[keystroke_request(_) for _ in 'an-gug'],
+                        {'type': 'state'})
+                for reader, writer in connections])
+            for _, writer in connections:
+                writer.close()
+            return responses
+        responses = run_with_server(type_in_parallel)
+        self.assertEqual(len(responses), sessions_count)
+        for session_responses in responses:
+            self.assertEqual(session_responses[-1]['output'], '한국')
+
+    @unittest.skipUnless(hasattr(asyncio, 'start_unix_server'), 'requires Unix sockets')
+    def test_unix_socket(self):
+        async def type_over_unix_socket(path):
+            server = KoreanIMEServer()
+            asyncio_server = await server.start_unix(path)
+            try:
+                reader, writer = await asyncio.open_unix_connection(path)
+                responses = await request(
+                    reader, writer, *[keystroke_request(_) for _ in 'sa-rang'],
+                    {'type': 'state'})
+                writer.close()
+                return responses
+            finally:
+                asyncio_server.close()
+                await asyncio_server.wait_closed()
+        with tempfile.TemporaryDirectory() as directory:
+            responses = asyncio.run(type_over_unix_socket(os.path.join(directory, 'ime.sock')))
+        self.assertEqual(responses[-1]['output'], '사랑')
@@ -0,0 +1,71 @@
+"""Tests for vectorized conversion of jamo into hangul."""
+
+import itertools
+import logging
+import sys
+import unittest
+import unittest.mock
+
+from romanized_korean_ime.deromanize_hangul import \
+    HEAD_JAMO, BODY_JAMO, TAIL_JAMO, jamo_to_hangul, to_jamo_groups, to_hangul_groups, to_hangul
+
+from .test_deromanize_hangul import UNAMBIGUOUS_STANDARD_EXAMPLES, BAD_JAMO
+
+try:
+    from romanized_korean_ime.vectorized import jamo_groups_to_hangul
+except ImportError:
+    jamo_groups_to_hangul = None
+
+
+def convert_or_error(function, jamo_, **kwargs):
+    try:
+        return function(jamo_, **kwargs)
+    except AssertionError:
+        return AssertionError
+
+
+@unittest.skipIf(jamo_groups_to_hangul is None, 'NumPy is not installed')
+class Tests(unittest.TestCase):
+
+    def test_jamo_groups_to_hangul(self):
+        jamo_groups = [jamo_ for _, (jamo_, _) in UNAMBIGUOUS_STANDARD_EXAMPLES.items()]
+        self.assertEqual(jamo_groups_to_hangul(jamo_groups),
+                         [hangul_ for _, (_, hangul_) in UNAMBIGUOUS_STANDARD_EXAMPLES.items()])
+        self.assertEqual(jamo_groups_to_hangul([]), [])
+        self.assertEqual(jamo_groups_to_hangul(['', 'ㅅㅏ', '', 'ㅅㅏ']), ['', '사', '', '사'])
+        for jamo_, _ in BAD_JAMO:
+            with self.assertRaises(AssertionError):
+                jamo_groups_to_hangul(['ㅅㅏ', jamo_])
+
+    def test_same_as_python(self):
+        jamo_groups = [''.join(_) for _ in itertools.product('ㅅㅗㅏㄹㄱ-ᅪ', repeat=5)]
+        for kwargs in ({}, {'aggressive': False}, {'limit': 1}):
+            with self.subTest(**kwargs):
+                for jamo_ in jamo_groups:
+                    self.assertEqual(
+                        convert_or_error(lambda _, **k: jamo_groups_to_hangul([_], **k)[0],
+                                         jamo_, **kwargs),
+                        convert_or_error(jamo_to_hangul, jamo_, **kwargs), msg=jamo_)
+
+    def test_all_syllables(self):
+        jamo_groups = [head + body + tail for head, body, tail
+                       in itertools.product(HEAD_JAMO, BODY_JAMO, TAIL_JAMO | {''})]
+        self.assertEqual(jamo_groups_to_hangul(jamo_groups),
+                         [jamo_to_hangul(_) for _ in jamo_groups])
+
+    def test_to_hangul_groups(self):
+        for text_, (_, hangul_) in UNAMBIGUOUS_STANDARD_EXAMPLES.items():
+            with self.subTest(text=text_):
+                jamo_groups = to_jamo_groups(text_)
+                self.assertEqual(to_hangul_groups(jamo_groups, backend='numpy'),
+                                 to_hangul_groups(jamo_groups))
+        with self.assertRaises(ValueError):
+            to_hangul_groups(to_jamo_groups('sa'), backend='fortran')
+
+    def test_fallback(self):
+        with unittest.mock.patch.dict(sys.modules, {
+                'numpy': None, 'romanized_korean_ime.vectorized': None}):
+            logger = 'romanized_korean_ime.deromanize_hangul'
+            with self.assertLogs(logger, level=logging.DEBUG) as logs:
+                self.assertEqual(to_hangul('sa-rang', backend='numpy'), '사랑')
+        self.assertTrue(any('NumPy is not available' in _ for _ in logs.output))